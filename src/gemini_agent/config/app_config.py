@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import os
@@ -109,6 +110,19 @@ class ModelRegistry:
         """Retrieves attributes for a specific model, falling back to default."""
         return cls.MODEL_ATTRIBUTES.get(model_id, cls.MODEL_ATTRIBUTES["default"])
 
+    @classmethod
+    @functools.cache
+    def token_prices(cls, model_id: str) -> tuple[float, float]:
+        """Returns the USD cost of one (input, output) token for a model, zero if unpriced."""
+        per_million_in, per_million_out = cls.MODEL_PRICING.get(model_id, (0.0, 0.0))
+        return per_million_in / 1_000_000, per_million_out / 1_000_000
+
+    @classmethod
+    def estimate_cost(cls, model_id: str, input_tokens: int, output_tokens: int) -> float:
+        """Estimates the USD cost of a model's token usage."""
+        per_in, per_out = cls.token_prices(model_id)
+        return input_tokens * per_in + output_tokens * per_out
+
 
 class AppConfig:
     """
@@ -148,6 +162,7 @@ class AppConfig:
         "max_turns": 20,
         "thinking_enabled": False,
         "thinking_budget": 4096,
+        "history_window": 40,  # Most recent messages sent as context (0 = unlimited)
         "conductor_path": str(BASE_DIR / "conductor"),
         "recent_items": [],  # List of recently opened files/folders
     }
@@ -242,6 +257,14 @@ class AppConfig:
     def theme(self, value: str):
         self.set("theme", value)
 
+    @property
+    def history_window(self) -> int:
+        return self.get("history_window", 40)
+
+    @history_window.setter
+    def history_window(self, value: int):
+        self.set("history_window", value)
+
     @property
     def conductor_path(self) -> str:
         path = self.get("conductor_path")
@@ -15,7 +15,13 @@ class AttachmentManager:
     def __init__(self) -> None:
         """Initializes the AttachmentManager and creates a temporary directory."""
         self.temp_dir: Path = Path(tempfile.mkdtemp(prefix="gemini_attachments_"))
-        self.attachments: list[str] = []
+        # Insertion-ordered dict used as an ordered set: O(1) membership and removal
+        self._attachments: dict[str, None] = {}
+
+    @property
+    def attachments(self) -> list[str]:
+        """Read-only snapshot of the attachment paths, in insertion order."""
+        return list(self._attachments)
 
     def add_attachment(self, file_path: str) -> list[str]:
         """
@@ -30,19 +36,46 @@ class AttachmentManager:
         Returns:
             List[str]: A list of all processed file paths.
         """
-        path = Path(file_path)
-        processed_files: list[str] = []
+        return self.add_attachments([file_path])
 
-        if path.is_dir():
-            processed_files.extend(self._process_directory(path))
-        elif zipfile.is_zipfile(path) or tarfile.is_tarfile(path):
-            processed_files.extend(self._extract_archive(path))
-        else:
-            processed_files.append(str(path))
+    def add_attachments(self, file_paths: list[str]) -> list[str]:
+        """
+        Adds several files or folders to attachments in one pass.
+
+        Args:
+            file_paths: The paths to the files, folders, or archives.
 
-        self.attachments.extend(processed_files)
+        Returns:
+            List[str]: A list of all processed file paths.
+        """
+        processed_files: list[str] = []
+        for file_path in file_paths:
+            path = Path(file_path)
+            if path.is_dir():
+                processed_files.extend(self._process_directory(path))
+            elif zipfile.is_zipfile(path) or tarfile.is_tarfile(path):
+                processed_files.extend(self._extract_archive(path))
+            else:
+                processed_files.append(str(path))
+
+        self._attachments.update(dict.fromkeys(processed_files))
         return processed_files
 
+    def remove_attachment(self, file_path: str) -> bool:
+        """
+        Removes a single attachment.
+
+        Args:
+            file_path: The attachment path to remove.
+
+        Returns:
+            bool: True if the path was attached, False otherwise.
+        """
+        if file_path not in self._attachments:
+            return False
+        del self._attachments[file_path]
+        return True
+
     def _process_directory(self, dir_path: Path) -> list[str]:
         """
         Recursively finds all files in a directory.
@@ -89,7 +122,7 @@ class AttachmentManager:
 
     def clear_attachments(self) -> None:
         """Clears the list of attachments."""
-        self.attachments = []
+        self._attachments.clear()
 
     def cleanup(self) -> None:
         """Removes the temporary directory and all its contents."""
@@ -99,6 +132,10 @@ class AttachmentManager:
             except OSError as e:
                 logging.error(f"Failed to cleanup temp dir {self.temp_dir}: {e}")
 
+    def has_attachments(self) -> bool:
+        """Returns True if anything is attached, without copying the list."""
+        return bool(self._attachments)
+
     def get_attachments(self) -> list[str]:
         """
         Returns the current list of attachments.
@@ -106,4 +143,4 @@ class AttachmentManager:
         Returns:
             List[str]: The current list of attachment paths.
         """
-        return self.attachments
+        return list(self._attachments)
@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -30,21 +31,53 @@ class ConductorManager:
         self.commands_path: Path = self.extension_path / "commands" / "conductor"
         self.templates_path: Path = self.extension_path / "templates"
         self.commands: dict[str, dict[str, Any]] = {}
+        self._command_names: list[str] = []
+        # Directory mtime at the last load; adding, removing or renaming a TOML bumps it
+        self._commands_mtime: int | None = None
+        self._commands_stale = False
         self._load_commands()
 
+    def reload_commands(self) -> None:
+        """Re-reads the command definitions from disk and drops cached lookups."""
+        self._load_commands()
+
+    def invalidate_cache(self) -> None:
+        """Forces the next lookup to re-read the command definitions from disk."""
+        self._commands_stale = True
+
+    def _commands_dir_mtime(self) -> int | None:
+        try:
+            return os.stat(self.commands_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _reload_if_stale(self) -> None:
+        """Reloads the commands when the directory changed since they were last read."""
+        if self._commands_stale or self._commands_dir_mtime() != self._commands_mtime:
+            self.reload_commands()
+
     def _load_commands(self) -> None:
-        """Loads all TOML command definitions from the commands directory."""
-        if not self.commands_path.exists():
+        """
+        Loads all TOML command definitions from the commands directory.
+
+        The commands are read into a fresh dict that replaces the old one in a single
+        assignment, so a lookup from another thread never sees a half-filled dict.
+        """
+        self._commands_stale = False
+        self._commands_mtime = self._commands_dir_mtime()
+        commands: dict[str, dict[str, Any]] = {}
+        if self._commands_mtime is None:
             logging.warning(f"Conductor commands path does not exist: {self.commands_path}")
-            return
+        else:
+            for toml_file in self.commands_path.glob("*.toml"):
+                try:
+                    with open(toml_file, "rb") as f:
+                        commands[toml_file.stem] = tomllib.load(f)
+                except (tomllib.TOMLDecodeError, OSError) as e:
+                    logging.error(f"Error loading conductor command {toml_file}: {e}")
 
-        for toml_file in self.commands_path.glob("*.toml"):
-            try:
-                with open(toml_file, "rb") as f:
-                    data = tomllib.load(f)
-                    self.commands[toml_file.stem] = data
-            except (tomllib.TOMLDecodeError, OSError) as e:
-                logging.error(f"Error loading conductor command {toml_file}: {e}")
+        self._command_names = list(commands)
+        self.commands = commands
 
     def get_command_prompt(self, command_name: str) -> str | None:
         """
@@ -56,6 +89,7 @@ class ConductorManager:
         Returns:
             Optional[str]: The command prompt, or None if not found.
         """
+        self._reload_if_stale()
         command = self.commands.get(command_name)
         if command:
             return command.get("prompt")
@@ -68,7 +102,8 @@ class ConductorManager:
         Returns:
             List[str]: A list of command names.
         """
-        return list(self.commands.keys())
+        self._reload_if_stale()
+        return self._command_names
 
     def is_setup(self, project_path: str = ".") -> bool:
         """
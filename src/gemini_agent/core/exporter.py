@@ -1,19 +1,51 @@
+import contextlib
+import io
 import json
 import logging
+import os
+import tempfile
 import zipfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict
 
 from .models import Session
 
+try:
+    import zstandard
+except ImportError:  # Optional: fast backups are left as a stored ZIP without it
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# zstd-wrapped backups get this appended, since plain unzip tools can't open them
+ZSTD_SUFFIX = ".zst"
+# Corrupt or truncated zstd streams raise ZstdError rather than OSError
+_ZSTD_ERRORS: tuple[type[Exception], ...] = (zstandard.ZstdError,) if zstandard is not None else ()
+
+
+class _TitleCharFilter(dict):
+    """``str.translate`` table keeping alphanumerics, spaces and underscores; filled lazily per code point."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        keep = codepoint if char.isalnum() or char in " _" else None
+        self[codepoint] = keep
+        return keep
+
+
+# Strips a session title down to characters that are safe in file names
+TITLE_TRANS = _TitleCharFilter()
+
 
 class Exporter:
     """
     Handles exporting sessions to Markdown and managing history backups in ZIP format.
     """
 
+    # Estimated history size above which backups skip deflate (see create_backup)
+    FAST_BACKUP_THRESHOLD = 100 * 1024 * 1024
+
     @staticmethod
     def session_to_markdown(session: Session) -> str:
         """
@@ -80,37 +112,67 @@ class Exporter:
             return False
 
     @staticmethod
-    def create_backup(sessions: Dict[str, Session], backup_path: Path) -> bool:
+    def create_backup(sessions: Dict[str, Session], backup_path: Path, fast: bool | None = None) -> Path | None:
         """
         Creates a ZIP backup of all sessions, including raw JSON and individual Markdown files.
 
         Args:
             sessions: Dictionary of all session data.
             backup_path: The destination Path for the ZIP backup.
+            fast: Store entries uncompressed and, if ``zstandard`` is installed, compress the
+                whole archive with zstd afterwards and write it to ``backup_path`` plus
+                ``ZSTD_SUFFIX``. Defaults to on for histories larger than
+                ``FAST_BACKUP_THRESHOLD`` or when ``CONDUCTOR_BACKUP_FAST=1`` is set.
 
         Returns:
-            bool: True if backup was successful, False otherwise.
+            Path | None: The file written, or None if the backup failed.
         """
+        if fast is None:
+            estimated_size = sum(len(m.text) for session in sessions.values() for m in session.messages)
+            fast = os.environ.get("CONDUCTOR_BACKUP_FAST") == "1" or estimated_size > Exporter.FAST_BACKUP_THRESHOLD
+
         try:
-            with zipfile.ZipFile(backup_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                # Save the raw JSON
-                data = {sid: s.model_dump() for sid, s in sessions.items()}
-                zipf.writestr("history.json", json.dumps(data, indent=4, ensure_ascii=False))
-
-                # Save individual markdown files for convenience
-                for session_id, session in sessions.items():
-                    # Sanitize title for filename
-                    safe_title = "".join(
-                        [c for c in session.title if c.isalnum() or c in (" ", "_")]
-                    ).rstrip()
-                    safe_title = safe_title.replace(" ", "_")
-                    filename = f"sessions/{safe_title}_{session_id[:8]}.md"
-                    md_content = Exporter.session_to_markdown(session)
-                    zipf.writestr(filename, md_content)
-            return True
-        except (zipfile.BadZipFile, OSError) as e:
+            if fast and zstandard is not None:
+                stored_path = backup_path.with_name(backup_path.name + ".part")
+                zstd_path = backup_path.with_name(backup_path.name + ZSTD_SUFFIX)
+                try:
+                    Exporter._write_archive(sessions, stored_path, zipfile.ZIP_STORED)
+                    with stored_path.open("rb") as src, zstd_path.open("wb") as dst:
+                        zstandard.ZstdCompressor().copy_stream(src, dst)
+                finally:
+                    stored_path.unlink(missing_ok=True)
+                return zstd_path
+            Exporter._write_archive(sessions, backup_path, zipfile.ZIP_STORED if fast else zipfile.ZIP_DEFLATED)
+            return backup_path
+        except (zipfile.BadZipFile, OSError, *_ZSTD_ERRORS) as e:
             logger.error(f"Error creating backup: {e}")
-            return False
+            return None
+
+    @staticmethod
+    def _write_archive(sessions: dict[str, Session], path: Path, compression: int) -> None:
+        """Writes history.json and one Markdown file per session into a ZIP at ``path``."""
+        # Fast compression level: backups are dominated by text, where level 1 is close in size
+        with zipfile.ZipFile(path, "w", compression, compresslevel=1) as zipf:
+            # Stream the raw JSON one session at a time instead of building the whole document
+            with zipf.open("history.json", "w", force_zip64=True) as raw, io.TextIOWrapper(
+                raw, encoding="utf-8"
+            ) as fp:
+                fp.write("{")
+                for index, (session_id, session) in enumerate(sessions.items()):
+                    if index:
+                        fp.write(",")
+                    fp.write(f"\n    {json.dumps(session_id)}: ")
+                    json.dump(session.model_dump(), fp, ensure_ascii=False)
+                fp.write("\n}")
+
+            # Save individual markdown files for convenience
+            for session_id, session in sessions.items():
+                # Sanitize title for filename
+                safe_title = session.title.translate(TITLE_TRANS).rstrip()
+                safe_title = safe_title.replace(" ", "_")
+                filename = f"sessions/{safe_title}_{session_id[:8]}.md"
+                with zipf.open(filename, "w") as fp:
+                    fp.write(Exporter.session_to_markdown(session).encode("utf-8"))
 
     @staticmethod
     def restore_backup(backup_path: Path) -> Dict[str, Session]:
@@ -124,11 +186,26 @@ class Exporter:
             Dict[str, Session]: The restored session data, or an empty dict if it failed.
         """
         try:
-            with zipfile.ZipFile(backup_path, "r") as zipf:
-                if "history.json" in zipf.namelist():
-                    with zipf.open("history.json") as f:
-                        data = json.load(f)
-                        return {sid: Session(**sdata) for sid, sdata in data.items()}
-        except (zipfile.BadZipFile, json.JSONDecodeError, OSError) as e:
+            with contextlib.ExitStack() as stack:
+                archive: Path | IO[bytes] = backup_path
+                with backup_path.open("rb") as f:
+                    is_zstd = f.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+                if is_zstd:
+                    if zstandard is None:
+                        logger.error("Backup is zstd-compressed but the zstandard package is not installed")
+                        return {}
+                    # ZipFile needs a seekable file, so unpack the outer zstd layer first
+                    archive = stack.enter_context(tempfile.TemporaryFile())
+                    with backup_path.open("rb") as src:
+                        zstandard.ZstdDecompressor().copy_stream(src, archive)
+                    archive.seek(0)
+
+                with zipfile.ZipFile(archive, "r") as zipf:
+                    if "history.json" in zipf.namelist():
+                        # Decode while decompressing rather than materializing the raw bytes first
+                        with zipf.open("history.json") as raw, io.TextIOWrapper(raw, encoding="utf-8") as f:
+                            data = json.load(f)
+                        return {sid: Session(**data.pop(sid)) for sid in list(data)}
+        except (zipfile.BadZipFile, json.JSONDecodeError, OSError, *_ZSTD_ERRORS) as e:
             logger.error(f"Error restoring backup: {e}")
         return {}
@@ -5,6 +5,7 @@ import logging
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -35,18 +36,35 @@ class ExtensionManager:
 
     def discover_plugins(self):
         """Discover and load plugins from the plugins directory."""
-        self.plugins = {}
+        filepaths = []
         for item in self.plugins_dir.iterdir():
             if item.is_file() and item.suffix == ".py" and not item.name.startswith("__"):
-                self.load_plugin(str(item))
+                filepaths.append(str(item))
             elif item.is_dir() and not item.name.startswith("__"):
                 # Check for __init__.py in directory
                 init_file = item / "__init__.py"
                 if init_file.exists():
-                    self.load_plugin(str(init_file))
+                    filepaths.append(str(init_file))
+
+        if len(filepaths) <= 1:
+            loaded = [self._instantiate_plugins(filepath) for filepath in filepaths]
+        else:
+            # Overlap the file reads and module execution; results are registered in discovery order
+            with ThreadPoolExecutor(max_workers=min(8, len(filepaths), os.cpu_count() or 1)) as executor:
+                loaded = list(executor.map(self._instantiate_plugins, filepaths))
+        # Swap the registry in whole, so readers on other threads never see a half-loaded set
+        discovered: dict[str, Plugin] = {}
+        for plugins in loaded:
+            self._register_plugins(plugins, discovered)
+        self.plugins = discovered
 
     def load_plugin(self, filepath: str):
         """Load a plugin from a file."""
+        self._register_plugins(self._instantiate_plugins(filepath))
+
+    def _instantiate_plugins(self, filepath: str) -> list[Plugin]:
+        """Executes a plugin module and returns its configured Plugin instances without registering them."""
+        instances = []
         try:
             module_name = Path(filepath).stem
             if module_name == "__init__":
@@ -63,10 +81,16 @@ class ExtensionManager:
                         plugin_instance.filepath = filepath
                         config_path = self.config_dir / f"{plugin_instance.name}.json"
                         plugin_instance.load_config(str(config_path))
-                        self.plugins[plugin_instance.name] = plugin_instance
-                        self.logger.info(f"Loaded plugin: {plugin_instance.name}")
+                        instances.append(plugin_instance)
         except Exception as e:
             self.logger.error(f"Failed to load plugin from {filepath}: {e}")
+        return instances
+
+    def _register_plugins(self, plugins: list[Plugin], registry: dict[str, Plugin] | None = None) -> None:
+        registry = self.plugins if registry is None else registry
+        for plugin_instance in plugins:
+            registry[plugin_instance.name] = plugin_instance
+            self.logger.info(f"Loaded plugin: {plugin_instance.name}")
 
     def install_plugin(self, package_name: str) -> str:
         """Install a plugin from PyPI."""
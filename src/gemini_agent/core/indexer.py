@@ -1,15 +1,25 @@
 import ast
 import functools
 import logging
+import multiprocessing
 import os
 import sqlite3
+import threading
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Indexing runs from a background thread of the Qt app, where forking is unsafe, so worker
+# processes are spawned. Scoped to this pool rather than set process-wide via set_start_method.
+SPAWN_CTX = multiprocessing.get_context("spawn")
+
+# Minimum number of freshly parsed symbols handed to an on_batch callback at a time
+INDEX_BATCH_SIZE = 500
+
 
 @dataclass
 class Symbol:
@@ -199,8 +209,23 @@ class Indexer:
                 trigram = name[i : i + 3]
                 self.trigram_index[trigram].add(idx)
 
-    def index_project(self) -> None:
-        """Recursively scans the project directory for Python files and indexes symbols in parallel."""
+    def index_project(
+        self,
+        cancel_event: threading.Event | None = None,
+        on_batch: Callable[[list[Symbol]], None] | None = None,
+    ) -> None:
+        """
+        Recursively scans the project directory for Python files and indexes symbols in parallel.
+
+        Args:
+            cancel_event: Optional event; once set, the scan stops before touching the cache or symbols.
+            on_batch: Optional callback receiving symbols of new/changed files as they are parsed,
+                      called from the indexing thread. A file's symbols never span two batches.
+        """
+
+        def cancelled() -> bool:
+            return cancel_event is not None and cancel_event.is_set()
+
         cache_path = self._get_cache_path()
         conn = sqlite3.connect(cache_path)
         self._init_db(conn)
@@ -214,6 +239,9 @@ class Indexer:
         current_files = set()
 
         for root, dirs, files in os.walk(self.root_dir):
+            if cancelled():
+                conn.close()
+                return
             dirs[:] = [
                 d for d in dirs if not d.startswith(".") and d not in ("env", "venv", "__pycache__", "node_modules")
             ]
@@ -232,8 +260,26 @@ class Indexer:
         if files_to_index:
             logger.info(f"Indexing {len(files_to_index)} files in parallel...")
             worker_func = functools.partial(_index_file_worker, root_dir=self.root_dir)
-            with ProcessPoolExecutor() as executor:
-                results = list(executor.map(worker_func, files_to_index))
+            with ProcessPoolExecutor(mp_context=SPAWN_CTX) as executor:
+                futures = [executor.submit(worker_func, path) for path in files_to_index]
+                results = []
+                batch: list[Symbol] = []
+                for future in as_completed(futures):
+                    if cancelled():
+                        # Drop queued files; only the ones already running are waited for
+                        executor.shutdown(cancel_futures=True)
+                        conn.close()
+                        return
+                    res = future.result()
+                    results.append(res)
+                    if on_batch and res:
+                        # Same shape as the symbols reloaded from the cache below
+                        batch.extend(Symbol(**{**s_dict, "file_path": res["path"]}) for s_dict in res["symbols"])
+                        if len(batch) >= INDEX_BATCH_SIZE:
+                            on_batch(batch)
+                            batch = []
+                if on_batch and batch:
+                    on_batch(batch)
 
             for res in results:
                 if res:
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Any, Optional, Dict, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Message(BaseModel):
@@ -29,5 +29,20 @@ class Session(BaseModel):
     config: Dict[str, Any] = Field(default_factory=dict)
     usage: Usage = Field(default_factory=Usage)
 
+    # Append-only cache of message dicts, so history isn't re-dumped every turn
+    _history_dicts: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+
     def model_dump(self, **kwargs) -> Dict[str, Any]:
         return super().model_dump(**kwargs)
+
+    def history_dicts(self) -> list[dict[str, Any]]:
+        """Returns the messages as dicts, dumping only those added since the last call."""
+        cached = self._history_dicts
+        if len(cached) > len(self.messages):
+            cached.clear()
+        cached.extend(m.model_dump() for m in self.messages[len(cached):])
+        return cached
+
+    def reset_history_cache(self) -> None:
+        """Drops the cached message dicts after the message list is replaced."""
+        self._history_dicts = []
@@ -44,25 +44,33 @@ class RecentManager:
             path: The absolute path to the file or project.
             item_type: Either 'file' or 'project'.
         """
-        path = os.path.abspath(path)
-        name = os.path.basename(path)
-        
+        self.add_items([path], item_type)
+
+    def add_items(self, paths: list[str], item_type: str = "file") -> None:
+        """
+        Adds several items at once, writing the recent list to disk a single time.
+
+        Args:
+            paths: Paths to add; later ones end up nearer the top.
+            item_type: Either 'file' or 'project'.
+        """
+        timestamp = datetime.now().isoformat()
+        new_items = {}
+        for path in paths:
+            path = os.path.abspath(path)
+            # Re-adding moves the path to the front of the dict, i.e. the top of the list
+            new_items.pop(path, None)
+            new_items[path] = {
+                "path": path,
+                "name": os.path.basename(path),
+                "timestamp": timestamp,
+                "type": item_type
+            }
+
         # Remove if already exists to move it to the top
-        self.recent_items = [item for item in self.recent_items if item["path"] != path]
-        
-        new_item = {
-            "path": path,
-            "name": name,
-            "timestamp": datetime.now().isoformat(),
-            "type": item_type
-        }
-        
-        self.recent_items.insert(0, new_item)
-        
-        # Limit the number of items
-        if len(self.recent_items) > self.max_items:
-            self.recent_items = self.recent_items[:self.max_items]
-            
+        kept = [item for item in self.recent_items if item["path"] not in new_items]
+        self.recent_items = (list(reversed(new_items.values())) + kept)[:self.max_items]
+
         self.save()
 
     def get_recent_items(self) -> list[dict[str, Any]]:
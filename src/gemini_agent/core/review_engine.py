@@ -34,21 +34,50 @@ class ReviewEngine:
         "syscall": "Dangerous System Call",
     }
 
-    @staticmethod
-    def generate_diff_html(old_content: str, new_content: str, theme_mode: str = "Dark") -> str:
+    # Longer lines (minified bundles, data URIs) are cropped before diffing
+    MAX_DIFF_LINE_CHARS = 2000
+
+    @classmethod
+    def _diff_lines(cls, old_content: str, new_content: str) -> list[str]:
+        limit = cls.MAX_DIFF_LINE_CHARS
+
+        def crop(content: str) -> list[str]:
+            return [line if len(line) <= limit else line[:limit] + "… (truncated)" for line in content.splitlines()]
+
+        return list(
+            difflib.unified_diff(
+                crop(old_content or ""), crop(new_content or ""), fromfile="Current", tofile="Proposed", lineterm=""
+            )
+        )
+
+    @classmethod
+    def generate_diff_html(cls, old_content: str, new_content: str, theme_mode: str = "Dark") -> str:
         """
         Generates a side-by-side or unified diff in HTML format using StringIO for efficiency.
         """
-        if not old_content:
-            old_content = ""
-        if not new_content:
-            new_content = ""
+        return cls._render_diff_html(cls._diff_lines(old_content, new_content), theme_mode)
 
-        old_lines = old_content.splitlines()
-        new_lines = new_content.splitlines()
-
-        diff = difflib.unified_diff(old_lines, new_lines, fromfile="Current", tofile="Proposed", lineterm="")
+    @classmethod
+    def generate_diff_html_truncated(
+        cls, old_content: str, new_content: str, theme_mode: str = "Dark", max_lines: int = 400
+    ) -> str:
+        """
+        Like ``generate_diff_html`` but keeps only the first and last ``max_lines // 2`` diff lines,
+        with a marker row for what was left out, so large diffs stay cheap to lay out.
+        """
+        lines = cls._diff_lines(old_content, new_content)
+        if len(lines) <= max_lines:
+            return cls._render_diff_html(lines, theme_mode)
+        head = max_lines // 2
+        tail = max_lines - head
+        # Only added/removed lines count as changes; context lines in the gap don't
+        omitted = sum(1 for line in lines[head:-tail] if line[:1] in "+-" and not line.startswith(("+++", "---")))
+        return cls._render_diff_html(lines[:head] + lines[-tail:], theme_mode, truncated_at=(head, omitted))
 
+    @staticmethod
+    def _render_diff_html(
+        diff: list[str], theme_mode: str = "Dark", truncated_at: tuple[int, int] | None = None
+    ) -> str:
         # Theme-aware colors
         if theme_mode == "Dark":
             add_bg, add_fg = "#1e3a1e", "#afffbe"
@@ -65,7 +94,12 @@ class ReviewEngine:
         output = io.StringIO()
         output.write(f"<pre style='font-family: monospace; white-space: pre; color: {default_fg};'>\n")
 
-        for line in diff:
+        for index, line in enumerate(diff):
+            if truncated_at and index == truncated_at[0]:
+                output.write(
+                    f"<div style='color: {info_fg}; font-style: italic;'>"
+                    f"... {truncated_at[1]:,} more changes truncated ...</div>\n"
+                )
             escaped_line = html.escape(line)
             if line.startswith("+"):
                 output.write(f"<div style='color: {add_fg}; background-color: {add_bg};'>{escaped_line}</div>\n")
@@ -19,13 +19,31 @@ class SessionManager:
     def __init__(self, history_file: Path):
         self.history_file = history_file
         self._lock = threading.RLock()
+        # Serializes snapshot + write so an older snapshot never lands after a newer one
+        self._save_lock = threading.Lock()
         self.sessions: Dict[str, Session] = self._load_history()
-        self.current_session_id: Optional[str] = None
+        self._current_session_id: str | None = None
+        self._current_session: Session | None = None
 
         self._save_timer: Optional[threading.Timer] = None
         self._last_save_time = 0.0
         self._save_interval = 2.0  # Minimum seconds between saves
 
+    @property
+    def current_session_id(self) -> str | None:
+        return self._current_session_id
+
+    @current_session_id.setter
+    def current_session_id(self, session_id: str | None) -> None:
+        # Resolve the session once here so per-token callers don't repeat the lookup
+        self._current_session_id = session_id
+        self._current_session = self.sessions.get(session_id) if session_id else None
+
+    @property
+    def current_session(self) -> Session | None:
+        """The session selected by ``current_session_id``, if it exists."""
+        return self._current_session
+
     def _load_history(self) -> Dict[str, Session]:
         """Loads chat history from JSON file and validates with Pydantic."""
         if not self.history_file.exists():
@@ -58,22 +76,36 @@ class SessionManager:
                 self._save_timer.daemon = True
                 self._save_timer.start()
 
+    def flush(self) -> None:
+        """Cancels any throttled save and writes the history now, e.g. before shutdown."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+        # Waits on _save_lock for any in-flight background write before writing the latest state
+        self._perform_save()
+
     def _perform_save_async(self) -> None:
         with self._lock:
             self._save_timer = None
-            self._perform_save()
+        self._perform_save()
 
     def _perform_save(self) -> None:
-        """Performs the actual save operation."""
+        """Performs the actual save operation.
+
+        Only the model snapshot is taken under ``_lock``; encoding and the file
+        write happen outside it so UI-thread mutations are never stalled by disk I/O.
+        """
         try:
-            with self._lock:
-                # Convert models to dict for serialization
-                data = {sid: session.model_dump() for sid, session in self.sessions.items()}
-                data_str = json.dumps(data, indent=4, ensure_ascii=False)
-                self._last_save_time = time.time()
+            with self._save_lock:
+                with self._lock:
+                    # Convert models to dict for serialization
+                    data = {sid: session.model_dump() for sid, session in self.sessions.items()}
+                    self._last_save_time = time.time()
 
-            with self.history_file.open("w", encoding="utf-8") as f:
-                f.write(data_str)
+                data_str = json.dumps(data, indent=4, ensure_ascii=False)
+                with self.history_file.open("w", encoding="utf-8") as f:
+                    f.write(data_str)
         except Exception as e:
             logging.error(f"Failed to save history: {e}")
 
@@ -96,14 +128,47 @@ class SessionManager:
                 del self.sessions[session_id]
                 if self.current_session_id == session_id:
                     self.current_session_id = None
-                self.save_history(sync=sync)
-                return True
-        return False
+                deleted = True
+            else:
+                deleted = False
+        # Saved outside ``_lock``: a sync save must not wait on _save_lock while holding it
+        if deleted:
+            self.save_history(sync=sync)
+        return deleted
+
+    def replace_sessions(self, sessions: dict[str, Session]) -> None:
+        """
+        Swaps in a whole new set of sessions (e.g. a restored backup) and clears the
+        current selection, so no cached session from the old history is left behind.
+        The caller persists the new history with ``save_history``.
+        """
+        with self._lock:
+            self.sessions = sessions
+            self.current_session_id = None
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """Returns session data."""
         return self.sessions.get(session_id)
 
+    def get_messages(
+        self, session_id: str, tail: int | None = None, before: int | None = None
+    ) -> list[Message]:
+        """
+        Returns a window of a session's messages.
+
+        Args:
+            session_id: The session to read from.
+            tail: Maximum number of messages to return, counted back from ``before``.
+            before: Exclusive end index; defaults to the end of the history.
+        """
+        session = self.sessions.get(session_id)
+        if not session:
+            return []
+        total = len(session.messages)
+        end = total if before is None else max(0, min(before, total))
+        start = 0 if tail is None else max(0, end - tail)
+        return session.messages[start:end]
+
     def get_all_sessions(self) -> Dict[str, Session]:
         """Returns all sessions."""
         return self.sessions
@@ -123,6 +188,8 @@ class SessionManager:
 
         message = Message(role=role, text=text, images=images)
         with self._lock:
+            if len(session._history_dicts) == len(session.messages):
+                session._history_dicts.append(message.model_dump())
             session.messages.append(message)
         self.save_history(sync=sync)
 
@@ -171,6 +238,7 @@ class SessionManager:
             if session:
                 with self._lock:
                     session.messages = []
+                    session.reset_history_cache()
                     session.plan = ""
                     session.specs = ""
                 self.save_history(sync=sync)
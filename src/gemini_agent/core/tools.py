@@ -12,7 +12,7 @@ import tempfile
 import time
 import tokenize
 from collections.abc import Callable
-from functools import wraps
+from functools import cache, wraps
 from pathlib import Path
 from typing import Any
 
@@ -33,17 +33,31 @@ logger = logging.getLogger(__name__)
 TOOL_REGISTRY: dict[str, Callable] = {}
 
 
+@cache
+def _mcp_registrar() -> Callable | None:
+    """
+    Imports the FastMCP registration hook once. A failed import isn't cached by Python,
+    so retrying it for every decorated tool would repeat the module search each time.
+    """
+    try:
+        from gemini_agent.mcp.server import register_mcp_tool
+    except ImportError:
+        return None
+    except Exception as e:
+        # A broken MCP install must not take the tool module (and the app) down with it
+        logger.warning(f"MCP tool registration disabled: {e}")
+        return None
+    return register_mcp_tool
+
+
 def tool(func: Callable) -> Callable:
     """Decorator to register a function as a tool."""
     TOOL_REGISTRY[func.__name__] = func
 
     # MCP Integration: Register tool with FastMCP if available
-    try:
-        from gemini_agent.mcp.server import register_mcp_tool
-
+    register_mcp_tool = _mcp_registrar()
+    if register_mcp_tool is not None:
         register_mcp_tool(func)
-    except (ImportError, Exception):
-        pass
 
     return func
 
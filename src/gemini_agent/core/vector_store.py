@@ -1,6 +1,11 @@
+import hashlib
 import logging
 import os
-from typing import Any, List, Optional
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
 
 import chromadb
 from chromadb.config import Settings
@@ -11,8 +16,14 @@ logger = logging.getLogger(__name__)
 class VectorStore:
     """
     Handles persistent vector storage and semantic search using ChromaDB.
+    Writes are queued and committed in batches by a background thread.
     """
 
+    WRITE_BATCH_SIZE = 200
+    WRITE_BATCH_WINDOW = 0.1  # Seconds to wait for more items before committing a batch
+    QUERY_CACHE_SIZE = 512
+    QUERY_CACHE_TTL = 300.0  # Seconds a cached search result stays valid
+
     def __init__(self, persist_directory: str = ".chroma_db"):
         self.persist_directory = persist_directory
         self.client = chromadb.PersistentClient(
@@ -26,32 +37,116 @@ class VectorStore:
             embedding_function=self.embedding_function
         )
 
-    def add_documents(self, documents: List[str], metadatas: List[dict], ids: List[str]):
-        """Adds documents to the vector store."""
+        # LRU of normalized query -> (timestamp, results); cleared whenever the collection changes
+        self._query_cache: OrderedDict[tuple[str, int], tuple[float, dict]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped by clear_query_cache so a query that raced a write can't cache its stale result
+        self._cache_generation = 0
+
+        self._write_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+
+    def add_documents(self, documents: list[str], metadatas: list[dict], ids: list[str]):
+        """Queues documents for the background writer and returns immediately."""
+        self._write_q.put((documents, metadatas, ids))
+
+    def flush(self) -> None:
+        """Blocks until every queued write has been committed."""
+        self._write_q.join()
+
+    def _drain(self) -> None:
+        """Background loop merging queued writes into batched collection.add calls."""
+        while True:
+            batch = [self._write_q.get()]
+            deadline = time.monotonic() + self.WRITE_BATCH_WINDOW
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._write_q.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            try:
+                self._commit(batch)
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+
+    def _commit(self, batch: list[tuple[list[str], list[dict], list[str]]]) -> None:
+        """Adds a batch in one call, falling back to one call per queued write if Chroma rejects it."""
+        documents: list[str] = []
+        metadatas: list[dict] = []
+        ids: list[str] = []
+        for docs, metas, doc_ids in batch:
+            documents.extend(docs)
+            metadatas.extend(metas)
+            ids.extend(doc_ids)
+
         try:
-            self.collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
+            self.collection.add(documents=documents, metadatas=metadatas, ids=ids)
             logger.info(f"Added {len(documents)} documents to ChromaDB.")
         except Exception as e:
-            logger.error(f"Failed to add documents to ChromaDB: {e}")
+            if len(batch) == 1:
+                logger.error(f"Failed to add documents to ChromaDB: {e}")
+                return
+            # One bad document or a duplicate id fails the merged add; keep everyone else's writes
+            logger.warning(f"Batched add failed ({e}); retrying {len(batch)} writes individually")
+            added = 0
+            for docs, metas, doc_ids in batch:
+                try:
+                    self.collection.add(documents=docs, metadatas=metas, ids=doc_ids)
+                    added += len(docs)
+                except Exception as item_error:
+                    logger.error(f"Failed to add documents {doc_ids} to ChromaDB: {item_error}")
+            if not added:
+                return
+            logger.info(f"Added {added} documents to ChromaDB.")
+        self.clear_query_cache()
 
     def query(self, query_text: str, n_results: int = 5) -> dict:
-        """Performs a semantic search."""
+        """Performs a semantic search, reusing recent results for equivalent queries."""
+        normalized = " ".join(query_text.split()).lower()
+        key = (hashlib.sha256(normalized.encode("utf-8")).hexdigest(), n_results)
+        now = time.monotonic()
+
+        with self._cache_lock:
+            cached = self._query_cache.get(key)
+            if cached and now - cached[0] < self.QUERY_CACHE_TTL:
+                self._query_cache.move_to_end(key)
+                return cached[1]
+            generation = self._cache_generation
+
         try:
             results = self.collection.query(
                 query_texts=[query_text],
                 n_results=n_results
             )
-            return results
         except Exception as e:
             logger.error(f"Query failed: {e}")
             return {"documents": [], "metadatas": [], "ids": []}
 
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return results
+            self._query_cache[key] = (now, results)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return results
+
+    def clear_query_cache(self) -> None:
+        """Drops all cached search results."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._query_cache.clear()
+
     def delete_collection(self):
         """Deletes the current collection."""
+        self.flush()
+        self.clear_query_cache()
         self.client.delete_collection("project_knowledge")
         self.collection = self.client.get_or_create_collection(
             name="project_knowledge",
@@ -1,11 +1,14 @@
 import asyncio
+import concurrent.futures
+import contextlib
+import threading
 import uuid
 from dataclasses import dataclass
 from typing import Any
 
 from google import genai
 from google.genai import types
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
 
 from gemini_agent.config.app_config import ModelRegistry
 from gemini_agent.core import tools
@@ -54,6 +57,7 @@ class GeminiWorker(QObject):
     specs_updated = pyqtSignal(str)
     usage_updated = pyqtSignal(str, int, int)
     rate_limit_updated = pyqtSignal(str, int, int)  # model_id, remaining, limit
+    done = pyqtSignal()  # run() has returned, whether it completed, failed or was cancelled
 
     # Shared rate limiters per model to persist across worker instances
     _RATE_LIMITERS: dict[str, RateLimiter] = {}
@@ -68,11 +72,12 @@ class GeminiWorker(QObject):
         self._confirmation_modified_args: dict[str, Any] | None = None
         self._current_confirmation_id: str | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
 
         self.mode_detector = ModeDetector()
         self.tool_executor: ToolExecutor | None = None
         self.context_manager: ContextManager | None = None
-        self._is_cancelled = False
+        self._cancel_event = threading.Event()
 
         # Initialize or retrieve rate limiter for this model
         self.rate_limiter = self._get_rate_limiter(config.model)
@@ -88,8 +93,50 @@ class GeminiWorker(QObject):
             )
         return GeminiWorker._RATE_LIMITERS[model_id]
 
+    @property
+    def _is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
     def cancel(self):
-        self._is_cancelled = True
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        """Runs the worker to completion on the calling (pool) thread in a private event loop."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._task = loop.create_task(self.run_async())
+        try:
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            # stop() cancels run_async before it finishes
+            if not self._is_cancelled:
+                raise
+        finally:
+            # Cancel and drain leftovers (e.g. a pending confirmation) so close() doesn't strand them
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+            self.done.emit()
+
+    def stop(self) -> None:
+        """Cancels the worker and its running task; safe to call from any thread."""
+        self.cancel()
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._abort)
+
+    def _abort(self) -> None:
+        """Runs on the worker loop: denies any pending confirmation and cancels run_async."""
+        # Wakes a tool thread blocked on the confirmation future
+        self._confirmation_result = False
+        self._confirmation_event.set()
+        if self._task is not None:
+            self._task.cancel()
 
     def confirm_tool(self, confirmation_id: str, allowed: bool, modified_args: dict[str, Any] | None = None) -> None:
         """Called by the UI thread to provide confirmation result."""
@@ -109,10 +156,25 @@ class GeminiWorker(QObject):
                 except Exception as e:
                     self.log.error(f"Failed to set confirmation event: {e}")
 
+    def _confirm_from_thread(self, fn_name: str, fn_args: dict[str, Any]) -> tuple[bool, dict[str, Any] | None]:
+        """Blocks a tool thread until the UI answers the confirmation request."""
+        if self._is_cancelled:
+            return False, None
+        coro = self._request_tool_confirmation(fn_name, fn_args)
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+        except (concurrent.futures.CancelledError, RuntimeError):
+            # stop() tore the loop down before the request ran; treat it as a denial
+            coro.close()
+            return False, None
+
     async def _request_tool_confirmation(
         self, fn_name: str, fn_args: dict[str, Any]
     ) -> tuple[bool, dict[str, Any] | None]:
         """Requests user confirmation for dangerous tools (async)."""
+        # stop() may have run before this was scheduled; don't wait for an answer that can't come
+        if self._is_cancelled:
+            return False, None
         confirmation_id = str(uuid.uuid4())
         self._current_confirmation_id = confirmation_id
         self._confirmation_event.clear()
@@ -165,14 +227,10 @@ class GeminiWorker(QObject):
             loop = asyncio.get_running_loop()
             self._loop = loop
 
-            def sync_confirmation_callback(fn_name: str, fn_args: dict[str, Any]) -> tuple[bool, dict[str, Any] | None]:
-                future = asyncio.run_coroutine_threadsafe(self._request_tool_confirmation(fn_name, fn_args), loop)
-                return future.result()
-
             self.tool_executor = ToolExecutor(
                 status_callback=self.status_update.emit,
                 terminal_callback=self.terminal_output.emit,
-                confirmation_callback=sync_confirmation_callback,
+                confirmation_callback=self._confirm_from_thread,
                 extension_manager=self.config.extension_manager,
             )
             self.tool_executor.current_plan = self.config.initial_plan
@@ -262,6 +320,9 @@ class GeminiWorker(QObject):
                     remaining = int(remaining_header)
                     limit = int(limit_header)
                     self.rate_limiter.update_limits(remaining, limit)
+                    # Server reports plenty of headroom: skip local throttling for the next turns
+                    if remaining > 0.1 * limit:
+                        self.rate_limiter.skip_for(2.0)
 
             self.rate_limit_updated.emit(self.config.model, remaining, limit)
         except Exception as e:
@@ -386,27 +447,3 @@ class GeminiWorker(QObject):
     def _is_stuck(self, progress_metrics: list[str]) -> bool:
         return len(progress_metrics) >= 3 and all(p == "no_progress" for p in progress_metrics[-3:])
 
-
-class GeminiWorkerThread(QThread):
-    """
-    A QThread that runs an asyncio event loop.
-    Used to run GeminiWorker without blocking the UI.
-    """
-
-    def __init__(self, worker: GeminiWorker):
-        super().__init__()
-        self.worker = worker
-        self.loop = None
-
-    def run(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        try:
-            self.loop.run_until_complete(self.worker.run_async())
-        finally:
-            self.loop.close()
-
-    def stop(self):
-        self.worker.cancel()
-        if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
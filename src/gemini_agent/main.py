@@ -3,16 +3,23 @@ import asyncio
 import contextlib
 import json
 import logging
-import multiprocessing
 import os
 import sys
 import threading
 from pathlib import Path
-from typing import Any
-
-from PyQt6.QtCore import Q_ARG, QMetaObject, QObject, Qt, pyqtSignal
+from typing import TYPE_CHECKING, Any
+
+from PyQt6.QtCore import (
+    Q_ARG,
+    QFileSystemWatcher,
+    QMetaObject,
+    QObject,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
-    QApplication,
     QDialog,
     QDockWidget,
     QFileDialog,
@@ -30,34 +37,75 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from qasync import QEventLoop, asyncSlot
+from qasync import asyncSlot
 
 from gemini_agent.config.app_config import AppConfig, ModelRegistry, Role, Theme, setup_logging
 from gemini_agent.core.attachment_manager import AttachmentManager
-from gemini_agent.core.checkpoint_manager import CheckpointManager
-from gemini_agent.core.conductor_manager import ConductorManager
-from gemini_agent.core.exporter import Exporter
 from gemini_agent.core.extension_manager import ExtensionManager
-from gemini_agent.core.indexer import Indexer
 from gemini_agent.core.recent_manager import RecentManager
 from gemini_agent.core.session_manager import SessionManager
 from gemini_agent.core.tools import TOOL_REGISTRY
-from gemini_agent.core.vector_store import VectorStore
-from gemini_agent.core.worker import GeminiWorker, GeminiWorkerThread, WorkerConfig
+from gemini_agent.core.worker import GeminiWorker, WorkerConfig
 from gemini_agent.ui.components import ChatHeader, SidebarContainer
-from gemini_agent.ui.conductor_dialog import ConductorDialog
-from gemini_agent.ui.deep_review import DeepReviewDialog
-from gemini_agent.ui.plugin_dialog import PluginDialog
 from gemini_agent.ui.project_explorer import ProjectExplorer
-from gemini_agent.ui.settings_dialog import SettingsDialog
 from gemini_agent.ui.status_widget import StatusWidget
 from gemini_agent.ui.symbol_browser import SymbolBrowser
 from gemini_agent.ui.terminal_widget import TerminalWidget
 from gemini_agent.ui.theme_manager import ThemeManager
-from gemini_agent.ui.widgets import AttachmentItem, AutoResizingTextEdit, MessageBubble
+from gemini_agent.ui.widgets import (
+    AttachmentItem,
+    AutoResizingTextEdit,
+    MessageBubble,
+    message_bubble_qss,
+    render_markdown_segments,
+)
+
+if TYPE_CHECKING:
+    from gemini_agent.core.checkpoint_manager import CheckpointManager
+    from gemini_agent.core.conductor_manager import ConductorManager
+    from gemini_agent.core.indexer import Indexer
+    from gemini_agent.core.vector_store import VectorStore
+    from gemini_agent.ui.conductor_dialog import ConductorDialog
+    from gemini_agent.ui.plugin_dialog import PluginDialog
+    from gemini_agent.ui.settings_dialog import SettingsDialog
+
+# Dialogs, the exporter and the GUI-only backends are imported at their call sites to keep startup light
 
 logger = logging.getLogger(__name__)
 
+# Header button overrides, applied once on the main window so Qt does a single polish pass
+_HEADER_QSS = """
+    QPushButton#BtnToggleSidebar {{
+        background-color: transparent;
+        border: 1px solid {border};
+        border-radius: 8px;
+        color: {fg};
+        font-size: 20px;
+    }}
+    QPushButton#BtnToggleSidebar:hover {{ background-color: {hover}; }}
+    QPushButton#BtnSettings {{
+        background-color: transparent;
+        border: 1px solid {border};
+        border-radius: 4px;
+        color: {fg};
+    }}
+    QPushButton#BtnSettings:hover {{ background-color: {settings_hover}; color: {hover_fg}; }}
+"""
+_DARK_QSS = _HEADER_QSS.format(border="#555", fg="#888", hover="#333", settings_hover="#333", hover_fg="#EEE")
+_LIGHT_QSS = _HEADER_QSS.format(
+    border="#CCC", fg="#555", hover="#EEE", settings_hover="#F0F0F0", hover_fg="#000"
+)
+
+
+# Hoisted out of the per-message rendering loops
+_USER_ROLE = Role.USER.value
+_MODEL_ROLE = Role.MODEL.value
+
+
+def _render_chunk(messages: list, theme: str) -> list:
+    """Parses a chunk of messages into bubble segments; runs off the UI thread."""
+    return [render_markdown_segments(msg.text, theme) for msg in messages]
+
 
 class ChatController(QObject):
     """
@@ -73,16 +121,22 @@ class ChatController(QObject):
     terminal_output = pyqtSignal(str, str)
     tool_confirmation_requested = pyqtSignal(str, dict, str)
 
+    STOP_GRACE_MS = 3000  # How long shutdown waits for cancelled workers to drain
+    # Pool threads; more than one so a draining cancelled worker never delays the next prompt
+    WORKER_POOL_SIZE = 4
+    INDEX_BATCH_SIZE = 32
+    INDEX_BATCH_WINDOW = 0.2  # Seconds to wait for more responses before indexing a batch
+
     def __init__(
         self,
         app_config: AppConfig,
         session_manager: SessionManager,
         attachment_manager: AttachmentManager,
-        conductor_manager: ConductorManager,
-        indexer: Indexer,
+        conductor_manager: "ConductorManager",
+        indexer: "Indexer | None",
         extension_manager: ExtensionManager,
-        checkpoint_manager: CheckpointManager,
-        vector_store: VectorStore,
+        checkpoint_manager: "CheckpointManager",
+        vector_store: "VectorStore | None",
     ):
         super().__init__()
         self.app_config = app_config
@@ -94,18 +148,59 @@ class ChatController(QObject):
         self.checkpoint_manager = checkpoint_manager
         self.vector_store = vector_store
         self.worker: GeminiWorker | None = None
-        self.worker_thread: GeminiWorkerThread | None = None
+        # Workers whose run() hasn't returned yet; held so they aren't garbage collected mid-run
+        self._active_workers: set[GeminiWorker] = set()
+        # Long-lived threads reused for every prompt instead of a new QThread per message
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(self.WORKER_POOL_SIZE)
+        self._pool.setExpiryTimeout(-1)
+        self._index_queue: asyncio.Queue | None = None
+        self._index_task: asyncio.Task | None = None
+        # Messages the consumer has taken off the queue but not yet written
+        self._index_pending: list[tuple[str, str, dict]] = []
+        # Set once a vector store is attached; queued messages wait on it before being written
+        self._store_ready = asyncio.Event()
+        if vector_store is not None:
+            self._store_ready.set()
+
+    def attach_vector_store(self, vector_store: "VectorStore") -> None:
+        """Attaches a vector store built after startup and releases any messages waiting on it."""
+        self.vector_store = vector_store
+        self._store_ready.set()
+
+    def stop_worker(self, wait: bool = False) -> None:
+        """
+        Cancels the running worker, if any.
 
-    def stop_worker(self) -> None:
-        """Safely stops any running worker thread."""
-        if self.worker_thread and self.worker_thread.isRunning():
-            self.worker_thread.stop()
-            self.worker_thread.wait(3000)  # Wait up to 3 seconds
-            if self.worker_thread.isRunning():
-                self.worker_thread.terminate()
+        Cancellation is cooperative: the worker's event loop is stopped and the pool
+        thread is freed as soon as the current step returns, so the UI never blocks on it.
 
+        Args:
+            wait: Block for up to ``STOP_GRACE_MS`` until all workers have returned (used on shutdown).
+        """
+        if self.worker:
+            self._disconnect_worker(self.worker)
+            self.worker.stop()
         self.worker = None
-        self.worker_thread = None
+
+        if wait:
+            self._pool.waitForDone(self.STOP_GRACE_MS)
+
+    def _disconnect_worker(self, worker: GeminiWorker) -> None:
+        """Detaches a cancelled worker so its late signals can't reach the next turn."""
+        for signal in (
+            worker.finished,
+            worker.error,
+            worker.status_update,
+            worker.terminal_output,
+            worker.request_confirmation,
+            worker.plan_updated,
+            worker.specs_updated,
+            worker.usage_updated,
+            worker.rate_limit_updated,
+        ):
+            with contextlib.suppress(TypeError, RuntimeError):
+                signal.disconnect()
 
     def send_message(self, prompt: str, system_instruction_override: str | None = None) -> None:
         """Starts the Gemini worker to process the user request."""
@@ -128,10 +223,22 @@ class ChatController(QObject):
             new_title = prompt[:25] if prompt else "Analysis"
             self.session_manager.update_session_title(session_id, new_title)
 
-        self.session_manager.add_message(session_id, Role.USER.value, prompt or "[Files]")
+        self.session_manager.add_message(session_id, _USER_ROLE, prompt or "[Files]")
+
+        # Convert messages to dict for WorkerConfig compatibility (cached per session)
+        history = session.history_dicts()
+        # Everything before the prompt just added
+        end = len(history) - 1
 
-        # Convert messages to dict for WorkerConfig compatibility
-        history_context = [m.model_dump() for m in session.messages[:-1]]
+        # Sliding window: keep the opening message plus the most recent turns, sliced straight
+        # from the cache so only the kept entries are copied (the worker needs its own list)
+        window = self.app_config.history_window
+        trimmed = bool(window) and end > window + 1
+        start = end - window if trimmed else 0
+        # The kept tail must not open with the opening message's role, or the API sees two user turns in a row
+        while trimmed and start < end and history[start]["role"] == history[0]["role"]:
+            start += 1
+        history_context = history[:1] + history[start:end] if trimmed else history[:end]
 
         # Get session-specific config
         sess_config = session.config
@@ -146,7 +253,7 @@ class ChatController(QObject):
             api_key=self.app_config.api_key,
             prompt=prompt,
             model=model,
-            file_paths=list(attachments),
+            file_paths=attachments,
             history_context=history_context,
             use_grounding=self.app_config.get("use_search", False),
             system_instruction=system_instruction_override or self.app_config.get("system_instruction"),
@@ -162,53 +269,132 @@ class ChatController(QObject):
         )
 
         self.worker = GeminiWorker(config)
-        self.worker.finished.connect(self._on_worker_finished)
-        self.worker.error.connect(self.error_occurred.emit)
-        self.worker.status_update.connect(self.status_updated.emit)
-        self.worker.terminal_output.connect(self.terminal_output.emit)
-        self.worker.request_confirmation.connect(self.tool_confirmation_requested.emit)
-        self.worker.plan_updated.connect(lambda p: self.session_manager.update_session_plan(session_id, p))
-        self.worker.specs_updated.connect(lambda s: self.session_manager.update_session_specs(session_id, s))
-        self.worker.usage_updated.connect(self.usage_updated.emit)
-        self.worker.rate_limit_updated.connect(self.rate_limit_updated.emit)
+        # Every emission comes from a pool thread, so queue explicitly rather than have Qt
+        # work that out per signal; forwarded signals are chained without a Python slot
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker.finished.connect(self._on_worker_finished, queued)
+        self.worker.error.connect(self.error_occurred, queued)
+        self.worker.status_update.connect(self.status_updated, queued)
+        self.worker.terminal_output.connect(self.terminal_output, queued)
+        self.worker.request_confirmation.connect(self.tool_confirmation_requested, queued)
+        self.worker.plan_updated.connect(self._on_plan_updated, queued)
+        self.worker.specs_updated.connect(self._on_specs_updated, queued)
+        self.worker.usage_updated.connect(self.usage_updated, queued)
+        self.worker.rate_limit_updated.connect(self.rate_limit_updated, queued)
+
+        self.worker.done.connect(self._on_worker_done, queued)
 
         try:
-            self.worker_thread = GeminiWorkerThread(self.worker)
-            # Use a member variable to keep the thread alive
-            self.worker_thread.finished.connect(self._on_thread_finished)
-            self.worker_thread.start()
+            self._active_workers.add(self.worker)
+            self._pool.start(self.worker.run)
         except Exception as e:
+            self._active_workers.discard(self.worker)
             self.error_occurred.emit(f"Failed to start worker: {str(e)}")
 
-    def _on_thread_finished(self) -> None:
-        """Cleanup when the thread finishes."""
-        finished_thread = self.sender()
-        if finished_thread:
-            finished_thread.deleteLater()
+    def _on_plan_updated(self, plan: str) -> None:
+        """Stores a plan update on the session the emitting worker was started for."""
+        self.session_manager.update_session_plan(self.sender().config.session_id, plan)
+
+    def _on_specs_updated(self, specs: str) -> None:
+        """Stores a specs update on the session the emitting worker was started for."""
+        self.session_manager.update_session_specs(self.sender().config.session_id, specs)
 
-            # Only clear the reference if it still points to the finished thread
-            if self.worker_thread == finished_thread:
-                self.worker_thread = None
+    def _on_worker_done(self) -> None:
+        """Releases a worker once its run() has returned on the pool thread."""
+        worker = self.sender()
+        if worker is self.worker:
+            self.worker = None
+        if worker in self._active_workers:
+            self._active_workers.discard(worker)
+            worker.deleteLater()
 
     def _on_worker_finished(self, text: str) -> None:
-        self.session_manager.add_message(self.session_manager.current_session_id, Role.MODEL.value, text)
+        session_id = self.session_manager.current_session_id
+        self.session_manager.add_message(session_id, _MODEL_ROLE, text)
         self.attachment_manager.clear_attachments()
         self.response_received.emit(text)
 
-        # Async indexing to ChromaDB after response
-        asyncio.create_task(self._index_response_to_chroma(text))
+        # Queue the response for batched indexing into ChromaDB
+        self.queue_for_indexing(session_id, text)
 
-    async def _index_response_to_chroma(self, text: str):
-        """Indexes the AI response into ChromaDB asynchronously."""
-        session_id = self.session_manager.current_session_id
+    def queue_for_indexing(self, session_id: str, text: str, role: str = _MODEL_ROLE) -> None:
+        """Hands a message to the background consumer that batches ChromaDB inserts."""
         session = self.session_manager.get_session(session_id)
         if not session:
             return
-        doc_id = f"{session_id}_{len(session.messages)}"
+
+        if self._index_queue is None:
+            # Created lazily: the qasync loop is only running once the UI is up
+            self._index_queue = asyncio.Queue()
+            self._index_task = asyncio.create_task(self._index_consumer())
+
+        # Derived from the persisted message count so ids stay unique across restarts
+        doc_id = f"{session_id}_{len(session.messages)}{'_user' if role == _USER_ROLE else ''}"
+        self._index_queue.put_nowait((doc_id, text, {"session_id": session_id, "role": role}))
+
+    async def _index_consumer(self) -> None:
+        """Coalesces queued messages into a single add_documents call per batch."""
+        while True:
+            # Kept on self so drain_index_queue can still write it if the window closes mid-batch
+            self._index_pending = batch = [await self._index_queue.get()]
+            while len(batch) < self.INDEX_BATCH_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(self._index_queue.get(), timeout=self.INDEX_BATCH_WINDOW))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._store_ready.wait()
+            try:
+                self._add_to_vector_store(batch)
+            except Exception as e:
+                logger.error(f"Failed to queue messages for indexing: {e}")
+            finally:
+                self._index_pending = []
+                for _ in batch:
+                    self._index_queue.task_done()
+
+    def _add_to_vector_store(self, batch: list[tuple[str, str, dict]]) -> None:
+        """Writes a batch of (doc_id, text, metadata) tuples with one add_documents call."""
         self.vector_store.add_documents(
-            documents=[text], metadatas=[{"session_id": session_id, "role": "model"}], ids=[doc_id]
+            documents=[text for _, text, _ in batch],
+            metadatas=[meta for _, _, meta in batch],
+            ids=[doc_id for doc_id, _, _ in batch],
         )
 
+    async def flush_index_queue(self) -> None:
+        """Waits until every queued message has been written to the vector store."""
+        if self.vector_store is None:
+            return
+        if self._index_queue is not None:
+            await self._index_queue.join()
+        await asyncio.to_thread(self.vector_store.flush)
+
+    def drain_index_queue(self) -> None:
+        """
+        Synchronously writes the consumer's in-progress batch and any still-queued
+        messages to the vector store and waits for them to commit (used on shutdown).
+        """
+        if self._index_queue is None:
+            return
+        if self._index_task is not None:
+            # The batch is taken over here, so the consumer must not write it again
+            self._index_task.cancel()
+        batch, self._index_pending = self._index_pending, []
+        while not self._index_queue.empty():
+            batch.append(self._index_queue.get_nowait())
+        for _ in batch:
+            self._index_queue.task_done()
+        if not batch:
+            return
+
+        if self.vector_store is None:
+            # Messages arrived before the store finished opening; open it now rather than drop them
+            from gemini_agent.core.vector_store import VectorStore
+
+            self.vector_store = VectorStore()
+        self._add_to_vector_store(batch)
+        self.vector_store.flush()
+
     def confirm_tool(self, confirmation_id: str, allowed: bool, modified_args: dict[str, Any] | None = None) -> None:
         if self.worker:
             self.worker.confirm_tool(confirmation_id, allowed, modified_args)
@@ -220,17 +406,35 @@ class GeminiBrowser(QMainWindow):
     Handles UI layout and delegates logic to ChatController.
     """
 
+    # Completer keywords built on a background thread, delivered to the UI thread
+    _keywords_built = pyqtSignal(list)
+
+    MESSAGE_PAGE_SIZE = 50
+    # Bubbles rendered per event-loop pass when loading a session
+    RENDER_CHUNK_SIZE = 10
+    UI_REFRESH_INTERVAL_MS = 100
+    # Quiet period after the last working-directory change before keywords are rebuilt
+    KEYWORD_REFRESH_DEBOUNCE_MS = 200
+    # Upper bound on detached widgets kept around for reuse
+    WIDGET_POOL_LIMIT = 100
+    # Bubbles kept alive while chatting; older ones are released and reload on scroll
+    MAX_LIVE_BUBBLES = 150
+    # Each semantic search hit is truncated to this many characters before rendering
+    SEARCH_RESULT_MAX_CHARS = 2048
+    # Slash command -> name of the coroutine method handling its argument
+    _SLASH_COMMANDS = {"/search": "_perform_semantic_search"}
+
     def __init__(
         self,
         app_config: AppConfig,
         theme_manager: ThemeManager,
         session_manager: SessionManager,
         attachment_manager: AttachmentManager,
-        conductor_manager: ConductorManager,
-        indexer: Indexer,
+        conductor_manager: "ConductorManager",
+        indexer: "Indexer | None",
         extension_manager: ExtensionManager,
-        checkpoint_manager: CheckpointManager,
-        vector_store: VectorStore,
+        checkpoint_manager: "CheckpointManager",
+        vector_store: "VectorStore | None",
         recent_manager: RecentManager,
     ):
         super().__init__()
@@ -256,7 +460,52 @@ class GeminiBrowser(QMainWindow):
             vector_store,
         )
 
-        self.status_widget: StatusWidget | None = None
+        # One status widget reused for every request; it sits in the chat layout only while shown
+        self.status_widget = StatusWidget()
+        self.status_widget.hide()
+        self._history_info_lbl: QLabel | None = None
+        self._keyword_cache: list[str] | None = None
+        # (mtime_ns of ".", entry names) from the last directory scan
+        self._cwd_entries: tuple[int, list[str]] | None = None
+        # Only one keyword build runs at a time; a refresh requested meanwhile reruns it afterwards
+        self._keywords_building = False
+        self._keywords_rerun = False
+        # Command list the conductor submenu was last built from
+        self._conductor_menu_commands: list[str] | None = None
+        # Serializes project scans; the cancel event belongs to the most recent request
+        self._index_lock = asyncio.Lock()
+        self._index_cancel: threading.Event | None = None
+        self._sidebar_dirty = False
+        self._attachments_dirty = False
+        self._scroll_pending = False
+        # Cached theme name, refreshed in apply_theme
+        self._theme_mode = self.app_config.theme
+        # (total_tokens, cost) currently shown in the header usage label
+        self._usage_shown: tuple[int, float] | None = None
+
+        # Coalesce bursts of usage/status updates into one repaint per interval
+        self._pending_status: str | None = None
+        self._pending_rate_limit: tuple[int, int] | None = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.UI_REFRESH_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+        self._usage_timer = QTimer(self)
+        self._usage_timer.setSingleShot(True)
+        self._usage_timer.setInterval(self.UI_REFRESH_INTERVAL_MS)
+        self._usage_timer.timeout.connect(self._refresh_usage_display)
+        self._oldest_loaded_index = 0
+        self._render_generation = 0
+        self._rendering_chunks = False
+        self._bubble_pool: list[MessageBubble] = []
+        self._attachment_pool: list[AttachmentItem] = []
+        self._more_attachments_lbl: QLabel | None = None
+        # Session whose messages are currently in the chat area; None after a clear
+        self._displayed_session_id: str | None = None
+        # Built on first open, then re-synced and reused
+        self._settings_dialog: SettingsDialog | None = None
+        self._conductor_dialog: ConductorDialog | None = None
+        self._plugin_dialog: PluginDialog | None = None
 
         self.init_ui()
         self._connect_controller()
@@ -267,6 +516,19 @@ class GeminiBrowser(QMainWindow):
         # Apply initial theme
         self.theme_manager.apply_theme(self.app_config.theme)
 
+    def attach_indexer(self, indexer: "Indexer") -> None:
+        """Attaches an indexer built after startup and populates the symbol browser from it."""
+        self.indexer = indexer
+        self.controller.indexer = indexer
+        # Show what the SQLite cache already holds while the rescan streams in changes
+        self.symbol_browser.set_symbols(indexer.get_all_symbols())
+        self.refresh_index()
+
+    def attach_vector_store(self, vector_store: "VectorStore") -> None:
+        """Attaches a vector store built after startup."""
+        self.vector_store = vector_store
+        self.controller.attach_vector_store(vector_store)
+
     def _connect_controller(self) -> None:
         self.controller.status_updated.connect(self.on_status_update)
         self.controller.response_received.connect(self.on_response_success)
@@ -303,6 +565,16 @@ class GeminiBrowser(QMainWindow):
 
         self.setup_settings_menu()
 
+        self._keywords_built.connect(self._on_keywords_built)
+        self._refresh_keywords()
+        # Bursts of directory changes collapse into one rebuild after the debounce interval
+        self._keyword_timer = QTimer(self)
+        self._keyword_timer.setSingleShot(True)
+        self._keyword_timer.setInterval(self.KEYWORD_REFRESH_DEBOUNCE_MS)
+        self._keyword_timer.timeout.connect(self._refresh_keywords)
+        self._cwd_watcher = QFileSystemWatcher(["."], self)
+        self._cwd_watcher.directoryChanged.connect(lambda _path: self._keyword_timer.start())
+
     def _setup_sidebar(self) -> None:
         """Initializes the sidebar components."""
         self.sidebar_container = SidebarContainer()
@@ -348,12 +620,15 @@ class GeminiBrowser(QMainWindow):
         self.scroll_area.setObjectName("ScrollArea")
 
         self.messages_container = QWidget()
+        self.messages_container.setStyleSheet(message_bubble_qss(self._theme_mode))
         self.messages_layout = QVBoxLayout(self.messages_container)
         self.messages_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.messages_layout.setSpacing(20)
         self.messages_layout.setContentsMargins(50, 20, 50, 20)
 
         self.scroll_area.setWidget(self.messages_container)
+        self._vbar = self.scroll_area.verticalScrollBar()
+        self._vbar.valueChanged.connect(self._on_chat_scrolled)
         self.chat_splitter.addWidget(self.scroll_area)
 
         chat_layout.addWidget(self.chat_splitter, 1)
@@ -363,6 +638,12 @@ class GeminiBrowser(QMainWindow):
     def _setup_terminal(self) -> None:
         """Initializes the terminal dock."""
         self.terminal = TerminalWidget()
+        # Output type -> append method, resolved once for the per-line streaming path
+        self._terminal_appenders = {
+            "error": self.terminal.append_error,
+            "success": self.terminal.append_success,
+            "info": self.terminal.append_info,
+        }
         self.terminal_dock = QDockWidget("Terminal", self)
         self.terminal_dock.setWidget(self.terminal)
         self.terminal_dock.setAllowedAreas(Qt.DockWidgetArea.BottomDockWidgetArea | Qt.DockWidgetArea.TopDockWidgetArea)
@@ -395,13 +676,9 @@ class GeminiBrowser(QMainWindow):
         self.input_field = AutoResizingTextEdit(self)
         self.input_field.returnPressed.connect(self.send_message)
 
-        # Populate completer with tools, commands, and files
-        keywords = ["/clear", "/help", "/reset", "/conductor", "/search"]
-        keywords.extend(list(TOOL_REGISTRY.keys()))
-        keywords.extend(self.conductor_manager.get_available_commands())
-        with contextlib.suppress(OSError):
-            keywords.extend([f for f in os.listdir(".") if not f.startswith(".")])
-        self.input_field.update_keywords(keywords)
+        # Completer keywords are built off the UI thread; reuse the cached list if we have one
+        if self._keyword_cache is not None:
+            self.input_field.update_keywords(self._keyword_cache)
 
         btn_send = QPushButton("➤")
         btn_send.setFixedSize(36, 36)
@@ -414,6 +691,48 @@ class GeminiBrowser(QMainWindow):
         bottom_layout.addWidget(self.input_frame)
         layout.addWidget(bottom_container, 0)
 
+    def _refresh_keywords(self) -> None:
+        """Rebuilds the completer keyword list in a background thread, one build at a time."""
+        if self._keywords_building:
+            self._keywords_rerun = True
+            return
+        self._keywords_building = True
+        threading.Thread(target=self._build_keywords, daemon=True).start()
+
+    def _build_keywords(self) -> None:
+        """Collects slash commands, tools, conductor commands and files for the completer."""
+        keywords = ["/clear", "/help", "/reset", "/conductor", "/search"]
+        keywords.extend(TOOL_REGISTRY.keys())
+        keywords.extend(self.conductor_manager.get_available_commands())
+        keywords.extend(self._list_cwd_entries())
+        self._keywords_built.emit(sorted(set(keywords)))
+
+    def _on_keywords_built(self, keywords: list[str]) -> None:
+        """Hands a finished keyword list to the completer and starts any refresh requested meanwhile."""
+        self._keywords_building = False
+        self._keyword_cache = keywords
+        self.input_field.update_keywords(keywords)
+        if self._keywords_rerun:
+            self._keywords_rerun = False
+            self._refresh_keywords()
+
+    def _list_cwd_entries(self) -> list[str]:
+        """Returns the visible names in the working directory, rescanning only when its mtime changes."""
+        try:
+            mtime = os.stat(".").st_mtime_ns
+        except OSError:
+            return []
+        cached = self._cwd_entries
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        names = []
+        with contextlib.suppress(OSError), os.scandir(".") as it:
+            # DirEntry caches the type from readdir, so this filter needs no extra stat calls
+            names = [e.name for e in it if not e.name.startswith(".") and (e.is_file() or e.is_dir())]
+        self._cwd_entries = (mtime, names)
+        return names
+
     def setup_settings_menu(self) -> None:
         """Sets up the unified settings menu on the header button."""
         self.settings_menu = QMenu(self)
@@ -427,7 +746,8 @@ class GeminiBrowser(QMainWindow):
 
         # 3. Conductor Submenu
         conductor_submenu = self.settings_menu.addMenu("📋 Conductor Commands")
-        self._populate_conductor_menu(conductor_submenu)
+        # Filled on first open and rebuilt only when the command list changes
+        conductor_submenu.aboutToShow.connect(lambda: self._populate_conductor_menu(conductor_submenu))
 
         self.settings_menu.addSeparator()
 
@@ -442,15 +762,24 @@ class GeminiBrowser(QMainWindow):
         history_menu.addAction("Restore History").triggered.connect(self.restore_history)
 
         self.settings_menu.addSeparator()
-        self.settings_menu.addAction("🧹 Clear Vector Cache").triggered.connect(self.vector_store.delete_collection)
+        self.settings_menu.addAction("🧹 Clear Vector Cache").triggered.connect(self._clear_vector_cache)
 
         # Attach menu to button
         self.header.btn_settings.setMenu(self.settings_menu)
 
+    def _clear_vector_cache(self) -> None:
+        """Drops the semantic search collection, if the vector store has finished loading."""
+        if self.vector_store is not None:
+            self.vector_store.delete_collection()
+
     def _populate_conductor_menu(self, menu: QMenu) -> None:
         """Populates a QMenu with conductor commands."""
-        menu.clear()
         commands = self.conductor_manager.get_available_commands()
+        # The manager hands back the same list object until the commands directory changes
+        if commands is self._conductor_menu_commands and not menu.isEmpty():
+            return
+        menu.clear()
+        self._conductor_menu_commands = commands
         if not commands:
             action = menu.addAction("No commands found")
             action.setEnabled(False)
@@ -471,20 +800,38 @@ class GeminiBrowser(QMainWindow):
         """Updates the terminal button state when dock visibility changes."""
         self.header.btn_terminal.setChecked(visible)
 
-    def refresh_index(self) -> None:
-        """Refreshes the project index for symbol browsing in a background thread."""
-
-        def _bg_index():
-            self.indexer.index_project()
-            # Use QMetaObject to safely update UI from background thread
-            QMetaObject.invokeMethod(
-                self.symbol_browser,
-                "set_symbols",
-                Qt.ConnectionType.QueuedConnection,
-                Q_ARG(list, self.indexer.get_all_symbols()),
-            )
+    @asyncSlot()
+    async def refresh_index(self) -> None:
+        """Refreshes the project index for symbol browsing without blocking the UI."""
+        # attach_indexer retries once loaded
+        if self.indexer is None:
+            return
+        # A newer refresh supersedes the running scan instead of stacking a second one on top
+        if self._index_cancel is not None:
+            self._index_cancel.set()
+        cancel_event = self._index_cancel = threading.Event()
+        async with self._index_lock:
+            if cancel_event.is_set():
+                return
+
+            def post_batch(symbols: list) -> None:
+                # Runs on the indexing thread; queue each batch onto the GUI thread as it is parsed
+                if not cancel_event.is_set():
+                    QMetaObject.invokeMethod(
+                        self.symbol_browser,
+                        "add_symbols",
+                        Qt.ConnectionType.QueuedConnection,
+                        Q_ARG(list, symbols),
+                    )
 
-        threading.Thread(target=_bg_index, daemon=True).start()
+            try:
+                await asyncio.to_thread(self.indexer.index_project, cancel_event, post_batch)
+            except Exception as e:
+                logger.error(f"Project indexing failed: {e}")
+                return
+            if not cancel_event.is_set():
+                # Back on the loop thread, so the browser can be updated directly
+                self.symbol_browser.set_symbols(self.indexer.get_all_symbols())
 
     def on_symbol_selected(self, symbol: Any) -> None:
         """Handles symbol selection from the symbol browser."""
@@ -506,8 +853,9 @@ class GeminiBrowser(QMainWindow):
             return
 
         self.create_new_session()
-        self.session_manager.update_session_title(self.session_manager.current_session_id, f"Conductor: {command_name}")
-        self.update_sidebar()
+        title = f"Conductor: {command_name}"
+        self.session_manager.update_session_title(self.session_manager.current_session_id, title)
+        self.sidebar.rename_session(self.session_manager.current_session_id, title)
 
         self._start_worker(prompt, system_instruction_override=system_instruction)
 
@@ -528,8 +876,7 @@ class GeminiBrowser(QMainWindow):
         """Opens a dialog to select files for attachment."""
         files, _ = QFileDialog.getOpenFileNames(self, "Select Files", "", "All Files (*)")
         if files:
-            for f in files:
-                self.add_attachment(f)
+            self.add_attachments(files)
 
     def attach_folder_dialog(self) -> None:
         """Opens a dialog to select a folder for attachment."""
@@ -539,135 +886,329 @@ class GeminiBrowser(QMainWindow):
 
     def add_attachment(self, path: str, item_type: str = "file") -> None:
         """Adds a file or folder to the current session's attachments."""
-        self.attachment_manager.add_attachment(path)
-        self.recent_manager.add_item(path, item_type)
+        self.add_attachments([path], item_type)
+
+    def add_attachments(self, paths: list[str], item_type: str = "file") -> None:
+        """Adds several files or folders with one recent-list write and one UI refresh."""
+        self.attachment_manager.add_attachments(paths)
+        self.recent_manager.add_items(paths, item_type)
         self._update_attachment_ui()
         self.update_sidebar()
 
     def remove_attachment(self, path: str) -> None:
         """Removes an attachment from the current session."""
-        if path in self.attachment_manager.attachments:
-            self.attachment_manager.attachments.remove(path)
+        if self.attachment_manager.remove_attachment(path):
             self._update_attachment_ui()
 
     def _update_attachment_ui(self) -> None:
+        """Schedules an attachment bar rebuild; a burst of add/remove calls collapses into one."""
+        if self._attachments_dirty:
+            return
+        self._attachments_dirty = True
+        QTimer.singleShot(0, self._flush_attachment_ui)
+
+    def _flush_attachment_ui(self) -> None:
         """Updates the attachment list UI."""
-        # Clear current list
+        self._attachments_dirty = False
+        # Clear current list, keeping attachment items and the overflow label for reuse
         while self.attachment_list_layout.count():
             child = self.attachment_list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = child.widget()
+            if isinstance(widget, AttachmentItem) and len(self._attachment_pool) < self.WIDGET_POOL_LIMIT:
+                widget.hide()
+                self._attachment_pool.append(widget)
+            elif isinstance(widget, AttachmentItem):
+                widget.deleteLater()
+            elif widget:
+                widget.hide()
 
         # Add items
         attachments = self.attachment_manager.get_attachments()
         # Limit display to first 5 to avoid clutter
         for path in attachments[:5]:
-            item = AttachmentItem(path, self.app_config.theme)
-            item.remove_requested.connect(self.remove_attachment)
+            if self._attachment_pool:
+                item = self._attachment_pool.pop()
+                item.reset(path, self._theme_mode)
+            else:
+                item = AttachmentItem(path, self._theme_mode)
+                item.remove_requested.connect(self.remove_attachment)
             self.attachment_list_layout.addWidget(item)
+            item.show()
 
         if len(attachments) > 5:
-            more_lbl = QLabel(f"+{len(attachments) - 5} more")
-            more_lbl.setStyleSheet("color: #888; font-size: 11px;")
-            self.attachment_list_layout.addWidget(more_lbl)
+            if self._more_attachments_lbl is None:
+                self._more_attachments_lbl = QLabel()
+                self._more_attachments_lbl.setStyleSheet("color: #888; font-size: 11px;")
+            self._more_attachments_lbl.setText(f"+{len(attachments) - 5} more")
+            self.attachment_list_layout.addWidget(self._more_attachments_lbl)
+            self._more_attachments_lbl.show()
 
     def apply_theme(self) -> None:
         """Applies the current theme to the entire application."""
-        theme = self.app_config.theme
+        theme = self._theme_mode = self.app_config.theme
         self.theme_manager.apply_theme(theme)
 
         # Custom styling for specific buttons that don't follow palette perfectly
-        btn_style = """
-            QPushButton { 
-                background-color: transparent; 
-                border: 1px solid %s; 
-                border-radius: 8px; 
-                color: %s; 
-                font-size: 20px;
-            }
-            QPushButton:hover { background-color: %s; }
-        """
-        if theme == Theme.DARK.value:
-            self.header.btn_toggle_sidebar.setStyleSheet(btn_style % ("#555", "#888", "#333"))
-            self.header.btn_settings.setStyleSheet(
-                "QPushButton { background-color: transparent; border: 1px solid #555; border-radius: 4px; color: #888; } QPushButton:hover { background-color: #333; color: #EEE; }"
-            )
-        else:
-            self.header.btn_toggle_sidebar.setStyleSheet(btn_style % ("#CCC", "#555", "#EEE"))
-            self.header.btn_settings.setStyleSheet(
-                "QPushButton { background-color: transparent; border: 1px solid #CCC; border-radius: 4px; color: #555; } QPushButton:hover { background-color: #F0F0F0; color: #000; }"
-            )
+        self.setStyleSheet(_DARK_QSS if theme == Theme.DARK.value else _LIGHT_QSS)
 
         self.project_explorer.apply_theme(theme)
+        self.messages_container.setStyleSheet(message_bubble_qss(theme))
         self._update_attachment_ui()
 
-        if self.session_manager.current_session_id:
-            self.load_session_from_list(None)  # Reload current session UI
+        # Re-color the existing bubbles in place rather than rebuilding the chat
+        for i in range(self.messages_layout.count()):
+            widget = self.messages_layout.itemAt(i).widget()
+            if isinstance(widget, MessageBubble):
+                widget.apply_theme(theme)
 
     def create_new_session(self) -> None:
         """Creates a new chat session."""
         # Use global default model for new sessions
         config = {"model": self.app_config.model}
-        self.session_manager.create_session(config=config)
+        session_id = self.session_manager.create_session(config=config)
         self.clear_chat_ui()
+        self._displayed_session_id = session_id
         self.attachment_manager.clear_attachments()
         self._update_attachment_ui()
-        self.update_sidebar()
+        self.sidebar.add_session(session_id, self.session_manager.current_session)
+        self.sidebar.set_current(session_id)
 
         self._refresh_usage_display()
 
     def update_sidebar(self) -> None:
-        """Updates the sidebar with the latest session list."""
+        """Schedules a sidebar refresh; back-to-back calls collapse into one repopulate."""
+        if self._sidebar_dirty:
+            return
+        self._sidebar_dirty = True
+        QTimer.singleShot(0, self._flush_sidebar)
+
+    def _flush_sidebar(self) -> None:
+        """Repopulates the sidebar with the latest session list."""
+        self._sidebar_dirty = False
         self.sidebar.populate_sessions(self.session_manager.get_all_sessions(), self.session_manager.current_session_id)
         self.sidebar.update_recent_items(self.recent_manager.get_recent_items())
 
     def load_session_from_list(self, item: QListWidgetItem | None) -> None:
         """Loads a session from the sidebar list."""
-        if item:
-            session_id = item.data(Qt.ItemDataRole.UserRole)
-        else:
-            session_id = self.session_manager.current_session_id
-
-        if isinstance(session_id, dict):
-            session_id = session_id.get("id")
-
+        session_id = self._session_id_of(item) if item else self.session_manager.current_session_id
         if not session_id:
             return
+        # Re-clicking the chat already on screen has nothing to rebuild
+        if item is not None and session_id == self._displayed_session_id:
+            return
 
         self.session_manager.current_session_id = session_id
+        self.sidebar.set_current(session_id)
 
         self.clear_chat_ui()
         session = self.session_manager.get_session(session_id)
         if session:
-            messages = session.messages
-            # Limit to last 50 messages for performance
-            display_messages = messages[-50:] if len(messages) > 50 else messages
-
-            if len(messages) > 50:
-                info_lbl = QLabel(f"Showing last 50 of {len(messages)} messages.")
-                info_lbl.setStyleSheet("color: #888; font-style: italic; margin-left: 50px;")
-                self.messages_layout.addWidget(info_lbl)
-
-            for msg in display_messages:
-                self.messages_layout.addWidget(
-                    MessageBubble(
-                        msg.text,
-                        is_user=(msg.role == Role.USER.value),
-                        theme_mode=self.app_config.theme,
-                    )
+            total = len(session.messages)
+            # Only materialize the most recent page; older pages load on scroll
+            display_messages = self.session_manager.get_messages(session_id, tail=self.MESSAGE_PAGE_SIZE)
+            self._oldest_loaded_index = total - len(display_messages)
+
+            if self._oldest_loaded_index > 0:
+                self._ensure_history_info()
+                self._update_history_info(total)
+
+            # Render the newest bubbles now; older ones are pre-rendered off-thread and stream in above them
+            split = max(0, len(display_messages) - self.RENDER_CHUNK_SIZE)
+            insert_at = self.messages_layout.count()
+            self._bulk_add_bubbles(display_messages[split:], insert_at)
+            if split:
+                self._rendering_chunks = True
+                asyncio.ensure_future(
+                    self._render_older_bubbles(display_messages[:split], insert_at, self._render_generation)
                 )
 
             self._refresh_usage_display()
 
+        self._displayed_session_id = session_id
+        self.scroll_to_bottom()
+
+    async def _render_older_bubbles(self, messages: list, insert_at: int, generation: int) -> None:
+        """Inserts older bubbles a chunk at a time, newest chunk first, parsing markdown off the UI thread."""
+        theme = self._theme_mode
+        end = len(messages)
+        try:
+            while end > 0:
+                start = max(0, end - self.RENDER_CHUNK_SIZE)
+                chunk = messages[start:end]
+                rendered = await asyncio.to_thread(_render_chunk, chunk, theme)
+                if generation != self._render_generation:
+                    return  # The chat was cleared or switched while rendering
+                if theme != self._theme_mode:
+                    rendered = [None] * len(chunk)
+
+                self._bulk_add_bubbles(chunk, insert_at, rendered)
+                end = start
+        except Exception as e:
+            logger.error(f"Failed to render chat history: {e}")
+        finally:
+            if generation == self._render_generation:
+                self._rendering_chunks = False
+
         self.scroll_to_bottom()
 
+    @contextlib.contextmanager
+    def _batched_chat_updates(self):
+        """Suspends repaints and geometry work of the chat container while a batch of bubbles is inserted."""
+        self.messages_container.setUpdatesEnabled(False)
+        self.messages_layout.setEnabled(False)
+        try:
+            yield
+        finally:
+            self.messages_layout.setEnabled(True)
+            # One relayout for the whole batch
+            self.messages_layout.invalidate()
+            self.messages_container.setUpdatesEnabled(True)
+
+    def _bulk_add_bubbles(self, messages: list, index: int, rendered: list | None = None) -> None:
+        """
+        Inserts bubbles for consecutive messages starting at layout position ``index``.
+
+        Args:
+            rendered: Pre-rendered segments per message, as produced off-thread by
+                ``render_markdown_segments``.
+        """
+        with self._batched_chat_updates():
+            for offset, msg in enumerate(messages):
+                segments = rendered[offset] if rendered else None
+                self._add_bubble(msg.text, is_user=(msg.role == _USER_ROLE), segments=segments, index=index + offset)
+
+    def _ensure_history_info(self) -> None:
+        """Adds the history banner at the top of the chat if it isn't there yet."""
+        if self._history_info_lbl:
+            return
+        self._history_info_lbl = QLabel()
+        self._history_info_lbl.setStyleSheet("color: #888; font-style: italic; margin-left: 50px;")
+        self.messages_layout.insertWidget(0, self._history_info_lbl)
+
+    def _trim_live_bubbles(self) -> None:
+        """
+        Releases the oldest bubbles once the chat holds more than ``MAX_LIVE_BUBBLES``,
+        so long conversations keep a bounded number of widgets. Released history
+        messages are reloaded by scrolling up.
+        """
+        first = 1 if self._history_info_lbl else 0
+        excess = self.messages_layout.count() - first - self.MAX_LIVE_BUBBLES
+        # Don't shift content under a user reading older messages or while history streams in
+        if excess <= 0 or self._rendering_chunks or self._vbar.value() < self._vbar.maximum():
+            return
+
+        released = 0
+        graveyard = QWidget()
+        for _ in range(excess):
+            widget = self.messages_layout.takeAt(first).widget()
+            if isinstance(widget, MessageBubble):
+                if widget.property("history"):
+                    released += 1
+                self._release_bubble(widget, graveyard)
+            elif widget:
+                widget.setParent(graveyard)
+        graveyard.deleteLater()
+
+        if released:
+            self._oldest_loaded_index += released
+            self._ensure_history_info()
+            session = self.session_manager.get_session(self.session_manager.current_session_id)
+            if session:
+                self._update_history_info(len(session.messages))
+
+    def _update_history_info(self, total: int) -> None:
+        """Updates the banner describing how much of the history is displayed."""
+        if not self._history_info_lbl:
+            return
+        shown = total - self._oldest_loaded_index
+        if self._oldest_loaded_index > 0:
+            self._history_info_lbl.setText(f"Showing last {shown} of {total} messages. Scroll up to load more.")
+        else:
+            self._history_info_lbl.setText(f"Showing all {total} messages.")
+
+    def _on_chat_scrolled(self, value: int) -> None:
+        """Loads the previous page of messages when the user reaches the top of the chat."""
+        if value != 0 or self._oldest_loaded_index <= 0 or self._rendering_chunks:
+            return
+
+        session_id = self.session_manager.current_session_id
+        session = self.session_manager.get_session(session_id)
+        if not session:
+            return
+
+        older = self.session_manager.get_messages(
+            session_id, tail=self.MESSAGE_PAGE_SIZE, before=self._oldest_loaded_index
+        )
+        self._oldest_loaded_index -= len(older)
+
+        # Insert after the info banner, preserving chronological order
+        scroll_bar = self._vbar
+        previous_max = scroll_bar.maximum()
+        self._bulk_add_bubbles(older, 1)
+        self._update_history_info(len(session.messages))
+
+        # Keep the previously visible message in place once the new bubbles are laid out
+        QTimer.singleShot(0, lambda: scroll_bar.setValue(scroll_bar.maximum() - previous_max))
+
+    def _add_bubble(
+        self, text: str, is_user: bool, segments: tuple | None = None, history: bool = True, index: int = -1
+    ) -> MessageBubble:
+        """
+        Inserts a message bubble for the text into the chat, reusing a pooled one when available.
+
+        Args:
+            history: Whether the bubble shows a stored session message (as opposed to
+                transient output such as search results or errors).
+            index: Layout position to insert at; -1 appends.
+        """
+        if self._bubble_pool:
+            bubble = self._bubble_pool.pop()
+            bubble.reset(text, is_user=is_user, theme_mode=self._theme_mode, segments=segments)
+        else:
+            bubble = MessageBubble(text, is_user=is_user, theme_mode=self._theme_mode, segments=segments)
+        bubble.setProperty("history", history)
+        self.messages_layout.insertWidget(index, bubble)
+        # Pooled bubbles were hidden explicitly, so the layout won't show them on its own
+        bubble.show()
+        return bubble
+
+    def _release_bubble(self, bubble: MessageBubble, graveyard: QWidget | None = None) -> None:
+        """
+        Parks a bubble taken out of the chat layout in the pool, or deletes it once the
+        pool is full. Pooled bubbles stay parented to the messages container, so they
+        never become top-level windows.
+
+        Args:
+            graveyard: Throwaway parent collecting discarded widgets, so a batch is
+                destroyed with a single ``deleteLater`` on it.
+        """
+        if len(self._bubble_pool) < self.WIDGET_POOL_LIMIT:
+            bubble.hide()
+            self._bubble_pool.append(bubble)
+        elif graveyard is not None:
+            bubble.setParent(graveyard)
+        else:
+            bubble.deleteLater()
+
     def clear_chat_ui(self) -> None:
         """Clears all message bubbles from the chat area."""
+        graveyard = QWidget()
         while self.messages_layout.count():
             child = self.messages_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        self.status_widget = None
+            widget = child.widget()
+            if isinstance(widget, MessageBubble):
+                # Detach and park the bubble instead of destroying it
+                self._release_bubble(widget, graveyard)
+            elif widget is self.status_widget:
+                self._hide_status()
+            elif widget:
+                widget.setParent(graveyard)
+        graveyard.deleteLater()
+        self._history_info_lbl = None
+        self._oldest_loaded_index = 0
+        self._render_generation += 1
+        self._rendering_chunks = False
+        self._displayed_session_id = None
 
     def show_context_menu(self, pos: Qt.AlignmentFlag) -> None:
         """Shows the context menu for a session in the sidebar."""
@@ -684,56 +1225,74 @@ class GeminiBrowser(QMainWindow):
         menu.addAction("Delete").triggered.connect(lambda: self.delete_session(item))
         menu.exec(self.sidebar.chat_list.mapToGlobal(pos))
 
+    @staticmethod
+    def _session_id_of(item: QListWidgetItem) -> str | None:
+        """Returns the session id stored on a sidebar row."""
+        data = item.data(Qt.ItemDataRole.UserRole)
+        # Sidebar rows carry the RecentWidget item dict
+        return data.get("id") if isinstance(data, dict) else data
+
     def delete_session(self, item: QListWidgetItem) -> None:
         """Deletes a session."""
-        sess_id = item.data(Qt.ItemDataRole.UserRole)
+        sess_id = self._session_id_of(item)
         if self.session_manager.delete_session(sess_id):
-            self.update_sidebar()
+            self.sidebar.remove_session(sess_id)
             if not self.session_manager.current_session_id:
                 self.create_new_session()
 
     def rename_session(self, item: QListWidgetItem) -> None:
         """Renames a session."""
-        sess_id = item.data(Qt.ItemDataRole.UserRole)
-        current_name = item.text().strip()
+        sess_id = self._session_id_of(item)
+        session = self.session_manager.get_session(sess_id)
+        current_name = session.title if session else ""
         new_name, ok = QInputDialog.getText(self, "Rename", "Chat Title:", text=current_name)
         if ok and new_name:
             self.session_manager.update_session_title(sess_id, new_name)
-            self.update_sidebar()
+            self.sidebar.rename_session(sess_id, new_name)
 
-    def export_session_to_markdown(self, item: QListWidgetItem) -> None:
+    @asyncSlot()
+    async def export_session_to_markdown(self, item: QListWidgetItem) -> None:
         """Exports a session to a Markdown file."""
-        sess_id = item.data(Qt.ItemDataRole.UserRole)
+        from gemini_agent.core.exporter import TITLE_TRANS, Exporter
+
+        sess_id = self._session_id_of(item)
         session = self.session_manager.get_session(sess_id)
         if not session:
             return
 
-        safe_title = "".join(
-            [c for c in session.title if c.isalnum() or c in (" ", "_")]
-        ).rstrip()
+        safe_title = session.title.translate(TITLE_TRANS).rstrip()
         default_name = f"{safe_title}.md"
         file_path, _ = QFileDialog.getSaveFileName(self, "Export Session", default_name, "Markdown Files (*.md)")
 
         if file_path:
-            if Exporter.export_to_file(session, Path(file_path)):
+            if await asyncio.to_thread(Exporter.export_to_file, session, Path(file_path)):
                 QMessageBox.information(self, "Export Successful", f"Session exported to {file_path}")
             else:
                 QMessageBox.critical(self, "Export Failed", "Failed to export session.")
 
-    def backup_history(self) -> None:
+    @asyncSlot()
+    async def backup_history(self) -> None:
         """Creates a backup of all chat history."""
+        from gemini_agent.core.exporter import Exporter
+
         file_path, _ = QFileDialog.getSaveFileName(self, "Backup History", "conductor_backup.zip", "ZIP Files (*.zip)")
         if file_path:
-            if Exporter.create_backup(self.session_manager.get_all_sessions(), Path(file_path)):
-                QMessageBox.information(self, "Backup Successful", f"History backed up to {file_path}")
+            # Snapshot the mapping so sessions created mid-backup can't break iteration
+            sessions = dict(self.session_manager.get_all_sessions())
+            written = await asyncio.to_thread(Exporter.create_backup, sessions, Path(file_path))
+            if written:
+                QMessageBox.information(self, "Backup Successful", f"History backed up to {written}")
             else:
                 QMessageBox.critical(self, "Backup Failed", "Failed to create backup.")
 
-    def restore_history(self) -> None:
+    @asyncSlot()
+    async def restore_history(self) -> None:
         """Restores chat history from a backup file."""
-        file_path, _ = QFileDialog.getOpenFileName(self, "Restore History", "", "ZIP Files (*.zip)")
+        from gemini_agent.core.exporter import Exporter
+
+        file_path, _ = QFileDialog.getOpenFileName(self, "Restore History", "", "Backups (*.zip *.zip.zst)")
         if file_path:
-            sessions = Exporter.restore_backup(Path(file_path))
+            sessions = await asyncio.to_thread(Exporter.restore_backup, Path(file_path))
             if sessions:
                 reply = QMessageBox.question(
                     self,
@@ -742,8 +1301,9 @@ class GeminiBrowser(QMainWindow):
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 )
                 if reply == QMessageBox.StandardButton.Yes:
-                    self.session_manager.sessions = sessions
-                    self.session_manager.save_history()
+                    self.session_manager.replace_sessions(sessions)
+                    # Write the restored history off the UI thread before confirming it
+                    await asyncio.to_thread(self.session_manager.save_history, sync=True)
                     self.update_sidebar()
                     self.create_new_session()
                     QMessageBox.information(self, "Restore Successful", "History restored successfully.")
@@ -752,53 +1312,78 @@ class GeminiBrowser(QMainWindow):
 
     def open_settings(self) -> None:
         """Opens the settings dialog."""
-        settings_dialog = SettingsDialog(self, self.app_config._config)
-        settings_dialog.exec()
+        if self._settings_dialog is None:
+            from gemini_agent.ui.settings_dialog import SettingsDialog
+
+            self._settings_dialog = SettingsDialog(self, self.app_config._config)
+        else:
+            self._settings_dialog.load(self.app_config._config)
+        self._settings_dialog.exec()
         self.app_config.save()
         self.header.set_mode(self.app_config.get("use_search", False))
-        self.apply_theme()
+        # The dialog applies theme switches live; re-polishing every widget again is only
+        # needed if the saved theme still differs from the one on screen
+        if self.app_config.theme != self._theme_mode:
+            self.apply_theme()
 
     def open_conductor(self) -> None:
         """Opens the conductor orchestrator dialog."""
-        dialog = ConductorDialog(self, self.conductor_manager)
-        dialog.exec()
+        if self._conductor_dialog is None:
+            from gemini_agent.ui.conductor_dialog import ConductorDialog
+
+            self._conductor_dialog = ConductorDialog(self, self.conductor_manager)
+        else:
+            self._conductor_dialog.load(self.conductor_manager)
+        self._conductor_dialog.exec()
 
     def open_plugins(self) -> None:
         """Opens the plugin management dialog."""
-        dialog = PluginDialog(self.extension_manager, self, self.app_config.theme)
-        dialog.exec()
+        if self._plugin_dialog is None:
+            from gemini_agent.ui.plugin_dialog import PluginDialog
+
+            self._plugin_dialog = PluginDialog(self.extension_manager, self, self._theme_mode)
+        else:
+            self._plugin_dialog.load(self._theme_mode)
+        self._plugin_dialog.exec()
+        self.conductor_manager.invalidate_cache()
 
     @asyncSlot()
     async def send_message(self) -> None:
         """Sends the user message to the AI model."""
+        # document().isEmpty() is O(1); skip copying the buffer out when there is nothing to send
+        if self.input_field.document().isEmpty() and not self.attachment_manager.has_attachments():
+            return
         prompt = self.input_field.toPlainText().strip()
-        if not prompt and not self.attachment_manager.get_attachments():
+        if not prompt and not self.attachment_manager.has_attachments():
             return
 
         # Handle special commands
-        if prompt.startswith("/search "):
-            query = prompt[8:].strip()
-            await self._perform_semantic_search(query)
-            self.input_field.clear()
-            return
+        if prompt.startswith("/"):
+            command, _, argument = prompt.partition(" ")
+            handler = self._SLASH_COMMANDS.get(command)
+            if handler and argument:
+                await getattr(self, handler)(argument.strip())
+                self.input_field.clear()
+                return
 
         self._start_worker(prompt)
         self.input_field.clear()
 
-        # Index user prompt
-        session_id = self.session_manager.current_session_id
-        session = self.session_manager.get_session(session_id)
-        if session:
-            doc_id = f"{session_id}_{len(session.messages)}_user"
-            self.vector_store.add_documents(
-                documents=[prompt], metadatas=[{"session_id": session_id, "role": "user"}], ids=[doc_id]
-            )
+        # Index user prompt alongside responses in the controller's batched queue
+        self.controller.queue_for_indexing(self.session_manager.current_session_id, prompt, role=_USER_ROLE)
 
     async def _perform_semantic_search(self, query: str):
         """Performs a semantic search and displays results in the chat."""
-        self.messages_layout.addWidget(
-            MessageBubble(f"🔍 Searching for: {query}", is_user=True, theme_mode=self.app_config.theme)
-        )
+        self._add_bubble(f"🔍 Searching for: {query}", is_user=True, history=False)
+
+        if self.vector_store is None:
+            notice = "Vector store is still initializing… try again in a moment."
+            self._add_bubble(notice, is_user=False, history=False)
+            self.scroll_to_bottom()
+            return
+
+        # Make recently sent messages searchable before querying
+        await self.controller.flush_index_queue()
 
         results = self.vector_store.query(query)
         docs = results.get("documents", [[]])[0]
@@ -806,9 +1391,12 @@ class GeminiBrowser(QMainWindow):
         if not docs:
             response = "No relevant information found in vector cache."
         else:
-            response = "**Semantic Search Results:**\n\n" + "\n\n---\n\n".join(docs)
+            limit = self.SEARCH_RESULT_MAX_CHARS
+            response = "**Semantic Search Results:**\n\n" + "\n\n---\n\n".join(
+                doc if len(doc) <= limit else doc[:limit] + "…" for doc in docs
+            )
 
-        self.messages_layout.addWidget(MessageBubble(response, is_user=False, theme_mode=self.app_config.theme))
+        self._add_bubble(response, is_user=False, history=False)
         self.scroll_to_bottom()
 
     def _start_worker(self, prompt: str, system_instruction_override: str | None = None) -> None:
@@ -816,90 +1404,88 @@ class GeminiBrowser(QMainWindow):
         attachments = self.attachment_manager.get_attachments()
 
         display_text = prompt + (f" [Files: {len(attachments)}]" if attachments else "")
-        self.messages_layout.addWidget(MessageBubble(display_text, is_user=True, theme_mode=self.app_config.theme))
+        self._add_bubble(display_text, is_user=True)
         self.scroll_to_bottom()
 
-        self.status_widget = StatusWidget()
+        self._pending_status = None
         self.status_widget.set_status("Gemini is thinking...")
         self.status_widget.start_loading()
         self.messages_layout.addWidget(self.status_widget)
+        self.status_widget.show()
 
         self.controller.send_message(prompt, system_instruction_override)
 
     def on_terminal_output(self, text: str, output_type: str) -> None:
         """Handles terminal output from the worker."""
-        if output_type == "error":
-            self.terminal.append_error(text)
-        elif output_type == "success":
-            self.terminal.append_success(text)
-        elif output_type == "info":
-            self.terminal.append_info(text)
-        else:
-            self.terminal.append_text(text)
+        self._terminal_appenders.get(output_type, self.terminal.append_text)(text)
 
     def show_tool_confirmation(self, tool_name: str, args: dict, confirmation_id: str) -> None:
         """Shows a confirmation dialog for dangerous tool execution."""
-        dialog = DeepReviewDialog(tool_name, args, parent=self, theme_mode=self.app_config.theme)
-        result = dialog.exec()
+        from gemini_agent.ui.deep_review import DeepReviewDialog
+
+        dialog = DeepReviewDialog(tool_name, args, parent=self, theme_mode=self._theme_mode)
+        # Window-modal without a nested event loop; the answer arrives through finished
+        dialog.finished.connect(lambda code: self._on_confirm_dialog_finished(code, dialog, confirmation_id))
+        dialog.open()
+
+    def _on_confirm_dialog_finished(self, result: int, dialog: QDialog, confirmation_id: str) -> None:
+        """Forwards the user's decision on a tool confirmation to the worker."""
         allowed = result == QDialog.DialogCode.Accepted
         # Pass modified args if approved
         modified_args = dialog.get_args() if allowed else None
         self.controller.confirm_tool(confirmation_id, allowed, modified_args)
+        dialog.deleteLater()
+
+    def _hide_status(self) -> None:
+        """Stops the status animation and takes the status widget out of the chat layout."""
+        self.status_widget.stop_loading()
+        self.status_widget.hide()
+        self.messages_layout.removeWidget(self.status_widget)
 
     def on_response_success(self, text: str) -> None:
         """Handles successful AI response."""
-        if self.status_widget:
-            self.status_widget.stop_loading()
-            self.status_widget.deleteLater()
-            self.status_widget = None
-
-        self.messages_layout.addWidget(MessageBubble(text, is_user=False, theme_mode=self.app_config.theme))
+        self._hide_status()
+        self._add_bubble(text, is_user=False)
         self.scroll_to_bottom()
 
         self._update_attachment_ui()
 
     def on_response_error(self, err: str) -> None:
         """Handles AI response error."""
-        if self.status_widget:
-            self.status_widget.stop_loading()
-            self.status_widget.deleteLater()
-            self.status_widget = None
-
-        self.messages_layout.addWidget(
-            MessageBubble(f"**Error:** {err}", is_user=False, theme_mode=self.app_config.theme)
-        )
+        self._hide_status()
+        self._add_bubble(f"**Error:** {err}", is_user=False, history=False)
         self.scroll_to_bottom()
 
     def on_status_update(self, status_message: str) -> None:
-        """Updates the status widget with the latest worker status."""
-        if self.status_widget:
-            try:
-                self.status_widget.set_status(status_message)
-            except RuntimeError:
-                # Handle case where C++ object is deleted but Python reference remains
-                self.status_widget = None
+        """Records the latest worker status; the status widget is repainted at most once per interval."""
+        self._pending_status = status_message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self) -> None:
+        """Shows the most recent pending status and rate limit in the status widget."""
+        status_message, self._pending_status = self._pending_status, None
+        if status_message is not None:
+            self.status_widget.set_status(status_message)
+        rate_limit, self._pending_rate_limit = self._pending_rate_limit, None
+        if rate_limit is not None:
+            self.status_widget.update_rate_limit(*rate_limit)
 
     def on_usage_updated(self, session_id: str, input_tokens: int, output_tokens: int) -> None:
-        """Updates the session usage data."""
+        """Updates the session usage data and schedules a usage display refresh."""
         self.session_manager.update_session_usage(session_id, input_tokens, output_tokens)
-        if session_id == self.session_manager.current_session_id:
-            self._refresh_usage_display()
+        if session_id == self.session_manager.current_session_id and not self._usage_timer.isActive():
+            self._usage_timer.start()
 
     def on_rate_limit_updated(self, model_id: str, remaining: int, limit: int) -> None:
-        """Updates the rate limit indicator in the status widget."""
-        if self.status_widget:
-            try:
-                self.status_widget.update_rate_limit(remaining, limit)
-            except RuntimeError:
-                self.status_widget = None
+        """Records the latest rate limit; it is shown with the next status flush."""
+        self._pending_rate_limit = (remaining, limit)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
     def _refresh_usage_display(self) -> None:
         """Refreshes the usage display in the header."""
-        session_id = self.session_manager.current_session_id
-        if not session_id:
-            return
-
-        session = self.session_manager.get_session(session_id)
+        session = self.session_manager.current_session
         if not session:
             return
 
@@ -909,33 +1495,45 @@ class GeminiBrowser(QMainWindow):
         sess_config = session.config
         model_id = sess_config.get("model", self.app_config.model)
 
-        pricing = ModelRegistry.MODEL_PRICING.get(model_id, (0.0, 0.0))
-        input_cost = (usage.input_tokens / 1_000_000) * pricing[0]
-        output_cost = (usage.output_tokens / 1_000_000) * pricing[1]
-        total_cost = input_cost + output_cost
+        total_cost = ModelRegistry.estimate_cost(model_id, usage.input_tokens, usage.output_tokens)
 
+        # Label repaints dominate this path; skip them when nothing visible changed
+        shown = (usage.total_tokens, total_cost)
+        if shown == self._usage_shown:
+            return
+        self._usage_shown = shown
         self.header.update_usage(usage.total_tokens, total_cost)
 
     def scroll_to_bottom(self) -> None:
-        """Scrolls the chat area to the bottom."""
-        QApplication.processEvents()
-        self.scroll_area.verticalScrollBar().setValue(self.scroll_area.verticalScrollBar().maximum())
+        """Scrolls the chat area to the bottom once the pending layout pass has run."""
+        # Many bubbles added in one tick share a single scroll and trim
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(0, self._do_scroll_bottom)
+
+    def _do_scroll_bottom(self) -> None:
+        """Moves the chat scroll bar to its maximum and releases bubbles beyond the live window."""
+        self._scroll_pending = False
+        self._vbar.setValue(self._vbar.maximum())
+        self._trim_live_bubbles()
 
     def closeEvent(self, event: Any) -> None:
         """Handles the window close event."""
-        self.controller.stop_worker()
+        self.controller.stop_worker(wait=True)
+        if self._index_cancel is not None:
+            self._index_cancel.set()
+        self.controller.drain_index_queue()
+        if self.vector_store is not None:
+            self.vector_store.flush()
+        # Throttled history saves run on daemon threads that would die with the process
+        self.session_manager.flush()
         self.attachment_manager.cleanup()
         event.accept()
 
 
 def main() -> None:
     """Main entry point for the Gemini CLI."""
-    if sys.platform != "win32":
-        try:
-            multiprocessing.set_start_method("spawn", force=True)
-        except RuntimeError:
-            pass
-
     parser = argparse.ArgumentParser(description="Gemini Agent CLI")
     subparsers = parser.add_subparsers(dest="command")
 
@@ -967,9 +1565,9 @@ def main() -> None:
     args = parser.parse_args()
 
     extension_mgr = ExtensionManager()
-    extension_mgr.discover_plugins()
 
     if args.command == "extension":
+        extension_mgr.discover_plugins()
         if args.ext_command == "list":
             print(json.dumps(extension_mgr.list_extensions(), indent=2))
         elif args.ext_command == "install-plugin":
@@ -982,6 +1580,19 @@ def main() -> None:
             print(extension_mgr.remove_mcp_server(args.name))
         sys.exit(0)
 
+    _launch_gui(extension_mgr)
+
+
+def _launch_gui(extension_mgr: ExtensionManager) -> None:
+    """Builds the services and main window, then runs the Qt event loop."""
+    from PyQt6.QtWidgets import QApplication
+    from qasync import QEventLoop
+
+    from gemini_agent.core.checkpoint_manager import CheckpointManager
+    from gemini_agent.core.conductor_manager import ConductorManager
+    from gemini_agent.core.indexer import Indexer
+    from gemini_agent.core.vector_store import VectorStore
+
     app = QApplication(sys.argv)
 
     # Initialize qasync event loop
@@ -994,9 +1605,7 @@ def main() -> None:
     session_mgr = SessionManager(AppConfig.HISTORY_FILE)
     attachment_mgr = AttachmentManager()
     conductor_mgr = ConductorManager(extension_path=config.conductor_path)
-    indexer = Indexer(root_dir=".")
     checkpoint_mgr = CheckpointManager()
-    vector_store = VectorStore()
     recent_mgr = RecentManager()
 
     # Inject into main window
@@ -1006,15 +1615,36 @@ def main() -> None:
         session_mgr,
         attachment_mgr,
         conductor_mgr,
-        indexer,
+        None,
         extension_mgr,
         checkpoint_mgr,
-        vector_store,
+        None,
         recent_mgr,
     )
     window.show()
 
+    async def _attach_services() -> None:
+        # Plugin discovery, loading the symbol cache and opening Chroma are slow, so they run after first paint
+        # Each service is attached or logged on its own, so one failure doesn't cost the others
+        plugins, indexer, vector_store = await asyncio.gather(
+            asyncio.to_thread(extension_mgr.discover_plugins),
+            asyncio.to_thread(Indexer, root_dir="."),
+            asyncio.to_thread(VectorStore),
+            return_exceptions=True,
+        )
+        if isinstance(plugins, Exception):
+            logger.error(f"Failed to discover plugins: {plugins}")
+        if isinstance(indexer, Exception):
+            logger.error(f"Failed to initialize indexer: {indexer}")
+        else:
+            window.attach_indexer(indexer)
+        if isinstance(vector_store, Exception):
+            logger.error(f"Failed to initialize vector store: {vector_store}")
+        else:
+            window.attach_vector_store(vector_store)
+
     with loop:
+        loop.create_task(_attach_services())
         loop.run_forever()
 
 
@@ -1,9 +1,15 @@
+import functools
 import json
 import logging
 from pathlib import Path
 
 from fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder serves the logs resource without it
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -13,22 +19,43 @@ mcp = FastMCP("GeminiAgent")
 # --- MCP Resources ---
 
 
+@functools.lru_cache(maxsize=1)
+def _load_history(path: str, mtime_ns: int) -> dict:
+    """Parses the history file; keyed on its mtime so it is only re-read after a save."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=64)
+def _session_logs(path: str, mtime_ns: int, session_id: str) -> str | None:
+    """Serializes one session's messages from the cached history, or None if it is missing."""
+    session = _load_history(path, mtime_ns).get(session_id)
+    if not session:
+        return None
+    messages = session.get("messages", [])
+    if orjson is not None:
+        return orjson.dumps(messages, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(messages, indent=2, ensure_ascii=False)
+
+
 @mcp.resource("agent://logs/{session_id}")
 def get_session_logs(session_id: str) -> str:
     """Exposes the chat history for a specific session."""
     history_file = Path("history.json")
-    if not history_file.exists():
+    try:
+        mtime_ns = history_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return "No history found."
 
     try:
-        with open(history_file, encoding="utf-8") as f:
-            history = json.load(f)
-            session = history.get(session_id)
-            if not session:
-                return f"Session {session_id} not found."
-            return json.dumps(session.get("messages", []), indent=2)
+        logs = _session_logs(str(history_file), mtime_ns, session_id)
     except Exception as e:
         return f"Error reading history: {e}"
+    if logs is None:
+        return f"Session {session_id} not found."
+    return logs
 
 
 @mcp.resource("agent://attachments")
@@ -62,10 +89,9 @@ def register_mcp_tool(func):
     try:
         # FastMCP tool decorator can be used as a function
         mcp.tool()(func)
-        # logger.info(f"Registered MCP tool: {func.__name__}")
-    except Exception:
-        # logger.error(f"Failed to register MCP tool {func.__name__}: {e}")
-        pass
+    except (TypeError, ValueError) as e:
+        # Signatures FastMCP can't describe stay local-only tools instead of breaking the import
+        logger.warning(f"Failed to register MCP tool {func.__name__}: {e}")
     return func
 
 
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+import heapq
+from collections.abc import Iterable
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -37,6 +39,11 @@ class Sidebar(QFrame):
         self.sessions: Dict[str, Session] = {}
         self.recent_items: List[dict] = []
         self.current_session_id: Optional[str] = None
+        # (timestamp, lowercased name, entry) rows, newest first; each rebuilt lazily after changes
+        self._chat_rows: list[tuple[str, str, dict]] | None = None
+        self._recent_rows: list[tuple[str, str, dict]] | None = None
+        self._sorted_index: list[tuple[str, str, dict]] | None = None
+        self._filter_text = ""
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -74,61 +81,107 @@ class Sidebar(QFrame):
         """
         Populates the sidebar with session items.
         """
+        # Read-only view of the SessionManager's dict; the manager makes every write
         self.sessions = sessions
         self.current_session_id = current_session_id
+        self._chat_rows = None
         self.filter_items(self.search_input.text())
 
     def update_recent_items(self, items: List[dict]) -> None:
         """Updates the list of recent files/folders."""
         self.recent_items = items
+        self._recent_rows = None
         self.filter_items(self.search_input.text())
 
     def filter_items(self, text: str) -> None:
         """
         Filters and displays sessions and recent items.
         """
-        self.chat_list.clear()
         text = text.lower()
+        # Starting or clearing a search re-reads activity, so chats with new messages move up;
+        # keystrokes within a search reuse the sorted index
+        if not text or not self._filter_text:
+            self._chat_rows = None
+        self._filter_text = text
+
+        matches = [entry for _, name, entry in self._search_index() if not text or text in name]
+        self.recent_widget.update_items(matches)
 
-        combined_items = []
-
-        # Add Chats
-        for sess_id, session in self.sessions.items():
-            if text and text not in session.title.lower():
-                continue
-            
-            # Use last message timestamp or creation date
-            last_activity = session.created_at
-            if session.messages:
-                last_activity = session.messages[-1].timestamp
-                
-            combined_items.append({
-                "name": session.title,
-                "id": sess_id,
-                "type": "chat",
-                "timestamp": last_activity
-            })
-
-        # Add Recent Files/Folders
-        for item in self.recent_items:
-            if text and text not in item["name"].lower():
-                continue
-            combined_items.append(item)
-
-        # Sort everything by timestamp
-        combined_items.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-
-        # Update the RecentWidget
-        self.recent_widget.update_items(combined_items)
-        
         # Highlight current session
-        if self.current_session_id:
-            for i in range(self.chat_list.count()):
-                item = self.chat_list.item(i)
-                data = item.data(Qt.ItemDataRole.UserRole)
-                if data and data.get("type") == "chat" and data.get("id") == self.current_session_id:
-                    self.chat_list.setCurrentItem(item)
-                    break
+        self.set_current(self.current_session_id)
+
+    def _search_index(self) -> list[tuple[str, str, dict]]:
+        """Returns chats and recent items sorted newest first, rebuilding whichever side changed."""
+        if self._chat_rows is None:
+            self._chat_rows = self._sorted_rows(
+                self._chat_entry(sess_id, session) for sess_id, session in self.sessions.items()
+            )
+            self._sorted_index = None
+        if self._recent_rows is None:
+            self._recent_rows = self._sorted_rows(self.recent_items)
+            self._sorted_index = None
+        if self._sorted_index is None:
+            # Both sides are already sorted, so a linear merge replaces a full re-sort
+            self._sorted_index = list(heapq.merge(self._chat_rows, self._recent_rows, key=itemgetter(0), reverse=True))
+        return self._sorted_index
+
+    @staticmethod
+    def _sorted_rows(entries: Iterable[dict]) -> list[tuple[str, str, dict]]:
+        """Builds (timestamp, lowercased name, entry) rows sorted newest first."""
+        rows = [(entry.get("timestamp", ""), entry["name"].lower(), entry) for entry in entries]
+        rows.sort(key=itemgetter(0), reverse=True)
+        return rows
+
+    @staticmethod
+    def _chat_entry(session_id: str, session: Session) -> dict:
+        """Builds the RecentWidget item describing a chat session."""
+        # Use last message timestamp or creation date
+        last_activity = session.created_at
+        if session.messages:
+            last_activity = session.messages[-1].timestamp
+
+        return {
+            "name": session.title,
+            "id": session_id,
+            "type": "chat",
+            "timestamp": last_activity
+        }
+
+    def add_session(self, session_id: str, session: Session) -> None:
+        """Adds the row of a session the SessionManager just created, without rebuilding the rest of the list."""
+        self._chat_rows = None
+        if self.search_input.text():
+            # The row may not match the active search; let the filter decide
+            self.filter_items(self.search_input.text())
+            return
+        self.recent_widget.insert_item(self._chat_entry(session_id, session))
+
+    def remove_session(self, session_id: str) -> None:
+        """Removes the row of a session the SessionManager just deleted."""
+        self._chat_rows = None
+        row = self.recent_widget.row_of("chat", session_id)
+        if row >= 0:
+            self.chat_list.takeItem(row)
+
+    def rename_session(self, session_id: str, title: str) -> None:
+        """Updates the title shown for a session in place."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return
+        self._chat_rows = None
+        if self.search_input.text():
+            self.filter_items(self.search_input.text())
+            return
+        row = self.recent_widget.row_of("chat", session_id)
+        if row >= 0:
+            self.recent_widget.set_item(row, {**self._chat_entry(session_id, session), "name": title})
+
+    def set_current(self, session_id: str | None) -> None:
+        """Marks the given session as the current one."""
+        self.current_session_id = session_id
+        row = self.recent_widget.row_of("chat", session_id) if session_id else -1
+        if row >= 0:
+            self.chat_list.setCurrentRow(row)
 
     def _handle_item_selected(self, path_or_id: str, item_type: str):
         """Handles item selection from the RecentWidget."""
@@ -180,8 +233,21 @@ class ChatHeader(QWidget):
     settings_requested = pyqtSignal()
     terminal_toggle_requested = pyqtSignal()
 
+    # Mode indicator (text, stylesheet) pairs, built once rather than per set_mode call
+    _MODE_SEARCH = (
+        "🔍 Web Search",
+        "color: #ff9800; font-size: 12px; padding: 4px 8px;"
+        " background-color: rgba(255, 152, 0, 0.1); border-radius: 4px;",
+    )
+    _MODE_LOCAL = (
+        "🔧 Local Tools",
+        "color: #0B57D0; font-size: 12px; padding: 4px 8px;"
+        " background-color: rgba(11, 87, 208, 0.1); border-radius: 4px;",
+    )
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        self._use_search = False
         self.init_ui()
 
     def init_ui(self) -> None:
@@ -190,6 +256,7 @@ class ChatHeader(QWidget):
         layout.setContentsMargins(15, 10, 20, 0)
 
         self.btn_toggle_sidebar = QPushButton("≡")
+        self.btn_toggle_sidebar.setObjectName("BtnToggleSidebar")
         self.btn_toggle_sidebar.setFixedSize(40, 40)
         self.btn_toggle_sidebar.setCursor(Qt.CursorShape.PointingHandCursor)
         self.btn_toggle_sidebar.clicked.connect(self.toggle_sidebar_requested.emit)
@@ -202,10 +269,9 @@ class ChatHeader(QWidget):
 
         layout.addSpacing(15)
 
-        self.mode_indicator = QLabel("🔧 Local Tools")
-        self.mode_indicator.setStyleSheet(
-            "color: #0B57D0; font-size: 12px; padding: 4px 8px; background-color: rgba(11, 87, 208, 0.1); border-radius: 4px;"
-        )
+        text, qss = self._MODE_LOCAL
+        self.mode_indicator = QLabel(text)
+        self.mode_indicator.setStyleSheet(qss)
         layout.addWidget(self.mode_indicator)
 
         # Usage Label - Increased font size to 13px
@@ -241,16 +307,13 @@ class ChatHeader(QWidget):
         """
         Updates the mode indicator (Web Search vs Local Tools).
         """
-        if use_search:
-            self.mode_indicator.setText("🔍 Web Search")
-            self.mode_indicator.setStyleSheet(
-                "color: #ff9800; font-size: 12px; padding: 4px 8px; background-color: rgba(255, 152, 0, 0.1); border-radius: 4px;"
-            )
-        else:
-            self.mode_indicator.setText("🔧 Local Tools")
-            self.mode_indicator.setStyleSheet(
-                "color: #0B57D0; font-size: 12px; padding: 4px 8px; background-color: rgba(11, 87, 208, 0.1); border-radius: 4px;"
-            )
+        # Re-applying the same stylesheet would still make Qt re-parse and re-polish it
+        if use_search == self._use_search:
+            return
+        self._use_search = use_search
+        text, qss = self._MODE_SEARCH if use_search else self._MODE_LOCAL
+        self.mode_indicator.setText(text)
+        self.mode_indicator.setStyleSheet(qss)
 
     def update_usage(self, total_tokens: int, estimated_cost: float) -> None:
         """
@@ -1,3 +1,5 @@
+import functools
+import os
 from pathlib import Path
 
 from PyQt6.QtCore import Qt
@@ -6,7 +8,6 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QTabWidget,
@@ -16,6 +17,43 @@ from PyQt6.QtWidgets import (
 )
 
 
+@functools.cache
+def _conductor_qss(theme_mode: str) -> str:
+    """Builds the conductor dialog stylesheet for a theme; there are only two, so each is built once."""
+    is_dark = theme_mode == "Dark"
+    bg = "#1E1F20" if is_dark else "#FFFFFF"
+    fg = "#E3E3E3" if is_dark else "#000000"
+    input_bg = "#282A2C" if is_dark else "#F0F0F0"
+
+    return f"""
+        QDialog {{ background-color: {bg}; color: {fg}; }}
+        QLabel {{ color: {fg}; }}
+        QTextEdit, QListWidget {{
+            background-color: {input_bg}; color: {fg}; border: 1px solid #444; padding: 5px;
+            font-family: 'Consolas', 'Monaco', monospace;
+        }}
+        QPushButton {{
+            background-color: {"#2D2E30" if is_dark else "#E0E0E0"};
+            color: {fg};
+            border: 1px solid {"#444" if is_dark else "#CCC"};
+            border-radius: 4px;
+            padding: 8px 16px;
+        }}
+        QPushButton:hover {{ background-color: {"#3C4043" if is_dark else "#D0D0D0"}; }}
+        QTabBar::tab {{
+            background: {"#2D2E30" if is_dark else "#E0E0E0"};
+            color: {fg};
+            padding: 8px 12px;
+            border-top-left-radius: 4px;
+            border-top-right-radius: 4px;
+        }}
+        QTabBar::tab:selected {{
+            background: {"#0B57D0" if is_dark else "#1A73E8"};
+            color: white;
+        }}
+    """
+
+
 class ConductorDialog(QDialog):
     """
     Dialog for managing Conductor files and commands.
@@ -96,14 +134,21 @@ class ConductorDialog(QDialog):
 
         self.load_files()
 
+    def load(self, conductor_manager):
+        """Re-reads commands, files and theme so a kept instance can be shown again."""
+        # Settings may have swapped the manager for another extension path
+        self.conductor_manager = conductor_manager
+        self.refresh_commands()
+        self.load_files()
+        self.apply_theme()
+
     def refresh_commands(self):
         """Refreshes the list of available conductor commands."""
         self.cmd_list.clear()
         commands = self.conductor_manager.get_available_commands()
-        for cmd in commands:
-            item = QListWidgetItem(cmd.capitalize())
-            item.setData(Qt.ItemDataRole.UserRole, cmd)
-            self.cmd_list.addItem(item)
+        self.cmd_list.addItems([cmd.capitalize() for cmd in commands])
+        for row, cmd in enumerate(commands):
+            self.cmd_list.item(row).setData(Qt.ItemDataRole.UserRole, cmd)
 
     def load_files(self):
         """Loads conductor files from the project directory."""
@@ -116,12 +161,22 @@ class ConductorDialog(QDialog):
             "workflow.md": self.workflow_edit,
         }
 
+        # One directory listing instead of an exists() stat per file
+        try:
+            with os.scandir(conductor_dir) as entries:
+                present = {entry.name: entry for entry in entries if entry.is_file()}
+        except OSError:
+            present = {}
+
         for filename, edit in files.items():
             file_path = conductor_dir / filename
-            if file_path.exists():
+            # Case-insensitive filesystems also resolve e.g. Product.md, which the listing lookup misses
+            entry = present.get(filename) or (file_path if file_path.is_file() else None)
+            if entry is not None:
                 try:
-                    with open(file_path, encoding="utf-8") as f:
-                        edit.setText(f.read())
+                    # Empty files need no read
+                    text = file_path.read_text(encoding="utf-8") if entry.stat().st_size else ""
+                    edit.setText(text)
                 except Exception as e:
                     edit.setText(f"Error loading {filename}: {e}")
             else:
@@ -141,9 +196,7 @@ class ConductorDialog(QDialog):
 
         try:
             for filename, content in files.items():
-                file_path = conductor_dir / filename
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+                (conductor_dir / filename).write_text(content, encoding="utf-8")
             QMessageBox.information(self, "Success", "Conductor files saved successfully.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save files: {e}")
@@ -176,36 +229,4 @@ class ConductorDialog(QDialog):
 
     def apply_theme(self):
         """Applies the current application theme to the dialog."""
-        theme = self.main_window.app_config.theme
-        is_dark = theme == "Dark"
-        bg = "#1E1F20" if is_dark else "#FFFFFF"
-        fg = "#E3E3E3" if is_dark else "#000000"
-        input_bg = "#282A2C" if is_dark else "#F0F0F0"
-
-        self.setStyleSheet(f"""
-            QDialog {{ background-color: {bg}; color: {fg}; }}
-            QLabel {{ color: {fg}; }}
-            QTextEdit, QListWidget {{ 
-                background-color: {input_bg}; color: {fg}; border: 1px solid #444; padding: 5px;
-                font-family: 'Consolas', 'Monaco', monospace;
-            }}
-            QPushButton {{
-                background-color: {"#2D2E30" if is_dark else "#E0E0E0"};
-                color: {fg};
-                border: 1px solid {"#444" if is_dark else "#CCC"};
-                border-radius: 4px;
-                padding: 8px 16px;
-            }}
-            QPushButton:hover {{ background-color: {"#3C4043" if is_dark else "#D0D0D0"}; }}
-            QTabBar::tab {{
-                background: {"#2D2E30" if is_dark else "#E0E0E0"};
-                color: {fg};
-                padding: 8px 12px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }}
-            QTabBar::tab:selected {{
-                background: {"#0B57D0" if is_dark else "#1A73E8"};
-                color: white;
-            }}
-        """)
+        self.setStyleSheet(_conductor_qss(self.main_window.app_config.theme))
@@ -1,14 +1,17 @@
+import contextlib
+import functools
 import json
 import os
 
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import QObject, QPoint, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QTextCursor
 from PyQt6.QtWidgets import (
     QDialog,
     QHBoxLayout,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QTabWidget,
     QTextEdit,
@@ -19,6 +22,160 @@ from PyQt6.QtWidgets import (
 from gemini_agent.core.review_engine import ReviewEngine
 from gemini_agent.ui.widgets import GeminiHighlighter
 
+# Larger payloads (in characters) are shown a chunk at a time and are not diffed inline
+MAX_INLINE_CHARS = 256_000
+# Combined size above which only the head and tail of the diff are rendered
+MAX_FULL_DIFF_CHARS = 200_000
+# Quiet period after a save before the proposed source is re-analyzed
+REVIEW_DEBOUNCE_MS = 300
+
+# Highlighter language per file extension; anything else is treated as Python
+_EXT_TO_LANG = {
+    ".js": "javascript",
+    ".html": "html",
+    ".css": "css",
+    ".json": "json",
+    ".md": "markdown",
+    ".sh": "bash",
+    ".py": "python",
+}
+
+
+@functools.cache
+def _review_qss(theme_mode: str) -> str:
+    """Builds the deep review stylesheet for a theme; there are only two, so each is built once."""
+    is_dark = theme_mode == "Dark"
+    bg = "#1E1F20" if is_dark else "#FFFFFF"
+    fg = "#E3E3E3" if is_dark else "#000000"
+    input_bg = "#282A2C" if is_dark else "#F0F4F9"
+    tab_bg = "#131314" if is_dark else "#F0F4F9"
+
+    return f"""
+        QDialog {{
+            background-color: {bg};
+            color: {fg};
+        }}
+        QLabel, QListWidget {{
+            color: {fg};
+        }}
+        QTextEdit, QPlainTextEdit, QListWidget {{
+            background-color: {input_bg};
+            color: {fg};
+            border: 1px solid {"#444" if is_dark else "#CCC"};
+            border-radius: 8px;
+            padding: 5px;
+        }}
+        QTabWidget::pane {{
+            border: 1px solid {"#444" if is_dark else "#CCC"};
+            background-color: {tab_bg};
+        }}
+        QTabBar::tab {{
+            background-color: {"#2D2E30" if is_dark else "#E0E0E0"};
+            color: {fg};
+            padding: 8px 12px;
+            border-top-left-radius: 4px;
+            border-top-right-radius: 4px;
+            margin-right: 2px;
+        }}
+        QTabBar::tab:selected {{
+            background-color: {input_bg};
+            border: 1px solid {"#444" if is_dark else "#CCC"};
+            border-bottom-color: {input_bg};
+        }}
+        QPushButton#RejectButton {{
+            background-color: {"#442a2a" if is_dark else "#ffcccc"};
+            color: {"#ffa3a3" if is_dark else "#cc0000"};
+            border: 1px solid {"#663333" if is_dark else "#ff9999"};
+            border-radius: 4px;
+            padding: 8px 20px;
+            font-weight: bold;
+        }}
+        QPushButton#RejectButton:hover {{
+            background-color: {"#553333" if is_dark else "#ffb3b3"};
+        }}
+        QPushButton#ApproveButton {{
+            background-color: {"#1e3a1e" if is_dark else "#ccffcc"};
+            color: {"#afffbe" if is_dark else "#006600"};
+            border: 1px solid {"#336633" if is_dark else "#99ff99"};
+            border-radius: 4px;
+            padding: 8px 20px;
+            font-weight: bold;
+        }}
+        QPushButton#ApproveButton:hover {{
+            background-color: {"#2a4a2a" if is_dark else "#b3ffb3"};
+        }}
+        QPushButton#SourceButton {{
+            background-color: {"#333" if is_dark else "#EEE"};
+            color: {fg};
+            border: 1px solid {"#555" if is_dark else "#CCC"};
+            border-radius: 4px;
+            padding: 5px;
+        }}
+        QPushButton#SaveButton {{
+            background-color: {"#333" if is_dark else "#EEE"};
+            color: {fg};
+            border: 1px solid {"#555" if is_dark else "#CCC"};
+            border-radius: 4px;
+            padding: 8px 20px;
+            font-weight: bold;
+        }}
+        QPushButton#SaveButton:hover {{
+            background-color: {"#444" if is_dark else "#DDD"};
+        }}
+    """
+
+
+class _ReviewSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class ReviewWorker(QRunnable):
+    """
+    Runs the diff, lint and security passes for a proposed change on a pool thread.
+
+    Emits ``signals.finished`` with ``(generation, diff_html, issues, security_risks)``.
+    """
+
+    def __init__(self, content, filepath, theme_mode="Dark", generation=0):
+        super().__init__()
+        self.content = content
+        self.filepath = filepath
+        self.theme_mode = theme_mode
+        self.generation = generation
+        self.signals = _ReviewSignals()
+
+    def run(self):
+        content = self.content
+        existing_content = ""
+        existing_size = 0
+        if self.filepath and os.path.isfile(self.filepath):
+            try:
+                existing_size = os.stat(self.filepath).st_size
+                # A file has at least as many bytes as characters, so this bounds the read
+                if existing_size <= MAX_INLINE_CHARS:
+                    with open(self.filepath, encoding="utf-8") as f:
+                        existing_content = f.read()
+            except Exception as e:
+                existing_content = f"Error reading file: {e}"
+
+        if existing_size > MAX_INLINE_CHARS or len(content) > MAX_INLINE_CHARS:
+            line_count = content.count("\n") + 1
+            diff_html = (
+                "<p>Diff skipped for large file.</p>"
+                f"<p>Existing: {existing_size:,} bytes<br>"
+                f"Proposed: {len(content):,} characters, {line_count:,} lines</p>"
+            )
+        elif len(existing_content) + len(content) > MAX_FULL_DIFF_CHARS:
+            diff_html = ReviewEngine.generate_diff_html_truncated(existing_content, content, self.theme_mode)
+        else:
+            diff_html = ReviewEngine.generate_diff_html(existing_content, content, self.theme_mode)
+
+        issues = ReviewEngine.analyze_code(content)
+        security_risks = ReviewEngine.scan_security(content)
+        # The holder is already gone if the app quit while this was running
+        with contextlib.suppress(RuntimeError):
+            self.signals.finished.emit((self.generation, diff_html, issues, security_risks))
+
 
 class DeepReviewDialog(QDialog):
     def __init__(self, tool_name, args, parent=None, theme_mode="Dark"):
@@ -28,7 +185,16 @@ class DeepReviewDialog(QDialog):
         self.tool_name = tool_name
         self.args = args
         self.theme_mode = theme_mode
-        self.review_engine = ReviewEngine()
+        # Proposed source not yet loaded into the viewer
+        self._source_tail = ""
+        self._filepath = ""
+        # Bumped per review run so a slower, older run can't overwrite newer results
+        self._review_generation = 0
+        self._review_worker = None
+        self._review_timer = QTimer(self)
+        self._review_timer.setSingleShot(True)
+        self._review_timer.setInterval(REVIEW_DEBOUNCE_MS)
+        self._review_timer.timeout.connect(self._start_review)
 
         self.init_ui()
         self.apply_theme_to_dialog()
@@ -50,6 +216,7 @@ class DeepReviewDialog(QDialog):
         self.diff_viewer = QTextEdit()
         self.diff_viewer.setReadOnly(True)
         self.diff_viewer.setFont(QFont("Courier New", 10))
+        self.diff_viewer.setPlaceholderText("Analyzing changes...")
         self.tabs.addTab(self.diff_viewer, "Visual Diff")
 
         # Tab 2: Source Code (Proposed)
@@ -57,12 +224,20 @@ class DeepReviewDialog(QDialog):
         source_layout = QVBoxLayout(source_container)
         source_layout.setContentsMargins(0, 0, 0, 0)
 
-        self.source_viewer = QTextEdit()
+        # Plain-text document layout keeps large proposed files responsive
+        self.source_viewer = QPlainTextEdit()
         self.source_viewer.setReadOnly(False)
         self.source_viewer.setFont(QFont("Courier New", 10))
         source_layout.addWidget(self.source_viewer)
 
+        self.btn_load_more = QPushButton()
+        self.btn_load_more.setObjectName("SourceButton")
+        self.btn_load_more.clicked.connect(self.load_more_source)
+        self.btn_load_more.hide()
+        source_layout.addWidget(self.btn_load_more)
+
         self.btn_copy_source = QPushButton("Copy to Clipboard")
+        self.btn_copy_source.setObjectName("SourceButton")
         self.btn_copy_source.clicked.connect(self.copy_source)
         source_layout.addWidget(self.btn_copy_source)
 
@@ -73,7 +248,7 @@ class DeepReviewDialog(QDialog):
         self.tabs.addTab(self.analysis_list, "Analysis & Security")
 
         # Tab 4: Raw Arguments
-        self.raw_viewer = QTextEdit()
+        self.raw_viewer = QPlainTextEdit()
         self.raw_viewer.setReadOnly(True)
         self.tabs.addTab(self.raw_viewer, "Raw Arguments")
 
@@ -81,12 +256,15 @@ class DeepReviewDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         self.btn_save = QPushButton("Save Changes")
+        self.btn_save.setObjectName("SaveButton")
         self.btn_save.clicked.connect(self.save_changes)
 
         self.btn_reject = QPushButton("Reject")
+        self.btn_reject.setObjectName("RejectButton")
         self.btn_reject.clicked.connect(self.reject)
 
         self.btn_approve = QPushButton("Approve")
+        self.btn_approve.setObjectName("ApproveButton")
         self.btn_approve.clicked.connect(self.accept)
 
         btn_layout.addStretch()
@@ -98,20 +276,18 @@ class DeepReviewDialog(QDialog):
 
     def save_changes(self):
         """Updates internal args with the content from the source viewer."""
-        new_content = self.source_viewer.toPlainText()
+        new_content = self.full_source()
 
         if "content" in self.args:
             self.args["content"] = new_content
         elif "code" in self.args:
             self.args["code"] = new_content
 
-        # Re-run analysis on new content
-        self.review_engine.analyze_code(new_content)  # Just to refresh internal state if needed
+        # Re-run analysis once edits settle
+        self._review_timer.start()
 
         # Visual feedback
         self.btn_save.setText("Saved ✓")
-        from PyQt6.QtCore import QTimer
-
         QTimer.singleShot(2000, lambda: self.btn_save.setText("Save Changes"))
 
     def get_args(self):
@@ -119,108 +295,46 @@ class DeepReviewDialog(QDialog):
         return self.args
 
     def apply_theme_to_dialog(self):
-        is_dark = self.theme_mode == "Dark"
-        bg = "#1E1F20" if is_dark else "#FFFFFF"
-        fg = "#E3E3E3" if is_dark else "#000000"
-        input_bg = "#282A2C" if is_dark else "#F0F4F9"
-        tab_bg = "#131314" if is_dark else "#F0F4F9"
-
-        self.setStyleSheet(f"""
-            QDialog {{ 
-                background-color: {bg}; 
-                color: {fg}; 
-            }} 
-            QLabel, QListWidget {{ 
-                color: {fg}; 
-            }}
-            QTextEdit, QListWidget {{ 
-                background-color: {input_bg}; 
-                color: {fg}; 
-                border: 1px solid {"#444" if is_dark else "#CCC"}; 
-                border-radius: 8px;
-                padding: 5px;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {"#444" if is_dark else "#CCC"};
-                background-color: {tab_bg};
-            }}
-            QTabBar::tab {{
-                background-color: {"#2D2E30" if is_dark else "#E0E0E0"};
-                color: {fg};
-                padding: 8px 12px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {input_bg};
-                border: 1px solid {"#444" if is_dark else "#CCC"};
-                border-bottom-color: {input_bg};
-            }}
-        """)
-
-        # Style buttons
-        self.btn_reject.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {"#442a2a" if is_dark else "#ffcccc"};
-                color: {"#ffa3a3" if is_dark else "#cc0000"};
-                border: 1px solid {"#663333" if is_dark else "#ff9999"};
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {"#553333" if is_dark else "#ffb3b3"};
-            }}
-        """)
-
-        self.btn_approve.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {"#1e3a1e" if is_dark else "#ccffcc"};
-                color: {"#afffbe" if is_dark else "#006600"};
-                border: 1px solid {"#336633" if is_dark else "#99ff99"};
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {"#2a4a2a" if is_dark else "#b3ffb3"};
-            }}
-        """)
-
-        self.btn_copy_source.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {"#333" if is_dark else "#EEE"};
-                color: {fg};
-                border: 1px solid {"#555" if is_dark else "#CCC"};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-        """)
-
-        self.btn_save.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {"#333" if is_dark else "#EEE"};
-                color: {fg};
-                border: 1px solid {"#555" if is_dark else "#CCC"};
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {"#444" if is_dark else "#DDD"};
-            }}
-        """)
+        # Buttons are matched by object name, so one cached sheet styles the whole dialog
+        self.setStyleSheet(_review_qss(self.theme_mode))
 
     def copy_source(self):
         from PyQt6.QtWidgets import QApplication
 
-        QApplication.clipboard().setText(self.source_viewer.toPlainText())
+        QApplication.clipboard().setText(self.full_source())
         QMessageBox.information(self, "Copied", "Source code copied to clipboard.")
 
+    def full_source(self):
+        """Returns the edited source followed by any part not yet loaded into the viewer."""
+        return self.source_viewer.toPlainText() + self._source_tail
+
+    def load_more_source(self):
+        """Appends the next chunk of the proposed source to the viewer."""
+        chunk, self._source_tail = self._source_tail[:MAX_INLINE_CHARS], self._source_tail[MAX_INLINE_CHARS:]
+        cursor = QTextCursor(self.source_viewer.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+        self._update_load_more()
+
+    def _on_source_update_request(self, rect, dy):
+        # Ignore partial repaints such as the blinking cursor
+        if dy or rect.contains(self.source_viewer.viewport().rect()):
+            self._highlight_visible_source()
+
+    def _highlight_visible_source(self):
+        viewer = self.source_viewer
+        first = viewer.cursorForPosition(QPoint(0, 0)).blockNumber()
+        last = viewer.cursorForPosition(QPoint(0, viewer.viewport().height())).blockNumber()
+        self.highlighter.highlight_visible(range(first, last + 1))
+
+    def _update_load_more(self):
+        remaining = len(self._source_tail)
+        self.btn_load_more.setText(f"Load Next {MAX_INLINE_CHARS:,} Characters ({remaining:,} not shown)")
+        self.btn_load_more.setVisible(remaining > 0)
+
     def load_data(self):
         # 1. Populate Raw Args
-        self.raw_viewer.setText(json.dumps(self.args, indent=2))
+        self.raw_viewer.setPlainText(json.dumps(self.args, indent=2))
 
         # 2. Determine Content and Filepath
         content = self.args.get("content", "")
@@ -231,67 +345,57 @@ class DeepReviewDialog(QDialog):
             content = self.args["code"]
             filepath = "InMemory Script"
 
-        # 3. Load Existing Content (if applicable)
-        existing_content = ""
-        if filepath and os.path.exists(filepath) and os.path.isfile(filepath):
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    existing_content = f.read()
-            except Exception as e:
-                existing_content = f"Error reading file: {e}"
-
-        # 4. Generate Diff
-        diff_html = self.review_engine.generate_diff_html(existing_content, content, self.theme_mode)
-        self.diff_viewer.setHtml(diff_html)
-
-        # 5. Set Source View
-        # Determine language
-        lang = "python"
-        if filepath:
-            ext = os.path.splitext(filepath)[1].lower()
-            if ext == ".js":
-                lang = "javascript"
-            elif ext == ".html":
-                lang = "html"
-            elif ext == ".css":
-                lang = "css"
-            elif ext == ".json":
-                lang = "json"
-            elif ext == ".md":
-                lang = "markdown"
-            elif ext == ".sh":
-                lang = "bash"
+        # 3. Set Source View
+        lang = _EXT_TO_LANG.get(os.path.splitext(filepath)[1].lower(), "python") if filepath else "python"
 
         self.highlighter = GeminiHighlighter(self.source_viewer.document(), lang, self.theme_mode)
-        self.source_viewer.setPlainText(content)
-
-        # 6. Run Analysis
-        issues = self.review_engine.analyze_code(content)
-        security_risks = self.review_engine.scan_security(content)
+        # Only blocks on screen are colorized; scrolling, resizing and edits extend the range
+        self.highlighter.visible_blocks = range(0)
+        self.source_viewer.updateRequest.connect(self._on_source_update_request)
+        self.source_viewer.setPlainText(content[:MAX_INLINE_CHARS])
+        self._highlight_visible_source()
+        self._source_tail = content[MAX_INLINE_CHARS:]
+        self._update_load_more()
+
+        # 4. Diff and analysis run off the UI thread
+        self._filepath = filepath
+        self._start_review()
+
+    def _start_review(self):
+        self._review_generation += 1
+        self._review_worker = ReviewWorker(self.full_source(), self._filepath, self.theme_mode, self._review_generation)
+        self._review_worker.signals.finished.connect(self._apply_review_results)
+        QThreadPool.globalInstance().start(self._review_worker)
+
+    def _apply_review_results(self, result):
+        generation, diff_html, issues, security_risks = result
+        if generation != self._review_generation:
+            return
+        self.diff_viewer.setHtml(diff_html)
+        self.analysis_list.clear()
 
         if not issues and not security_risks:
             self.analysis_list.addItem("✅ No syntax errors or obvious security risks found.")
+            self.tabs.setTabText(2, "Analysis & Security")
+            self.tabs.tabBar().setTabTextColor(2, QColor())
         else:
-            # Add Security Risks first (higher priority)
-            for risk in security_risks:
-                item = QListWidgetItem(risk)
-                item.setForeground(QColor("#ff5555"))  # Red
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                self.analysis_list.addItem(item)
-
-            # Add Linting Issues
-            for issue in issues:
-                item = QListWidgetItem(issue)
-                if "CRITICAL" in issue:
-                    item.setForeground(QColor("#ff5555"))
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                elif "LINT" in issue:
-                    item.setForeground(QColor("#ffb86c"))  # Orange
-                self.analysis_list.addItem(item)
+            # Security Risks first (higher priority), then Linting Issues; inserted in one call, styled in a second pass
+            rows = security_risks + issues
+            self.analysis_list.setUpdatesEnabled(False)
+            try:
+                self.analysis_list.addItems(rows)
+                red = QColor("#ff5555")
+                bold = self.analysis_list.item(0).font()
+                bold.setBold(True)
+                for row, text in enumerate(rows):
+                    item = self.analysis_list.item(row)
+                    if row < len(security_risks) or "CRITICAL" in text:
+                        item.setForeground(red)
+                        item.setFont(bold)
+                    elif "LINT" in text:
+                        item.setForeground(QColor("#ffb86c"))  # Orange
+            finally:
+                self.analysis_list.setUpdatesEnabled(True)
 
             # Highlight the tab if there are issues
             total_issues = len(issues) + len(security_risks)
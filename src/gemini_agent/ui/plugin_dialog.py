@@ -64,6 +64,11 @@ class PluginDialog(QDialog):
 
         self.refresh_plugins()
 
+    def load(self, theme_mode="Dark"):
+        """Refreshes the extension list so a kept instance can be shown again."""
+        self.theme_mode = theme_mode
+        self.refresh_plugins()
+
     def refresh_plugins(self):
         self.extension_manager.discover_plugins()
         self.plugin_list.clear()
@@ -1,3 +1,4 @@
+import functools
 import os
 
 from PyQt6.QtCore import QDir, Qt, pyqtSignal
@@ -11,6 +12,39 @@ from PyQt6.QtWidgets import (
 )
 
 
+@functools.cache
+def _explorer_qss(theme_mode: str) -> str:
+    """Builds the explorer stylesheet for a theme; there are only two, so each is built once."""
+    is_dark = theme_mode == "Dark"
+    bg = "#1E1F20" if is_dark else "#FFFFFF"
+    fg = "#E3E3E3" if is_dark else "#000000"
+    input_bg = "#2d2d2d" if is_dark else "#F0F0F0"
+
+    return f"""
+        QLineEdit {{
+            border: 1px solid {"#444" if is_dark else "#CCC"};
+            border-radius: 4px;
+            padding: 4px;
+            background-color: {input_bg};
+            color: {fg};
+            margin: 5px;
+        }}
+        QLineEdit:focus {{ border: 1px solid #0B57D0; }}
+        QTreeView {{
+            background-color: {bg};
+            color: {fg};
+            border: none;
+        }}
+        QTreeView::item:hover {{
+            background-color: {"#333" if is_dark else "#F0F0F0"};
+        }}
+        QTreeView::item:selected {{
+            background-color: {"#0B57D0" if is_dark else "#E8F0FE"};
+            color: {"white" if is_dark else "#0B57D0"};
+        }}
+    """
+
+
 class ProjectExplorer(QWidget):
     """
     A widget that displays the project file structure and allows
@@ -126,34 +160,5 @@ class ProjectExplorer(QWidget):
         QApplication.clipboard().setText(text)
 
     def apply_theme(self, theme_mode: str):
-        is_dark = theme_mode == "Dark"
-        bg = "#1E1F20" if is_dark else "#FFFFFF"
-        fg = "#E3E3E3" if is_dark else "#000000"
-        input_bg = "#2d2d2d" if is_dark else "#F0F0F0"
-
-        self.filter_input.setStyleSheet(f"""
-            QLineEdit {{
-                border: 1px solid {"#444" if is_dark else "#CCC"};
-                border-radius: 4px;
-                padding: 4px;
-                background-color: {input_bg};
-                color: {fg};
-                margin: 5px;
-            }}
-            QLineEdit:focus {{ border: 1px solid #0B57D0; }}
-        """)
-
-        self.tree.setStyleSheet(f"""
-            QTreeView {{
-                background-color: {bg};
-                color: {fg};
-                border: none;
-            }}
-            QTreeView::item:hover {{
-                background-color: {"#333" if is_dark else "#F0F0F0"};
-            }}
-            QTreeView::item:selected {{
-                background-color: {"#0B57D0" if is_dark else "#E8F0FE"};
-                color: {"white" if is_dark else "#0B57D0"};
-            }}
-        """)
+        # One sheet on the container, so Qt resolves a single cascade for both children
+        self.setStyleSheet(_explorer_qss(theme_mode))
@@ -1,4 +1,4 @@
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import QSignalBlocker, Qt, pyqtSignal, QSize
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -10,6 +10,40 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
 )
 
+_RECENT_LIST_QSS = """
+    QListWidget#RecentList {
+        background-color: transparent;
+        border: none;
+        outline: none;
+    }
+    QListWidget#RecentList::item {
+        padding: 2px;
+        margin-bottom: 2px;
+        background-color: transparent;
+    }
+    QListWidget#RecentList::item:selected {
+        background-color: transparent;
+        color: white;
+    }
+    QLabel#RecentIcon {
+        font-size: 14px;
+        margin-top: 6px;
+    }
+    QLabel#RecentName {
+        font-weight: 500;
+        font-size: 12px;
+        color: #E0E0E0;
+        background: transparent;
+        border: none;
+    }
+    /* Grey background for the bubble - using a slightly lighter grey than the sidebar */
+    QFrame#RecentBubble {
+        background-color: #333333;
+        border-radius: 8px;
+        border: 1px solid #444444;
+    }
+"""
+
 
 class RecentItemWidget(QWidget):
     """
@@ -34,10 +68,11 @@ class RecentItemWidget(QWidget):
         else:
             icon = "📄"
 
+        # Styled by _RECENT_LIST_QSS on the list widget, so rows don't parse stylesheets of their own
         self.icon_label = QLabel(icon)
+        self.icon_label.setObjectName("RecentIcon")
         self.icon_label.setFixedWidth(24)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
-        self.icon_label.setStyleSheet("font-size: 14px; margin-top: 6px;")
         
         # Bubble container for the text
         self.bubble_frame = QFrame()
@@ -47,28 +82,13 @@ class RecentItemWidget(QWidget):
         self.bubble_layout.setSpacing(0)
         
         self.name_label = QLabel(name)
-        self.name_label.setStyleSheet("""
-            font-weight: 500; 
-            font-size: 12px; 
-            color: #E0E0E0; 
-            background: transparent; 
-            border: none;
-        """)
+        self.name_label.setObjectName("RecentName")
         self.name_label.setWordWrap(True)
         # Allow the label to expand vertically as needed
         self.name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         
         self.bubble_layout.addWidget(self.name_label)
-        
-        # Grey background for the bubble - using a slightly lighter grey than the sidebar
-        self.bubble_frame.setStyleSheet("""
-            QFrame#RecentBubble {
-                background-color: #333333;
-                border-radius: 8px;
-                border: 1px solid #444444;
-            }
-        """)
-        
+
         self.layout.addWidget(self.icon_label)
         self.layout.addWidget(self.bubble_frame, 1)
         
@@ -79,6 +99,8 @@ class RecentItemWidget(QWidget):
         """
         Returns an accurate size hint by ensuring the layout is activated.
         """
+        # The label fonts come from the list stylesheet, which applies at polish time
+        self.ensurePolished()
         self.layout.activate()
         hint = super().sizeHint()
         # Ensure a minimum height for the bubble
@@ -114,22 +136,7 @@ class RecentWidget(QFrame):
         self.list_widget.setObjectName("RecentList")
         self.list_widget.setWordWrap(True)
         self.list_widget.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
-        self.list_widget.setStyleSheet("""
-            QListWidget#RecentList {
-                background-color: transparent;
-                border: none;
-                outline: none;
-            }
-            QListWidget#RecentList::item {
-                padding: 2px;
-                margin-bottom: 2px;
-                background-color: transparent;
-            }
-            QListWidget#RecentList::item:selected {
-                background-color: transparent;
-                color: white;
-            }
-        """)
+        self.list_widget.setStyleSheet(_RECENT_LIST_QSS)
         self.list_widget.itemClicked.connect(self._on_item_clicked)
         layout.addWidget(self.list_widget)
 
@@ -137,30 +144,101 @@ class RecentWidget(QFrame):
         """
         Updates the list with a mix of items.
         Each item should be a dict with: 'name', 'path' (or 'id'), 'type'.
+
+        Rows already showing an identical item in the right place are kept, so only
+        new, edited or reordered entries get a fresh widget.
         """
-        self.list_widget.clear()
-        
+        wanted = {self._item_key(item): item for item in items}
+        blocker: QSignalBlocker | None = None
+
+        def freeze() -> None:
+            # Repaint once after the whole diff, and not at all when nothing changed;
+            # row removals would otherwise emit a current-item change per step
+            nonlocal blocker
+            if blocker is None:
+                blocker = QSignalBlocker(self.list_widget)
+                self.list_widget.setUpdatesEnabled(False)
+
+        try:
+            row = 0
+            for item in items:
+                existing = self.list_widget.item(row)
+                # Drop rows whose item is gone or has changed since it was built
+                while existing is not None:
+                    data = existing.data(Qt.ItemDataRole.UserRole)
+                    if wanted.get(self._item_key(data)) == data:
+                        break
+                    freeze()
+                    self.list_widget.takeItem(row)
+                    existing = self.list_widget.item(row)
+
+                if existing is None or existing.data(Qt.ItemDataRole.UserRole) != item:
+                    freeze()
+                    self._insert_row(row, item)
+                row += 1
+
+            if self.list_widget.count() > row:
+                freeze()
+                while self.list_widget.count() > row:
+                    self.list_widget.takeItem(row)
+        finally:
+            if blocker is not None:
+                self.list_widget.setUpdatesEnabled(True)
+                blocker.unblock()
+
+    @staticmethod
+    def _item_key(item: dict) -> tuple[str, str]:
+        return item["type"], item.get("path") or item.get("id")
+
+    def row_of(self, item_type: str, path_or_id: str) -> int:
+        """Returns the row showing the given item, or -1 if it is not listed."""
+        key = (item_type, path_or_id)
+        for row in range(self.list_widget.count()):
+            if self._item_key(self.list_widget.item(row).data(Qt.ItemDataRole.UserRole)) == key:
+                return row
+        return -1
+
+    def insert_item(self, item: dict) -> None:
+        """Inserts a single item, keeping the list ordered newest first."""
+        timestamp = item.get("timestamp", "")
+        row = 0
+        while row < self.list_widget.count():
+            if self.list_widget.item(row).data(Qt.ItemDataRole.UserRole).get("timestamp", "") <= timestamp:
+                break
+            row += 1
+        self._insert_row(row, item)
+
+    def set_item(self, row: int, item: dict) -> None:
+        """Updates the row in place with the item's new name and data."""
+        list_item = self.list_widget.item(row)
+        list_item.setData(Qt.ItemDataRole.UserRole, item)
+        widget = self.list_widget.itemWidget(list_item)
+        widget.name_label.setText(item["name"])
+        list_item.setSizeHint(widget.sizeHint())
+
+    def _insert_row(self, row: int, item: dict) -> None:
+        """Builds the widget for ``item`` and inserts it at ``row``."""
         # SidebarContainer width is 280. 
         # Subtracting Sidebar margins and ListWidget padding/scrollbars.
         # We use a slightly smaller width to ensure word wrap triggers correctly.
         available_width = 230 
 
-        for item in items:
-            list_item = QListWidgetItem(self.list_widget)
-            list_item.setData(Qt.ItemDataRole.UserRole, item)
-            
-            path = item.get("path") or item.get("id")
-            custom_widget = RecentItemWidget(item["name"], path, item["type"])
-            
-            # Force the widget to a specific width so sizeHint() can calculate 
-            # the correct height based on word wrapping.
-            custom_widget.setFixedWidth(available_width)
-            
-            # Set the size hint for the list item based on the calculated widget size
-            list_item.setSizeHint(custom_widget.sizeHint())
-            
-            self.list_widget.addItem(list_item)
-            self.list_widget.setItemWidget(list_item, custom_widget)
+        list_item = QListWidgetItem()
+        list_item.setData(Qt.ItemDataRole.UserRole, item)
+        
+        path = item.get("path") or item.get("id")
+        # Parented up front so the list stylesheet already applies when the size hint is taken
+        custom_widget = RecentItemWidget(item["name"], path, item["type"], self.list_widget.viewport())
+        
+        # Force the widget to a specific width so sizeHint() can calculate 
+        # the correct height based on word wrapping.
+        custom_widget.setFixedWidth(available_width)
+        
+        # Set the size hint for the list item based on the calculated widget size
+        list_item.setSizeHint(custom_widget.sizeHint())
+        
+        self.list_widget.insertItem(row, list_item)
+        self.list_widget.setItemWidget(list_item, custom_widget)
 
     def _on_item_clicked(self, item: QListWidgetItem):
         data = item.data(Qt.ItemDataRole.UserRole)
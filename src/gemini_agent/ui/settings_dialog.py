@@ -241,6 +241,39 @@ class SettingsDialog(QDialog):
         bottom_layout.addWidget(btn_close)
         main_layout.addWidget(bottom_frame)
 
+    def load(self, config):
+        """Re-syncs the widgets with ``config`` so a kept instance can be shown again."""
+        self.config = config
+        # Programmatic updates must not trigger the auto-save handlers
+        inputs = (self.model_combo, self.api_input, self.chk_grounding, self.theme_combo)
+        for widget in inputs:
+            widget.blockSignals(True)
+
+        current_model = self.config.get("model", ModelRegistry.DEFAULT_MODEL_ID)
+        found_index = self.model_combo.findData(current_model)
+        if found_index < 0:
+            self.model_combo.addItem(f"Custom: {current_model}", current_model)
+            found_index = self.model_combo.count() - 1
+        self.model_combo.setCurrentIndex(found_index)
+        self.api_input.setText(self.config.get("api_key", ""))
+        self.chk_grounding.setChecked(self.config.get("use_search", False))
+        self.theme_combo.setCurrentText(self.config.get("theme", "Dark"))
+
+        for widget in inputs:
+            widget.blockSignals(False)
+
+        # Unsaved edits from the previous visit are dropped
+        self.conductor_path_input.setText(self.config.get("conductor_path", ""))
+        self.chk_thinking.setChecked(self.config.get("thinking_enabled", False))
+        self.spin_thinking_budget.setValue(self.config.get("thinking_budget", 4096))
+        self.spin_temp.setValue(self.config.get("temperature", 0.8))
+        self.spin_top_p.setValue(self.config.get("top_p", 0.95))
+        self.spin_max_turns.setValue(self.config.get("max_turns", 20))
+        self.txt_system_instruction.setText(self.config.get("system_instruction", ""))
+
+        self.apply_theme_to_dialog()
+        self.refresh_checkpoints()
+
     def refresh_checkpoints(self):
         if not self.checkpoint_manager:
             return
@@ -329,10 +362,7 @@ class SettingsDialog(QDialog):
                 self.main_window.conductor_manager = ConductorManager(extension_path=path)
 
     def open_conductor_dialog(self):
-        from gemini_agent.ui.conductor_dialog import ConductorDialog
-
-        dialog = ConductorDialog(self.main_window, self.main_window.conductor_manager)
-        dialog.exec()
+        self.main_window.open_conductor()
 
     def save_general_settings(self):
         self.config["api_key"] = self.api_input.text().strip()
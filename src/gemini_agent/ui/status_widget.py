@@ -4,6 +4,18 @@ from PyQt6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QWidget
 
 from gemini_agent.config.app_config import AppConfig
 
+_RATE_BAR_QSS = """
+    QProgressBar {{
+        border: 1px solid #333;
+        border-radius: 5px;
+        background-color: #1e1e1e;
+    }}
+    QProgressBar::chunk {{
+        background-color: {color};
+        border-radius: 4px;
+    }}
+"""
+
 
 class StatusWidget(QWidget):
     """
@@ -54,78 +66,45 @@ class StatusWidget(QWidget):
         self.rate_limit_bar = QProgressBar()
         self.rate_limit_bar.setFixedSize(120, 10)
         self.rate_limit_bar.setTextVisible(False)
-        self.rate_limit_bar.setStyleSheet(
-            """
-            QProgressBar {
-                border: 1px solid #333;
-                border-radius: 5px;
-                background-color: #1e1e1e;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 4px;
-            }
-        """
-        )
+        self._bar_color = "#4CAF50"
+        self.rate_limit_bar.setStyleSheet(_RATE_BAR_QSS.format(color=self._bar_color))
 
         rate_layout.addWidget(self.rate_limit_label)
         rate_layout.addWidget(self.rate_limit_bar)
         layout.addWidget(self.rate_limit_container)
 
     def set_status(self, text: str):
-        """Updates the status text safely."""
-        try:
-            if hasattr(self, "status_label") and self.status_label:
-                self.status_label.setText(text)
-        except (RuntimeError, AttributeError):
-            pass
+        """Updates the status text."""
+        self.status_label.setText(text)
 
     def start_loading(self):
         """Shows and starts the GIF animation."""
-        try:
-            if self.movie and self.gif_label:
-                self.gif_label.show()
-                self.movie.start()
-        except (RuntimeError, AttributeError):
-            pass
+        if self.movie:
+            self.gif_label.show()
+            self.movie.start()
 
     def stop_loading(self):
         """Stops and hides the GIF animation."""
-        try:
-            if self.movie and self.gif_label:
-                self.movie.stop()
-                self.gif_label.hide()
-        except (RuntimeError, AttributeError):
-            pass
+        if self.movie:
+            self.movie.stop()
+            self.gif_label.hide()
 
     def update_rate_limit(self, remaining: int, limit: int):
         """Updates the rate limit indicator with real-time telemetry."""
-        try:
-            self.rate_limit_label.setText(f"RPM: {remaining}/{limit}")
-            self.rate_limit_bar.setMaximum(limit)
-            self.rate_limit_bar.setValue(remaining)
-
-            # Dynamic coloring based on remaining capacity
-            percentage = (remaining / limit) * 100 if limit > 0 else 0
-            if percentage < 20:
-                color = "#f44336"  # Red
-            elif percentage < 50:
-                color = "#ffeb3b"  # Yellow
-            else:
-                color = "#4CAF50"  # Green
-
-            self.rate_limit_bar.setStyleSheet(
-                f"""
-                QProgressBar {{
-                    border: 1px solid #333;
-                    border-radius: 5px;
-                    background-color: #1e1e1e;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                    border-radius: 4px;
-                }}
-            """
-            )
-        except (RuntimeError, AttributeError):
-            pass
+        self.rate_limit_label.setText(f"RPM: {remaining}/{limit}")
+        self.rate_limit_bar.setMaximum(limit)
+        self.rate_limit_bar.setValue(remaining)
+
+        # Dynamic coloring based on remaining capacity
+        percentage = (remaining / limit) * 100 if limit > 0 else 0
+        if percentage < 20:
+            color = "#f44336"  # Red
+        elif percentage < 50:
+            color = "#ffeb3b"  # Yellow
+        else:
+            color = "#4CAF50"  # Green
+
+        # Re-polishing the bar is costly; only restyle when the band changes
+        if color != self._bar_color:
+            self._bar_color = color
+            self.rate_limit_bar.setStyleSheet(_RATE_BAR_QSS.format(color=color))
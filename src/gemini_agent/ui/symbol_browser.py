@@ -17,6 +17,8 @@ class SymbolBrowser(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.symbols = []
+        # Top-level tree item per file currently shown, so batches can swap single files
+        self._file_items: dict[str, QTreeWidgetItem] = {}
         self.init_ui()
 
     def init_ui(self):
@@ -76,64 +78,86 @@ class SymbolBrowser(QWidget):
         self.symbols = symbols
         self.filter_symbols(self.search_input.text())
 
+    @pyqtSlot(list)
+    def add_symbols(self, symbols: list[Symbol]):
+        """Merges a batch of freshly indexed symbols, replacing only the files it covers."""
+        files = self._group_by_file(symbols)
+        self.symbols = [s for s in self.symbols if s.file_path not in files] + symbols
+        text = self.search_input.text().lower()
+        for file_path, file_symbols in files.items():
+            old_item = self._file_items.pop(file_path, None)
+            if old_item is not None:
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(old_item))
+            matching = [s for s in file_symbols if self._matches(s, text)]
+            if matching:
+                self._add_file_item(file_path, matching)
+
+    @staticmethod
+    def _matches(symbol: Symbol, text: str) -> bool:
+        return not text or text in symbol.name.lower() or text in symbol.file_path.lower()
+
+    @staticmethod
+    def _group_by_file(symbols: list[Symbol]) -> dict[str, list[Symbol]]:
+        files = {}
+        for s in symbols:
+            files.setdefault(s.file_path, []).append(s)
+        return files
+
     def filter_symbols(self, text: str):
         self.tree.clear()
+        self._file_items = {}
         text = text.lower()
 
         # Group symbols by file
-        files = {}
-        for s in self.symbols:
-            if text and text not in s.name.lower() and text not in s.file_path.lower():
-                continue
-
-            if s.file_path not in files:
-                files[s.file_path] = []
-            files[s.file_path].append(s)
-
+        files = self._group_by_file([s for s in self.symbols if self._matches(s, text)])
         for file_path, file_symbols in files.items():
-            file_item = QTreeWidgetItem([file_path])
-            file_item.setData(0, Qt.ItemDataRole.UserRole, "file")
-            self.tree.addTopLevelItem(file_item)
-
-            # Group by class if applicable
-            classes = {}
-            standalone = []
-            for s in file_symbols:
-                if s.kind == "class":
-                    if s.name not in classes:
-                        classes[s.name] = {"item": None, "symbols": []}
-                    classes[s.name]["symbols"].append(s)
-                elif s.parent:
-                    if s.parent not in classes:
-                        classes[s.parent] = {"item": None, "symbols": []}
-                    classes[s.parent]["symbols"].append(s)
-                else:
-                    standalone.append(s)
-
-            for class_name, data in classes.items():
-                # Find the class symbol itself if it exists in this file
-                class_symbol = next((s for s in data["symbols"] if s.kind == "class" and s.name == class_name), None)
-
-                class_item = QTreeWidgetItem([f"class {class_name}"])
-                class_item.setData(0, Qt.ItemDataRole.UserRole, class_symbol)
-                file_item.addChild(class_item)
-
-                for s in data["symbols"]:
-                    if s.kind != "class":
-                        icon = "ƒ" if s.kind == "function" else "m"
-                        item = QTreeWidgetItem([f"{icon} {s.name}"])
-                        item.setData(0, Qt.ItemDataRole.UserRole, s)
-                        class_item.addChild(item)
-
-                class_item.setExpanded(True)
-
-            for s in standalone:
-                icon = "ƒ" if s.kind == "function" else "m"
-                item = QTreeWidgetItem([f"{icon} {s.name}"])
-                item.setData(0, Qt.ItemDataRole.UserRole, s)
-                file_item.addChild(item)
-
-            file_item.setExpanded(True)
+            self._add_file_item(file_path, file_symbols)
+
+    def _add_file_item(self, file_path: str, file_symbols: list[Symbol]):
+        file_item = QTreeWidgetItem([file_path])
+        file_item.setData(0, Qt.ItemDataRole.UserRole, "file")
+        self.tree.addTopLevelItem(file_item)
+        self._file_items[file_path] = file_item
+
+        # Group by class if applicable
+        classes = {}
+        standalone = []
+        for s in file_symbols:
+            if s.kind == "class":
+                if s.name not in classes:
+                    classes[s.name] = {"item": None, "symbols": []}
+                classes[s.name]["symbols"].append(s)
+            elif s.parent:
+                if s.parent not in classes:
+                    classes[s.parent] = {"item": None, "symbols": []}
+                classes[s.parent]["symbols"].append(s)
+            else:
+                standalone.append(s)
+
+        for class_name, data in classes.items():
+            # Find the class symbol itself if it exists in this file
+            class_symbol = next((s for s in data["symbols"] if s.kind == "class" and s.name == class_name), None)
+
+            class_item = QTreeWidgetItem([f"class {class_name}"])
+            class_item.setData(0, Qt.ItemDataRole.UserRole, class_symbol)
+            file_item.addChild(class_item)
+
+            for s in data["symbols"]:
+                if s.kind != "class":
+                    icon = "ƒ" if s.kind == "function" else "m"
+                    item = QTreeWidgetItem([f"{icon} {s.name}"])
+                    item.setData(0, Qt.ItemDataRole.UserRole, s)
+                    class_item.addChild(item)
+
+            class_item.setExpanded(True)
+
+        for s in standalone:
+            icon = "ƒ" if s.kind == "function" else "m"
+            item = QTreeWidgetItem([f"{icon} {s.name}"])
+            item.setData(0, Qt.ItemDataRole.UserRole, s)
+            file_item.addChild(item)
+
+        file_item.setExpanded(True)
 
     def _on_item_double_clicked(self, item, column):
         data = item.data(0, Qt.ItemDataRole.UserRole)
@@ -108,19 +108,30 @@ class ThemeManager:
     def __init__(self, app: QApplication):
         self.app = app
         self.current_theme = "Dark"
+        # Theme actually pushed to the QApplication; re-applying it would re-polish every widget
+        self._applied_theme: str | None = None
+        self._palettes: dict[str, QPalette] = {}
+
+    def _palette(self, theme_name: str) -> QPalette:
+        """Returns the palette for a theme, building it on first use."""
+        palette = self._palettes.get(theme_name)
+        if palette is None:
+            palette = self._palettes[theme_name] = QPalette()
+            theme_data = self.DARK_PALETTE if theme_name == "Dark" else self.LIGHT_PALETTE
+
+            for role_name, color_hex in theme_data.items():
+                role = getattr(QPalette.ColorRole, role_name)
+                palette.setColor(role, QColor(color_hex))
+        return palette
 
     def apply_theme(self, theme_name: str):
         """Applies the specified theme to the application."""
         self.current_theme = theme_name
-        palette = QPalette()
+        if theme_name == self._applied_theme:
+            return
+        self._applied_theme = theme_name
 
-        theme_data = self.DARK_PALETTE if theme_name == "Dark" else self.LIGHT_PALETTE
-
-        for role_name, color_hex in theme_data.items():
-            role = getattr(QPalette.ColorRole, role_name)
-            palette.setColor(role, QColor(color_hex))
-
-        self.app.setPalette(palette)
+        self.app.setPalette(self._palette(theme_name))
 
         style = self.DARK_STYLE if theme_name == "Dark" else self.LIGHT_STYLE
         self.app.setStyleSheet(style)
@@ -1,3 +1,5 @@
+import functools
+import math
 import os
 import re
 from typing import Any
@@ -8,7 +10,7 @@ from markdown_it import MarkdownIt
 from pygments import lex
 from pygments.lexers import TextLexer, get_lexer_by_name
 from pygments.token import Token
-from PyQt6.QtCore import QStringListModel, Qt, QTimer, pyqtSignal, QSize
+from PyQt6.QtCore import QEvent, QStringListModel, Qt, QTimer, pyqtSignal, pyqtSlot, QSize
 from PyQt6.QtGui import (
     QColor,
     QFontDatabase,
@@ -16,6 +18,7 @@ from PyQt6.QtGui import (
     QTextCharFormat,
     QTextCursor,
     QTextDocument,
+    QTextOption,
     QPalette,
 )
 from PyQt6.QtWidgets import (
@@ -24,6 +27,7 @@ from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
     QTextEdit,
     QVBoxLayout,
@@ -36,6 +40,143 @@ from gemini_agent.ui.styles import SYNTAX_COLORS
 # Shared MarkdownIt instance - Enabled 'table' extension manually to avoid linkify dependency
 MD_PARSER = MarkdownIt("commonmark", {"breaks": True, "html": True}).enable("table")
 
+# Rendered messages kept for replays (switching between recent sessions, scrolling back, restored backups)
+RENDER_CACHE_SIZE = 1024
+
+# Header cells only; a plain "<th" prefix match would also hit "<thead>"
+_TH_OPEN_RE = re.compile(r"<th(\s|>)")
+
+# Inline tokens that render exactly as their source text
+_PLAIN_INLINE_TYPES = frozenset({"text", "softbreak"})
+
+
+def markdown_to_html(text: str, theme_mode: str = "Dark") -> str:
+    """Converts Markdown to basic HTML for QLabel with justification wrapper."""
+    try:
+        # Use shared parser for rendering
+        html = MD_PARSER.render(text)
+        link_color = "#4da6ff" if theme_mode == "Dark" else "#0969da"
+        html = html.replace("<a href=", f'<a style="color: {link_color}; text-decoration: none;" href=')
+
+        if "<table>" in html:
+            border_color = "#555555" if theme_mode == "Dark" else "#dddddd"
+            header_bg = "#333333" if theme_mode == "Dark" else "#f0f0f0"
+
+            # Add border, spacing, and width
+            html = html.replace(
+                "<table>",
+                '<table border="1" cellspacing="0" cellpadding="5" width="100%" '
+                f'style="border-collapse: collapse; border-color: {border_color};">',
+            )
+
+            # Style headers (background color) - Use regex to avoid corrupting <thead>
+            html = _TH_OPEN_RE.sub(f'<th bgcolor="{header_bg}"\\1', html)
+
+        return f"<div>{html}</div>"
+    except Exception:
+        return f"<div>{text}</div>"
+
+
+def _plain_text(tokens: list) -> str | None:
+    """
+    Returns the display text when parsed markdown is only paragraphs of unformatted text, else None.
+
+    Built from the parsed inline content, so entities and backslash escapes are decoded and
+    paragraphs are separated by one blank line, as the HTML renderer would show them.
+    """
+    paragraphs = []
+    for token in tokens:
+        if token.type == "inline":
+            if any(child.type not in _PLAIN_INLINE_TYPES for child in token.children):
+                return None
+            paragraphs.append("".join(child.content if child.type == "text" else "\n" for child in token.children))
+        elif token.type not in ("paragraph_open", "paragraph_close"):
+            return None
+    return "\n\n".join(paragraphs) if paragraphs else None
+
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_markdown_segments(text: str, theme_mode: str = "Dark") -> tuple[tuple[str, str, str], ...]:
+    """
+    Splits a message into display segments without touching Qt, so it can run off the UI thread.
+    Results are cached per (text, theme), so the returned tuple is shared and immutable.
+
+    Returns:
+        ("text", html, markdown) and ("code", code, language) tuples in display order, or a
+        single ("plain", text, "") segment when the message has no markdown formatting at all.
+    """
+    segments: list[tuple[str, str, str]] = []
+
+    def _add_text(chunk: str) -> None:
+        if chunk.strip():
+            segments.append(("text", markdown_to_html(chunk, theme_mode), chunk))
+
+    tokens = MD_PARSER.parse(text)
+    plain = _plain_text(tokens)
+    if plain is not None:
+        # Skip HTML generation; the bubble shows this in a plain-text view
+        return (("plain", plain, ""),)
+
+    lines = text.splitlines(keepends=True)
+    last_line_idx = 0
+
+    for token in tokens:
+        if token.type == "fence":
+            start_line, end_line = token.map
+            if start_line > last_line_idx:
+                _add_text("".join(lines[last_line_idx:start_line]))
+            segments.append(("code", token.content, token.info))
+            last_line_idx = end_line
+
+    if last_line_idx < len(lines):
+        _add_text("".join(lines[last_line_idx:]))
+
+    return tuple(segments)
+
+
+@functools.cache
+def message_bubble_qss(theme_mode: str) -> str:
+    """
+    Builds the stylesheet for every bubble in the chat container, so Qt parses it once
+    per theme instead of once per bubble. The ``*`` selectors mirror the cascade the
+    bubble styles had when set on each frame.
+    """
+    is_dark = theme_mode == "Dark"
+    user_bg = "#3C4043" if is_dark else "#F0F4F9"
+    fg = "#E3E3E3" if is_dark else "#1F1F1F"
+
+    return f"""
+        QFrame#UserBubble, QFrame#UserBubble * {{
+            background-color: {user_bg};
+            border-radius: 20px;
+            padding: 15px;
+            color: {fg};
+        }}
+        QFrame#AIBubble, QFrame#AIBubble * {{
+            background-color: transparent;
+            border: none;
+            padding: 0px;
+        }}
+        QFrame#UserBubble #BubbleText, QFrame#AIBubble #BubbleText {{
+            color: {fg};
+            border: none;
+            font-size: 16px;
+            background: transparent;
+        }}
+        QFrame#AIBubble QPushButton#BubbleToolButton {{
+            border: none;
+            color: #888;
+            font-size: 11px;
+            padding: 4px 8px;
+            background-color: transparent;
+        }}
+        QFrame#AIBubble QPushButton#BubbleToolButton:hover {{
+            color: #4da6ff;
+            background-color: rgba(77, 166, 255, 0.1);
+            border-radius: 4px;
+        }}
+    """
+
 
 class AttachmentItem(QFrame):
     """Small widget to show an attached file with a remove button."""
@@ -51,6 +192,24 @@ class AttachmentItem(QFrame):
     def init_ui(self) -> None:
         """Initializes the attachment item UI."""
         self.setObjectName("AttachmentItem")
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(5, 2, 5, 2)
+        layout.setSpacing(5)
+
+        self.lbl = QLabel()
+
+        btn_remove = QPushButton("×")
+        btn_remove.setFixedSize(16, 16)
+        btn_remove.clicked.connect(lambda: self.remove_requested.emit(self.file_path))
+
+        layout.addWidget(self.lbl)
+        layout.addWidget(btn_remove)
+
+        self._apply_content()
+
+    def _apply_content(self) -> None:
+        """Applies the file name and theme styling."""
         is_dark = self.theme_mode == "Dark"
         bg = "#333" if is_dark else "#E0E0E0"
         fg = "#EEE" if is_dark else "#333"
@@ -72,20 +231,14 @@ class AttachmentItem(QFrame):
             QPushButton:hover {{ color: #ff4444; }}
         """)
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 2, 5, 2)
-        layout.setSpacing(5)
-
-        name = os.path.basename(self.file_path)
-        lbl = QLabel(name)
-        lbl.setToolTip(self.file_path)
+        self.lbl.setText(os.path.basename(self.file_path))
+        self.lbl.setToolTip(self.file_path)
 
-        btn_remove = QPushButton("×")
-        btn_remove.setFixedSize(16, 16)
-        btn_remove.clicked.connect(lambda: self.remove_requested.emit(self.file_path))
-
-        layout.addWidget(lbl)
-        layout.addWidget(btn_remove)
+    def reset(self, file_path: str, theme_mode: str = "Dark") -> None:
+        """Re-targets a pooled item to another file without rebuilding its widgets."""
+        self.file_path = file_path
+        self.theme_mode = theme_mode
+        self._apply_content()
 
 
 class GeminiHighlighter(QSyntaxHighlighter):
@@ -93,6 +246,9 @@ class GeminiHighlighter(QSyntaxHighlighter):
     A Qt Syntax Highlighter that uses Pygments to tokenize code.
     """
 
+    # Block state marking blocks colorized while a visible range is set
+    _HIGHLIGHTED = 1
+
     def __init__(self, document: QTextDocument, language: str, theme_mode: str = "Dark"):
         super().__init__(document)
         self.theme_mode = theme_mode
@@ -104,6 +260,17 @@ class GeminiHighlighter(QSyntaxHighlighter):
             self.lexer = TextLexer()
 
         self.formats = self._create_formats()
+        # Block numbers to colorize; None highlights the whole document
+        self.visible_blocks: range | None = None
+
+    def set_theme(self, theme_mode: str) -> None:
+        """Swaps the color formats for another theme and re-highlights the document."""
+        if theme_mode == self.theme_mode:
+            return
+        self.theme_mode = theme_mode
+        self.styles = SYNTAX_COLORS.get(theme_mode, SYNTAX_COLORS["Dark"])
+        self.formats = self._create_formats()
+        self.rehighlight()
 
     def _create_formats(self) -> dict[Any, QTextCharFormat]:
         """Maps Pygments tokens to QTextCharFormat based on current theme."""
@@ -126,8 +293,23 @@ class GeminiHighlighter(QSyntaxHighlighter):
 
         return formats
 
+    def highlight_visible(self, blocks: range) -> None:
+        """Limits highlighting to ``blocks`` and colorizes the ones in it that aren't highlighted yet."""
+        self.visible_blocks = blocks
+        block = self.document().findBlockByNumber(blocks.start)
+        while block.isValid() and block.blockNumber() < blocks.stop:
+            if block.userState() != self._HIGHLIGHTED:
+                self.rehighlightBlock(block)
+            block = block.next()
+
     def highlightBlock(self, text: str):
         """Applied to every block of text in the document."""
+        if self.visible_blocks is not None:
+            # Off-screen blocks are left plain until highlight_visible brings them into range
+            if self.currentBlock().blockNumber() not in self.visible_blocks:
+                self.setCurrentBlockState(0)
+                return
+            self.setCurrentBlockState(self._HIGHLIGHTED)
         tokens = lex(text, self.lexer)
 
         index = 0
@@ -164,8 +346,60 @@ class CodeBlock(QFrame):
 
     def initUI(self):
         self.setObjectName("CodeBlock")
-        bg_color = "#1e1e1e" if self.theme_mode == "Dark" else "#f6f8fa"
-        border_color = "#333" if self.theme_mode == "Dark" else "#d0d7de"
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self.header = QFrame()
+        self.header.setObjectName("CodeHeader")
+        header_layout = QHBoxLayout(self.header)
+        header_layout.setContentsMargins(10, 5, 10, 5)
+
+        self.lang_lbl = QLabel(self.language.upper())
+
+        self.copy_btn = QPushButton("Copy")
+        self.copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.copy_btn.clicked.connect(self.copy_code)
+
+        header_layout.addWidget(self.lang_lbl)
+        header_layout.addStretch()
+        header_layout.addWidget(self.copy_btn)
+
+        layout.addWidget(self.header)
+
+        self.editor = QTextEdit()
+        self.editor.setReadOnly(True)
+        self.editor.setPlainText(self.code)
+
+        font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        font.setPointSize(10)
+        self.editor.setFont(font)
+
+        self.editor.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.editor.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.editor.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+
+        self.highlighter = GeminiHighlighter(self.editor.document(), self.language, self.theme_mode)
+        self._apply_styles()
+
+        layout.addWidget(self.editor)
+
+        # Width the document was last laid out at; re-laying out at the same width is skipped
+        self._fitted_width = -1
+        self._fit_pending = False
+
+        # Connect document changes to height adjustment
+        self.editor.document().contentsChanged.connect(self._refit)
+
+        # Use a timer to adjust height after the widget is laid out
+        QTimer.singleShot(50, self.adjust_height)
+
+    def _apply_styles(self) -> None:
+        """Applies the theme colors to the frame, header and editor."""
+        is_dark = self.theme_mode == "Dark"
+        bg_color = "#1e1e1e" if is_dark else "#f6f8fa"
+        border_color = "#333" if is_dark else "#d0d7de"
 
         self.setStyleSheet(f"""
             QFrame#CodeBlock {{ 
@@ -177,14 +411,8 @@ class CodeBlock(QFrame):
             }}
         """)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
-        header = QFrame()
-        header.setObjectName("CodeHeader")
-        header_bg = "#2d2d2d" if self.theme_mode == "Dark" else "#eaeef2"
-        header.setStyleSheet(f"""
+        header_bg = "#2d2d2d" if is_dark else "#eaeef2"
+        self.header.setStyleSheet(f"""
             QFrame#CodeHeader {{ 
                 background-color: {header_bg}; 
                 border-top-left-radius: 6px; 
@@ -192,42 +420,23 @@ class CodeBlock(QFrame):
                 border-bottom: 1px solid {border_color};
             }}
         """)
-        header_layout = QHBoxLayout(header)
-        header_layout.setContentsMargins(10, 5, 10, 5)
 
-        lang_lbl = QLabel(self.language.upper())
-        lang_lbl.setStyleSheet(
-            f"color: {'#aaa' if self.theme_mode == 'Dark' else '#57606a'}; font-weight: bold; font-size: 11px; font-family: 'Segoe UI', sans-serif;"
+        self.lang_lbl.setStyleSheet(
+            f"color: {'#aaa' if is_dark else '#57606a'}; font-weight: bold; font-size: 11px;"
+            " font-family: 'Segoe UI', sans-serif;"
         )
 
-        copy_btn = QPushButton("Copy")
-        copy_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        copy_btn.setStyleSheet(f"""
+        self.copy_btn.setStyleSheet(f"""
             QPushButton {{
                 background: transparent; 
-                color: {"#aaa" if self.theme_mode == "Dark" else "#57606a"}; 
+                color: {"#aaa" if is_dark else "#57606a"}; 
                 border: none; 
                 font-size: 11px;
             }}
-            QPushButton:hover {{ color: {"#fff" if self.theme_mode == "Dark" else "#0969da"}; }}
+            QPushButton:hover {{ color: {"#fff" if is_dark else "#0969da"}; }}
         """)
-        copy_btn.clicked.connect(self.copy_code)
-
-        header_layout.addWidget(lang_lbl)
-        header_layout.addStretch()
-        header_layout.addWidget(copy_btn)
 
-        layout.addWidget(header)
-
-        self.editor = QTextEdit()
-        self.editor.setReadOnly(True)
-        self.editor.setPlainText(self.code)
-
-        font = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
-        font.setPointSize(10)
-        self.editor.setFont(font)
-
-        text_color = "#e3e3e3" if self.theme_mode == "Dark" else "#1f2328"
+        text_color = "#e3e3e3" if is_dark else "#1f2328"
         self.editor.setStyleSheet(f"""
             QTextEdit {{
                 background-color: transparent;
@@ -237,19 +446,11 @@ class CodeBlock(QFrame):
             }}
         """)
 
-        self.editor.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.editor.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.editor.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
-
-        self.highlighter = GeminiHighlighter(self.editor.document(), self.language, self.theme_mode)
-
-        layout.addWidget(self.editor)
-        
-        # Connect document changes to height adjustment
-        self.editor.document().contentsChanged.connect(self.adjust_height)
-        
-        # Use a timer to adjust height after the widget is laid out
-        QTimer.singleShot(50, self.adjust_height)
+    def apply_theme(self, theme_mode: str) -> None:
+        """Re-colors the block for another theme without rebuilding it."""
+        self.theme_mode = theme_mode
+        self._apply_styles()
+        self.highlighter.set_theme(theme_mode)
 
     def adjust_height(self):
         """Adjusts the height of the code block based on its content and width."""
@@ -260,7 +461,12 @@ class CodeBlock(QFrame):
         if width <= 0:
             # Fallback to current width or a reasonable default if not yet rendered
             width = self.editor.width() if self.editor.width() > 0 else 500
-            
+
+        # setTextWidth re-lays out the whole document even when the width is unchanged,
+        # and our own setFixedHeight below triggers another resize at the same width
+        if width == self._fitted_width:
+            return
+        self._fitted_width = width
         doc.setTextWidth(width)
         
         doc_height = doc.size().height()
@@ -272,11 +478,23 @@ class CodeBlock(QFrame):
         self.setFixedHeight(min(max(new_height, 80), 1000))
         self.updateGeometry()
 
+    def _refit(self) -> None:
+        """Forces a height recalculation after the content changed."""
+        self._fitted_width = -1
+        self.adjust_height()
+
     def resizeEvent(self, event):
         """Handle resize events to re-calculate height if text wraps."""
         super().resizeEvent(event)
-        # Use a small delay to ensure the viewport width is updated
-        QTimer.singleShot(10, self.adjust_height)
+        # Use a small delay to ensure the viewport width is updated; a drag-resize
+        # burst shares one pending adjustment
+        if not self._fit_pending:
+            self._fit_pending = True
+            QTimer.singleShot(10, self._deferred_fit)
+
+    def _deferred_fit(self) -> None:
+        self._fit_pending = False
+        self.adjust_height()
 
     def copy_code(self):
         clipboard = QApplication.clipboard()
@@ -288,76 +506,155 @@ class CodeBlock(QFrame):
             QTimer.singleShot(1500, lambda: btn.setText(original))
 
 
+class PlainTextView(QPlainTextEdit):
+    """
+    Read-only, auto-sizing view for message text without markdown, avoiding rich-text layout.
+    """
+
+    def __init__(self, text: str, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setObjectName("BubbleText")
+        self.setReadOnly(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setWordWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self.setPlainText(text)
+        self.document().documentLayout().documentSizeChanged.connect(self._fit_height)
+
+    def _fit_height(self, *_args) -> None:
+        """Sizes the view to its wrapped text so it never scrolls."""
+        # The plain-text layout only reports its size in lines, so sum the block heights
+        content = 2 * self.document().documentMargin()
+        block = self.document().firstBlock()
+        while block.isValid():
+            content += self.blockBoundingRect(block).height()
+            block = block.next()
+        # Frame, padding and viewport margins all sit between the widget and viewport heights
+        chrome = max(self.height() - self.viewport().height(), 0)
+        height = math.ceil(content) + chrome
+        if height != self.height():
+            self.setFixedHeight(height)
+
+    def resizeEvent(self, event):
+        """Refits the height once a width change has re-wrapped the text."""
+        super().resizeEvent(event)
+        self._fit_height()
+
+    def changeEvent(self, event):
+        """Refits the height when a stylesheet changes the font."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._fit_height()
+
+
 class MessageBubble(QFrame):
     """
     A bubble for rendering Markdown text and Code Blocks nicely with justified alignment.
     """
 
-    def __init__(self, text: str, is_user: bool = False, theme_mode: str = "Dark"):
+    def __init__(
+        self,
+        text: str,
+        is_user: bool = False,
+        theme_mode: str = "Dark",
+        segments: tuple[tuple[str, str, str], ...] | None = None,
+    ):
         super().__init__()
         self.raw_text = text
         self.is_user = is_user
         self.theme_mode = theme_mode
-        self.initUI()
+        self.initUI(segments)
 
-    def initUI(self):
-        self.setObjectName("UserBubble" if self.is_user else "AIBubble")
+    def initUI(self, segments: tuple[tuple[str, str, str], ...] | None = None):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
 
-        # Apply bubble style based on theme
-        if self.theme_mode == "Dark":
-            if self.is_user:
-                self.setStyleSheet("background-color: #3C4043; border-radius: 20px; padding: 15px; color: #E3E3E3;")
-            else:
-                self.setStyleSheet("background-color: transparent; border: none; padding: 0px;")
-        else:
-            if self.is_user:
-                self.setStyleSheet("background-color: #F0F4F9; border-radius: 20px; padding: 15px; color: #1F1F1F;")
-            else:
-                self.setStyleSheet("background-color: transparent; border: none; padding: 0px;")
+        # Ensure the bubble can grow and doesn't get squashed
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
 
-        layout = QVBoxLayout(self)
+        self._build_content(segments)
+
+    def _build_content(self, segments: tuple[tuple[str, str, str], ...] | None = None) -> None:
+        """
+        Styles the bubble and renders its text, code blocks and toolbar.
+
+        Args:
+            segments: Output of ``render_markdown_segments`` when it was pre-rendered elsewhere.
+        """
+        # Styled by message_bubble_qss on the chat container, keyed on the object name
+        self.setObjectName("UserBubble" if self.is_user else "AIBubble")
+
+        layout = self.layout()
         layout.setContentsMargins(
             15 if self.is_user else 0,
             10 if self.is_user else 0,
             15 if self.is_user else 0,
             10 if self.is_user else 0,
         )
-        layout.setSpacing(10)
-
-        # Use shared parser
-        tokens = MD_PARSER.parse(self.raw_text)
-
-        lines = self.raw_text.splitlines(keepends=True)
-        last_line_idx = 0
 
-        for token in tokens:
-            if token.type == "fence":
-                start_line, end_line = token.map
-                if start_line > last_line_idx:
-                    text_chunk = "".join(lines[last_line_idx:start_line])
-                    if text_chunk.strip():
-                        self._add_markdown_text(text_chunk, layout)
+        if segments is None:
+            segments = render_markdown_segments(self.raw_text, self.theme_mode)
 
-                self._add_code_block(token.content, token.info, layout)
-                last_line_idx = end_line
-
-        if last_line_idx < len(lines):
-            text_chunk = "".join(lines[last_line_idx:])
-            if text_chunk.strip():
-                self._add_markdown_text(text_chunk, layout)
+        for kind, payload, extra in segments:
+            if kind == "code":
+                self._add_code_block(payload, extra, layout)
+            elif kind == "plain":
+                self._add_plain_text(payload, layout)
+            else:
+                self._add_markdown_text(extra, layout, html_content=payload)
 
         if not self.is_user:
             self._add_toolbar(layout)
-            
-        # Ensure the bubble can grow and doesn't get squashed
-        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
 
-    def _add_markdown_text(self, text: str, layout: QVBoxLayout):
+    def apply_theme(self, theme_mode: str) -> None:
+        """Re-colors the bubble for another theme without re-parsing its markdown."""
+        if theme_mode == self.theme_mode:
+            return
+        self.theme_mode = theme_mode
+        # Frame and text colors follow the container stylesheet; only embedded HTML colors need work
+        for lbl in self.findChildren(QLabel, "BubbleText"):
+            # Only chunks with links or tables embed theme colors in their HTML
+            source = lbl.property("markdown")
+            if source and ("<a " in lbl.text() or "<table" in lbl.text()):
+                lbl.setText(self._markdown_to_html(source))
+        for block in self.findChildren(CodeBlock):
+            block.apply_theme(theme_mode)
+
+    def reset(
+        self,
+        text: str,
+        is_user: bool = False,
+        theme_mode: str = "Dark",
+        segments: tuple[tuple[str, str, str], ...] | None = None,
+    ) -> None:
+        """Re-renders a pooled bubble with new content, keeping the frame and its layout."""
+        self.raw_text = text
+        self.is_user = is_user
+        self.theme_mode = theme_mode
+        self._clear_layout(self.layout())
+        self._build_content(segments)
+
+    @staticmethod
+    def _clear_layout(layout) -> None:
+        """Removes and schedules deletion of every item in a layout, recursively."""
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+            elif item.layout():
+                MessageBubble._clear_layout(item.layout())
+                item.layout().deleteLater()
+
+    def _add_markdown_text(self, text: str, layout: QVBoxLayout, html_content: str | None = None):
         """Renders markdown text using QLabel with justified rich text."""
-        html_content = self._markdown_to_html(text)
+        if html_content is None:
+            html_content = self._markdown_to_html(text)
 
         lbl = QLabel(html_content)
         lbl.setObjectName("BubbleText")
+        lbl.setProperty("markdown", text)
         lbl.setWordWrap(True)
         lbl.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
         lbl.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
@@ -366,11 +663,12 @@ class MessageBubble(QFrame):
         # Crucial for ensuring QLabel doesn't get squashed and provides correct size hint
         lbl.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.MinimumExpanding)
 
-        text_color = "#E3E3E3" if self.theme_mode == "Dark" else "#1F1F1F"
-        lbl.setStyleSheet(f"color: {text_color}; border: none; font-size: 16px; background: transparent;")
-
         layout.addWidget(lbl)
 
+    def _add_plain_text(self, text: str, layout: QVBoxLayout) -> None:
+        """Renders unformatted text in a plain-text view, skipping HTML layout."""
+        layout.addWidget(PlainTextView(text))
+
     def _add_code_block(self, code_content: str, language: str, layout: QVBoxLayout):
         """Creates a CodeBlock widget."""
         code = code_content[:-1] if code_content.endswith("\n") else code_content
@@ -384,29 +682,14 @@ class MessageBubble(QFrame):
         toolbar.setSpacing(10)
         toolbar.addStretch()
 
-        btn_style = """
-            QPushButton {
-                border: none;
-                color: #888;
-                font-size: 11px;
-                padding: 4px 8px;
-                background-color: transparent;
-            }
-            QPushButton:hover { 
-                color: #4da6ff; 
-                background-color: rgba(77, 166, 255, 0.1); 
-                border-radius: 4px; 
-            }
-        """
-
         copy_plain_btn = QPushButton("Copy Plain Text")
         copy_plain_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        copy_plain_btn.setStyleSheet(btn_style)
+        copy_plain_btn.setObjectName("BubbleToolButton")
         copy_plain_btn.clicked.connect(lambda: self.copy_plain_text(copy_plain_btn))
 
         copy_md_btn = QPushButton("Copy Markdown")
         copy_md_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        copy_md_btn.setStyleSheet(btn_style)
+        copy_md_btn.setObjectName("BubbleToolButton")
         copy_md_btn.clicked.connect(lambda: self.copy_markdown(copy_md_btn))
 
         toolbar.addWidget(copy_plain_btn)
@@ -415,28 +698,7 @@ class MessageBubble(QFrame):
 
     def _markdown_to_html(self, text: str) -> str:
         """Converts Markdown to basic HTML for QLabel with justification wrapper."""
-        try:
-            # Use shared parser for rendering
-            html = MD_PARSER.render(text)
-            link_color = "#4da6ff" if self.theme_mode == "Dark" else "#0969da"
-            html = html.replace("<a href=", f'<a style="color: {link_color}; text-decoration: none;" href=')
-
-            if "<table>" in html:
-                border_color = "#555555" if self.theme_mode == "Dark" else "#dddddd"
-                header_bg = "#333333" if self.theme_mode == "Dark" else "#f0f0f0"
-
-                # Add border, spacing, and width
-                html = html.replace(
-                    "<table>",
-                    f'<table border="1" cellspacing="0" cellpadding="5" width="100%" style="border-collapse: collapse; border-color: {border_color};">',
-                )
-
-                # Style headers (background color) - Use regex to avoid corrupting <thead>
-                html = re.sub(r"<th(\s|>)", f'<th bgcolor="{header_bg}"\\1', html)
-
-            return f"<div>{html}</div>"
-        except Exception:
-            return f"<div>{text}</div>"
+        return markdown_to_html(text, self.theme_mode)
 
     def copy_plain_text(self, btn: QPushButton) -> None:
         """
@@ -501,6 +763,7 @@ class AutoResizingTextEdit(QTextEdit):
         ]
         self.update_keywords(keywords)
 
+    @pyqtSlot(list)
     def update_keywords(self, keywords: list[str]):
         """Updates the completer model with a new list of keywords."""
         # Ensure unique and sorted
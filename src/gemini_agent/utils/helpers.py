@@ -24,6 +24,9 @@ class RateLimiter:
         self.condition = threading.Condition(self.lock)
         self.auto_refill = auto_refill
         self._stop_event = threading.Event()
+        # Monotonic deadline until which acquire_async skips the bucket entirely.
+        # Set by callers when server-side telemetry reports ample headroom.
+        self.skip_next_until: float = 0.0
 
         # Calculate refill rate
         self.refill_interval = self.period / self.max_requests if self.max_requests > 0 else self.period
@@ -79,6 +82,9 @@ class RateLimiter:
         Attempts to acquire a token (asynchronous).
         Does not block the event loop.
         """
+        if time.monotonic() < self.skip_next_until:
+            return True
+
         while True:
             with self.lock:
                 if self.tokens > 0:
@@ -107,3 +113,7 @@ class RateLimiter:
             # Recalculate refill interval if limit changed
             self.refill_interval = self.period / self.max_requests if self.max_requests > 0 else self.period
             self.condition.notify_all()
+
+    def skip_for(self, seconds: float) -> None:
+        """Lets acquire_async return immediately for the given number of seconds."""
+        self.skip_next_until = time.monotonic() + seconds
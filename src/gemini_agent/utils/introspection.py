@@ -5,6 +5,9 @@ from typing import Any, Union
 
 from google.genai import types
 
+# "name: description" lines in a Google-style Args section
+_PARAM_DOC_RE = re.compile(r"^(\w+):\s*(.*)")
+
 
 def get_type_map(python_type: Any) -> types.Type:
     """Maps Python types to Gemini API types."""
@@ -45,7 +48,7 @@ def auto_generate_declaration(func: Callable) -> types.FunctionDeclaration:
         line = line.strip()
         if line.startswith("Args:"):
             continue
-        match = re.match(r"^(\w+):\s*(.*)", line)
+        match = _PARAM_DOC_RE.match(line)
         if match:
             current_param = match.group(1)
             param_docs[current_param] = match.group(2)
@@ -46,6 +46,16 @@ class TestAttachmentManager(unittest.TestCase):
         self.assertIn("archived.txt", files[0])
         self.assertTrue(Path(files[0]).exists())
 
+    def test_add_attachments_batch(self):
+        first = Path(self.test_dir) / "a.txt"
+        second = Path(self.test_dir) / "b.txt"
+        first.write_text("a")
+        second.write_text("b")
+
+        files = self.am.add_attachments([str(first), str(second), str(first)])
+        self.assertEqual(files, [str(first), str(second), str(first)])
+        self.assertEqual(self.am.get_attachments(), [str(first), str(second)])
+
     def test_clear_attachments(self):
         test_file = Path(self.test_dir) / "test.txt"
         test_file.write_text("hello")
@@ -54,6 +64,19 @@ class TestAttachmentManager(unittest.TestCase):
         self.am.clear_attachments()
         self.assertEqual(len(self.am.get_attachments()), 0)
 
+    def test_remove_attachment(self):
+        test_file = Path(self.test_dir) / "test.txt"
+        test_file.write_text("hello")
+        self.am.add_attachment(str(test_file))
+        self.am.add_attachment(str(test_file))
+        self.assertEqual(self.am.get_attachments(), [str(test_file)])
+        self.assertTrue(self.am.has_attachments())
+
+        self.assertTrue(self.am.remove_attachment(str(test_file)))
+        self.assertFalse(self.am.remove_attachment(str(test_file)))
+        self.assertEqual(self.am.get_attachments(), [])
+        self.assertFalse(self.am.has_attachments())
+
     def test_cleanup(self):
         am = AttachmentManager()
         temp_dir = am.temp_dir
@@ -3,7 +3,9 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+import tomllib
 from core.conductor_manager import ConductorManager
 
 
@@ -26,6 +28,42 @@ class TestConductorManager(unittest.TestCase):
         self.assertIn("test_cmd", cm.get_available_commands())
         self.assertEqual(cm.get_command_prompt("test_cmd"), "Test Prompt")
 
+    def test_commands_cache_follows_directory_mtime(self):
+        cm = ConductorManager(extension_path=str(self.ext_dir))
+        self.assertIs(cm.get_available_commands(), cm.get_available_commands())
+
+        (self.commands_dir / "other_cmd.toml").write_text("prompt = 'Other'")
+        self.assertIn("other_cmd", cm.get_available_commands())
+        self.assertEqual(cm.get_command_prompt("other_cmd"), "Other")
+
+    def test_invalidate_cache_forces_reload(self):
+        cm = ConductorManager(extension_path=str(self.ext_dir))
+        first = cm.get_available_commands()
+
+        # Editing a file in place leaves the directory mtime untouched
+        (self.commands_dir / "test_cmd.toml").write_text("prompt = 'Edited'")
+        self.assertIs(cm.get_available_commands(), first)
+
+        cm.invalidate_cache()
+        self.assertIsNot(cm.get_available_commands(), first)
+        self.assertEqual(cm.get_command_prompt("test_cmd"), "Edited")
+
+    def test_reload_keeps_old_commands_visible_until_done(self):
+        cm = ConductorManager(extension_path=str(self.ext_dir))
+        (self.commands_dir / "other_cmd.toml").write_text("prompt = 'Other'")
+        seen = []
+        real_load = tomllib.load
+
+        def load(f):
+            # A lookup from another thread while the reload is reading files
+            seen.append(cm.get_command_prompt("test_cmd"))
+            return real_load(f)
+
+        with patch("core.conductor_manager.tomllib.load", side_effect=load):
+            cm.reload_commands()
+        self.assertEqual(seen, ["Test Prompt", "Test Prompt"])
+        self.assertEqual(sorted(cm.get_available_commands()), ["other_cmd", "test_cmd"])
+
     def test_is_setup(self):
         cm = ConductorManager(extension_path=str(self.ext_dir))
         project_path = Path(self.test_dir) / "project"
@@ -1,3 +1,4 @@
+import asyncio
 import html
 import shutil
 import tempfile
@@ -86,6 +87,15 @@ class TestCoreLogic(unittest.TestCase):
         limiter.release()
         self.assertTrue(limiter.acquire(blocking=False))  # Should succeed
 
+    def test_rate_limiter_skip_window(self):
+        limiter = RateLimiter(max_requests=1, period=60, auto_refill=False)
+        limiter.acquire(blocking=False)
+
+        # Bucket is empty, but the skip window lets async callers through untouched
+        limiter.skip_for(5.0)
+        self.assertTrue(asyncio.run(limiter.acquire_async()))
+        self.assertEqual(limiter.remaining(), 0)
+
     def test_review_engine(self):
         engine = ReviewEngine()
 
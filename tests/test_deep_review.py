@@ -0,0 +1,29 @@
+import unittest
+
+from ui.deep_review import MAX_INLINE_CHARS, ReviewWorker
+
+
+class TestReviewWorker(unittest.TestCase):
+    def run_worker(self, content, filepath=""):
+        worker = ReviewWorker(content, filepath, generation=3)
+        results = []
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        self.assertEqual(len(results), 1)
+        return results[0]
+
+    def test_reports_diff_and_risks(self):
+        generation, diff_html, _issues, risks = self.run_worker("import os\nos.system('ls')\n")
+        self.assertEqual(generation, 3)
+        self.assertIn("os.system", diff_html)
+        self.assertTrue(any("Dangerous System Call" in risk for risk in risks))
+
+    def test_large_content_skips_diff(self):
+        content = "x = 1\n" * (MAX_INLINE_CHARS // 6 + 1)
+        _generation, diff_html, _issues, _risks = self.run_worker(content)
+        self.assertIn("Diff skipped", diff_html)
+        self.assertNotIn("+++", diff_html)
+
+
+if __name__ == "__main__":
+    unittest.main()
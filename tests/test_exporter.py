@@ -4,7 +4,9 @@ import unittest
 import zipfile
 from pathlib import Path
 
+from core import exporter
 from core.exporter import Exporter
+from core.models import Session
 
 
 class TestExporter(unittest.TestCase):
@@ -62,6 +64,39 @@ class TestExporter(unittest.TestCase):
         restored = Exporter.restore_backup(backup_path)
         self.assertEqual(restored["sess1"]["title"], "Test Session")
 
+    def test_backup_round_trip_with_models(self):
+        sessions = {"sess1": Session(**self.session_data), "sess2": Session(title="Second")}
+        backup_path = self.test_dir / "backup.zip"
+        self.assertTrue(Exporter.create_backup(sessions, backup_path))
+
+        restored = Exporter.restore_backup(backup_path)
+        self.assertEqual(list(restored), ["sess1", "sess2"])
+        self.assertEqual(restored["sess1"].messages[1].text, "Hi there!")
+        self.assertEqual(restored["sess2"].title, "Second")
+
+    def test_fast_backup_round_trip(self):
+        sessions = {"sess1": Session(**self.session_data)}
+        backup_path = self.test_dir / "backup.zip"
+        written = Exporter.create_backup(sessions, backup_path, fast=True)
+        self.assertEqual(list(self.test_dir.iterdir()), [written])
+
+        if exporter.zstandard is None:
+            self.assertEqual(written, backup_path)
+            with zipfile.ZipFile(backup_path, "r") as zipf:
+                self.assertEqual(zipf.getinfo("history.json").compress_type, zipfile.ZIP_STORED)
+        else:
+            self.assertEqual(written.name, "backup.zip" + exporter.ZSTD_SUFFIX)
+            self.assertEqual(written.read_bytes()[:4], exporter.ZSTD_MAGIC)
+
+        restored = Exporter.restore_backup(written)
+        self.assertEqual(restored["sess1"].messages[0].text, "Hello")
+
+    @unittest.skipIf(exporter.zstandard is None, "zstandard not installed")
+    def test_truncated_zstd_backup_restores_nothing(self):
+        backup_path = self.test_dir / "broken.zip.zst"
+        backup_path.write_bytes(exporter.ZSTD_MAGIC + b"\x00" * 8)
+        self.assertEqual(Exporter.restore_backup(backup_path), {})
+
 
 if __name__ == "__main__":
     unittest.main()
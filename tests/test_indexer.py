@@ -1,6 +1,7 @@
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 
 from core.indexer import Indexer
@@ -73,6 +74,37 @@ def my_function(y):
         self.assertIn("included", names)
         self.assertNotIn("ignored", names)
 
+    def test_on_batch_streams_parsed_symbols(self):
+        self.create_test_file("a.py", "def alpha(): pass")
+        self.create_test_file("b.py", "class Beta:\n    def gamma(self): pass")
+        batches = []
+        self.indexer.index_project(on_batch=batches.append)
+
+        streamed = [s for batch in batches for s in batch]
+        self.assertCountEqual([s.name for s in streamed], ["alpha", "Beta", "gamma"])
+        self.assertCountEqual(
+            [(s.name, s.file_path) for s in streamed],
+            [(s.name, s.file_path) for s in self.indexer.get_all_symbols()],
+        )
+
+        # Unchanged files come from the cache and are not streamed again
+        batches.clear()
+        self.indexer.index_project(on_batch=batches.append)
+        self.assertEqual(batches, [])
+
+    def test_cancelled_scan_leaves_index_untouched(self):
+        self.create_test_file("first.py", "def first(): pass")
+        self.indexer.index_project()
+
+        self.create_test_file("second.py", "def second(): pass")
+        cancel_event = threading.Event()
+        cancel_event.set()
+        self.indexer.index_project(cancel_event=cancel_event)
+        self.assertEqual([s.name for s in self.indexer.get_all_symbols()], ["first"])
+
+        self.indexer.index_project()
+        self.assertIn("second", [s.name for s in self.indexer.get_all_symbols()])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from ui.widgets import render_markdown_segments
+
+
+class TestMarkdownSegments(unittest.TestCase):
+    def test_unformatted_text_is_a_single_plain_segment(self):
+        segments = render_markdown_segments("Hello there\nsecond line\n")
+        self.assertEqual(segments, (("plain", "Hello there\nsecond line", ""),))
+
+    def test_plain_segment_shows_parsed_text(self):
+        segments = render_markdown_segments("  AT&amp;T \\*not bold\\*\n\n\n\nnext &lt;p&gt;")
+        self.assertEqual(segments, (("plain", "AT&T *not bold*\n\nnext <p>", ""),))
+
+    def test_formatted_text_is_rendered_to_html(self):
+        segments = render_markdown_segments("Hello **there**")
+        self.assertEqual(len(segments), 1)
+        kind, html, source = segments[0]
+        self.assertEqual(kind, "text")
+        self.assertIn("<strong>there</strong>", html)
+        self.assertEqual(source, "Hello **there**")
+
+    def test_code_fences_split_segments(self):
+        segments = render_markdown_segments("Intro\n```python\nx = 1\n```\n")
+        self.assertEqual([kind for kind, _, _ in segments], ["text", "code"])
+        self.assertEqual(segments[1][1:], ("x = 1\n", "python"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,26 @@ class TestReviewEngine(unittest.TestCase):
         self.assertIn("<pre", html)
         self.assertIn("line2_modified", html)
 
+    def test_generate_diff_html_truncated(self):
+        old = "\n".join(f"old {i}" for i in range(1000))
+        new = "\n".join(f"new {i}" for i in range(1000))
+        html = self.engine.generate_diff_html_truncated(old, new, max_lines=10)
+        self.assertEqual(html.count("<div"), 11)
+        self.assertIn("1,993 more changes truncated", html)
+        self.assertIn("new 999", html)
+
+    def test_truncation_count_skips_context_lines(self):
+        old = "\n".join(f"line {i}" for i in range(100))
+        new = "\n".join(f"line {i}" if i % 10 else f"changed {i}" for i in range(100))
+        html = self.engine.generate_diff_html_truncated(old, new, max_lines=4)
+        # Ten edits (a - and a + line each) are hidden along with dozens of context lines
+        self.assertIn("... 20 more changes truncated ...", html)
+
+    def test_long_lines_are_cropped_before_diffing(self):
+        html = self.engine.generate_diff_html("", "x" * 10_000)
+        self.assertIn("… (truncated)", html)
+        self.assertNotIn("x" * (ReviewEngine.MAX_DIFF_LINE_CHARS + 1), html)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,12 @@
 import json
 import shutil
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from core.models import Session
 from core.session_manager import SessionManager
 
 
@@ -37,6 +40,26 @@ class TestSessionManager(unittest.TestCase):
         self.assertNotIn(session_id, self.sm.sessions)
         self.assertIsNone(self.sm.current_session_id)
 
+    def test_current_session_follows_current_id(self):
+        first = self.sm.create_session("First", sync=True)
+        second = self.sm.create_session("Second", sync=True)
+        self.assertIs(self.sm.current_session, self.sm.sessions[second])
+
+        self.sm.current_session_id = first
+        self.assertIs(self.sm.current_session, self.sm.sessions[first])
+
+        self.sm.delete_session(first, sync=True)
+        self.assertIsNone(self.sm.current_session)
+
+    def test_replace_sessions_drops_cached_current_session(self):
+        self.sm.create_session("Old", sync=True)
+        restored = {"restored": Session(title="Restored")}
+
+        self.sm.replace_sessions(restored)
+        self.assertIs(self.sm.get_all_sessions(), restored)
+        self.assertIsNone(self.sm.current_session_id)
+        self.assertIsNone(self.sm.current_session)
+
     def test_add_message(self):
         session_id = self.sm.create_session(sync=True)
         self.sm.add_message(session_id, "user", "Hello", sync=True)
@@ -46,6 +69,34 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(session.messages[0].role, "user")
         self.assertEqual(session.messages[0].text, "Hello")
 
+    def test_get_messages_window(self):
+        session_id = self.sm.create_session(sync=True)
+        for i in range(10):
+            self.sm.add_message(session_id, "user", f"msg {i}", sync=True)
+
+        tail = self.sm.get_messages(session_id, tail=3)
+        self.assertEqual([m.text for m in tail], ["msg 7", "msg 8", "msg 9"])
+
+        page = self.sm.get_messages(session_id, tail=3, before=7)
+        self.assertEqual([m.text for m in page], ["msg 4", "msg 5", "msg 6"])
+
+        self.assertEqual(len(self.sm.get_messages(session_id, tail=50, before=2)), 2)
+        self.assertEqual(self.sm.get_messages("missing", tail=5), [])
+
+    def test_history_dicts_cache(self):
+        session_id = self.sm.create_session(sync=True)
+        self.sm.add_message(session_id, "user", "Hello", sync=True)
+        session = self.sm.get_session(session_id)
+
+        first = session.history_dicts()
+        self.sm.add_message(session_id, "model", "Hi", sync=True)
+        second = session.history_dicts()
+        self.assertIs(first, second)
+        self.assertEqual([d["text"] for d in second], ["Hello", "Hi"])
+
+        self.sm.clear_current_session(sync=True)
+        self.assertEqual(session.history_dicts(), [])
+
     def test_update_session_title(self):
         session_id = self.sm.create_session("Old Title", sync=True)
         self.sm.update_session_title(session_id, "New Title", sync=True)
@@ -63,6 +114,40 @@ class TestSessionManager(unittest.TestCase):
         self.assertEqual(session.plan, "")
         self.assertEqual(session.specs, "")
 
+    def test_save_encodes_outside_session_lock(self):
+        self.sm.create_session("Chat", sync=True)
+        lock_free = []
+        real_dumps = json.dumps
+
+        def probe():
+            acquired = self.sm._lock.acquire(blocking=False)
+            if acquired:
+                self.sm._lock.release()
+            lock_free.append(acquired)
+
+        def dumps(*args, **kwargs):
+            t = threading.Thread(target=probe)
+            t.start()
+            t.join()
+            return real_dumps(*args, **kwargs)
+
+        with patch("core.session_manager.json.dumps", side_effect=dumps):
+            self.sm.save_history(sync=True)
+
+        self.assertEqual(lock_free, [True])
+        self.assertIn("Chat", self.history_file.read_text(encoding="utf-8"))
+
+    def test_flush_writes_throttled_changes(self):
+        session_id = self.sm.create_session("Chat", sync=True)
+        # Within the throttle interval, so this save is deferred to a timer
+        self.sm.update_session_usage(session_id, 10, 5)
+        self.assertIsNotNone(self.sm._save_timer)
+
+        self.sm.flush()
+        self.assertIsNone(self.sm._save_timer)
+        saved = json.loads(self.history_file.read_text(encoding="utf-8"))
+        self.assertEqual(saved[session_id]["usage"]["total_tokens"], 15)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -54,6 +54,10 @@ class TestUsageTracking(unittest.TestCase):
         # For gemini-1.5-pro, it should be 3.50 + 10.50 = 14.00
         self.assertAlmostEqual(total_cost, 14.00)
 
+    def test_estimate_cost(self):
+        self.assertAlmostEqual(ModelRegistry.estimate_cost("gemini-1.5-pro", 1_000_000, 1_000_000), 14.00)
+        self.assertEqual(ModelRegistry.estimate_cost("unknown-model", 1_000, 1_000), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
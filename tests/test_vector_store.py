@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.vector_store import VectorStore
+
+
+class TestVectorStore(unittest.TestCase):
+    def setUp(self):
+        client_patcher = patch("core.vector_store.chromadb.PersistentClient")
+        ef_patcher = patch("core.vector_store.embedding_functions.DefaultEmbeddingFunction")
+        self.mock_client = client_patcher.start()
+        ef_patcher.start()
+        self.addCleanup(client_patcher.stop)
+        self.addCleanup(ef_patcher.stop)
+
+        self.collection = MagicMock()
+        self.mock_client.return_value.get_or_create_collection.return_value = self.collection
+        self.store = VectorStore(persist_directory="unused")
+
+    def test_add_documents_is_batched(self):
+        self.store.add_documents(["a"], [{"role": "user"}], ["id_a"])
+        self.store.add_documents(["b"], [{"role": "model"}], ["id_b"])
+        self.store.flush()
+
+        self.collection.add.assert_called_once_with(
+            documents=["a", "b"],
+            metadatas=[{"role": "user"}, {"role": "model"}],
+            ids=["id_a", "id_b"],
+        )
+
+    def test_flush_survives_write_errors(self):
+        self.collection.add.side_effect = RuntimeError("sqlite locked")
+        self.store.add_documents(["a"], [{}], ["id_a"])
+        self.store.flush()
+        self.collection.add.assert_called_once()
+
+    def test_rejected_batch_is_retried_per_write(self):
+        def add(documents, metadatas, ids):
+            if "bad" in documents:
+                raise ValueError("invalid document")
+
+        self.collection.add.side_effect = add
+        self.store.add_documents(["a"], [{}], ["id_a"])
+        self.store.add_documents(["bad"], [{}], ["id_bad"])
+        self.store.add_documents(["c"], [{}], ["id_c"])
+        self.store.flush()
+
+        added = [c.kwargs["ids"] for c in self.collection.add.call_args_list[1:]]
+        self.assertEqual(added, [["id_a"], ["id_bad"], ["id_c"]])
+
+    def test_query_results_are_cached_until_next_write(self):
+        self.collection.query.return_value = {"documents": [["hit"]]}
+
+        first = self.store.query("Find  Widgets ")
+        second = self.store.query("find widgets")
+        self.assertIs(first, second)
+        self.collection.query.assert_called_once()
+
+        self.store.add_documents(["c"], [{}], ["id_c"])
+        self.store.flush()
+        self.store.query("find widgets")
+        self.assertEqual(self.collection.query.call_count, 2)
+
+    def test_query_racing_a_write_is_not_cached(self):
+        def query(query_texts, n_results):
+            # A batch commits while this query is in flight
+            self.store.clear_query_cache()
+            return {"documents": [["stale"]]}
+
+        self.collection.query.side_effect = query
+        self.store.query("find widgets")
+        self.store.query("find widgets")
+        self.assertEqual(self.collection.query.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import unittest
@@ -9,6 +10,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../s
 from PyQt6.QtWidgets import QApplication
 
 from gemini_agent.config.app_config import AppConfig
+from gemini_agent.core.models import Message, Session
 from gemini_agent.main import ChatController
 
 
@@ -22,20 +24,19 @@ class TestWorkerIntegration(unittest.TestCase):
             cls.app = QApplication.instance()
 
     @patch("gemini_agent.main.GeminiWorker")
-    @patch("gemini_agent.main.GeminiWorkerThread")
-    def test_send_message_starts_thread(self, MockWorkerThread, MockWorker):
+    def test_send_message_starts_worker_on_pool(self, MockWorker):
         # Setup mocks
         mock_worker_instance = MockWorker.return_value
-        mock_thread_instance = MockWorkerThread.return_value
 
         # Setup dependencies for Controller
         config = MagicMock(spec=AppConfig)
         config.api_key = "dummy_key"
         config.get.return_value = "dummy_value"
+        config.history_window = 40
 
         session_mgr = MagicMock()
         session_mgr.current_session_id = "sess_1"
-        session_mgr.get_session.return_value = {"messages": [], "config": {}}
+        session_mgr.get_session.return_value = Session()
 
         attachment_mgr = MagicMock()
         attachment_mgr.get_attachments.return_value = []
@@ -44,11 +45,13 @@ class TestWorkerIntegration(unittest.TestCase):
         indexer = MagicMock()
         plugin_mgr = MagicMock()
         checkpoint_mgr = MagicMock()
+        vector_store = MagicMock()
 
         # Instantiate Controller
         controller = ChatController(
-            config, session_mgr, attachment_mgr, conductor_mgr, indexer, plugin_mgr, checkpoint_mgr
+            config, session_mgr, attachment_mgr, conductor_mgr, indexer, plugin_mgr, checkpoint_mgr, vector_store
         )
+        controller._pool = MagicMock()
 
         # Act
         controller.send_message("Hello")
@@ -57,15 +60,67 @@ class TestWorkerIntegration(unittest.TestCase):
         # Check if Worker was instantiated
         MockWorker.assert_called()
 
-        # Check if Thread was instantiated with the worker
-        MockWorkerThread.assert_called_with(mock_worker_instance)
-
-        # Check if thread.start() was called
-        mock_thread_instance.start.assert_called_once()
+        # Check the worker was handed to the persistent pool rather than a new thread
+        controller._pool.start.assert_called_once_with(mock_worker_instance.run)
 
         # Check if error handling works (signals connected)
         mock_worker_instance.finished.connect.assert_called()
 
+        # Stopping cancels cooperatively and never blocks by default
+        controller.stop_worker()
+        mock_worker_instance.stop.assert_called_once()
+        controller._pool.waitForDone.assert_not_called()
+
+    @patch("gemini_agent.main.GeminiWorker")
+    def test_history_window_keeps_turns_alternating(self, MockWorker):
+        config = MagicMock(spec=AppConfig)
+        config.api_key = "dummy_key"
+        config.get.return_value = "dummy_value"
+        config.history_window = 4
+
+        # Eight alternating turns plus the prompt that send_message records
+        roles = ["user", "model"] * 4 + ["user"]
+        session = Session(messages=[Message(role=role, text=str(i)) for i, role in enumerate(roles)])
+        session_mgr = MagicMock()
+        session_mgr.current_session_id = "sess_1"
+        session_mgr.get_session.return_value = session
+        attachment_mgr = MagicMock()
+        attachment_mgr.get_attachments.return_value = []
+
+        controller = ChatController(
+            config, session_mgr, attachment_mgr, MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
+        )
+        controller._pool = MagicMock()
+        controller.send_message("8")
+
+        history = MockWorker.call_args.args[0].history_context
+        self.assertEqual([m["text"] for m in history], ["0", "5", "6", "7"])
+        self.assertTrue(all(a["role"] != b["role"] for a, b in zip(history, history[1:], strict=False)))
+
+    def test_drain_writes_batch_held_by_consumer(self):
+        session_mgr = MagicMock()
+        session_mgr.get_session.return_value = Session(messages=[Message(role="user", text="hi")])
+
+        async def close_mid_batch(controller):
+            controller.queue_for_indexing("sess_1", "one")
+            controller.queue_for_indexing("sess_1", "two", role="user")
+            # Let the consumer pull both messages while it waits out the batching window
+            await asyncio.sleep(0.05)
+            self.assertEqual(controller._index_queue.qsize(), 0)
+            controller.drain_index_queue()
+
+        # Attached store, and a store that hasn't finished opening when the window closes
+        for vector_store in (MagicMock(), None):
+            with patch("gemini_agent.core.vector_store.VectorStore") as MockStore:
+                mocks = [MagicMock() for _ in range(5)]
+                controller = ChatController(MagicMock(), session_mgr, *mocks, vector_store)
+                asyncio.run(close_mid_batch(controller))
+
+                store = vector_store or MockStore.return_value
+                store.add_documents.assert_called_once()
+                self.assertEqual(store.add_documents.call_args.kwargs["ids"], ["sess_1_1", "sess_1_1_user"])
+                store.flush.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
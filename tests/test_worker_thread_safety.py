@@ -1,5 +1,7 @@
+import asyncio
 import os
 import sys
+import threading
 import unittest
 from unittest.mock import MagicMock
 
@@ -54,6 +56,32 @@ class TestWorkerThreadSafety(unittest.TestCase):
         # Should call set() directly as fallback
         worker._confirmation_event.set.assert_called_once()
 
+    def test_stop_releases_tool_thread_waiting_for_confirmation(self):
+        config = WorkerConfig(api_key="key", prompt="hi", model="gemini-2.5-flash", file_paths=[], history_context=[])
+        worker = GeminiWorker(config)
+        waiting = threading.Event()
+        answered = threading.Event()
+        answers = []
+
+        def tool_call():
+            waiting.set()
+            answers.append(worker._confirm_from_thread("write_file", {})[0])
+            answered.set()
+
+        async def run_async():
+            await asyncio.to_thread(tool_call)
+
+        worker.run_async = run_async
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        self.assertTrue(waiting.wait(5))
+        worker.stop()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(answered.wait(5))
+        self.assertEqual(answers, [False])
+
 
 if __name__ == "__main__":
     unittest.main()